@@ -18,6 +18,11 @@ from sentinelops.db.base import Base  # noqa: E402
 from sentinelops.models import event  # noqa: F401, E402
 from sentinelops.models import anomaly  # noqa: F401, E402
 from sentinelops.models import daily_summary_delivery  # noqa: F401, E402
+from sentinelops.models import rule_run  # noqa: F401, E402
+from sentinelops.models import change_counter  # noqa: F401, E402
+from sentinelops.models import event_rollup  # noqa: F401, E402
+from sentinelops.models import ai_insight_cache  # noqa: F401, E402
+from sentinelops.models import incident  # noqa: F401, E402
 # daily_summary_delivery 모델이 있다면 이것도 추가
 # from sentinelops.models import daily_summary_delivery  # noqa: F401, E402
 
@@ -0,0 +1,30 @@
+"""add daily_summary_deliveries.ai_prompt_chars / ai_prompt_tokens
+
+Revision ID: 1581f8222145
+Revises: 5a33007f9abe
+Create Date: 2026-10-19 19:12:41.503317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1581f8222145'
+down_revision: Union[str, Sequence[str], None] = '5a33007f9abe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('daily_summary_deliveries', sa.Column('ai_prompt_chars', sa.Integer(), nullable=True))
+    op.add_column('daily_summary_deliveries', sa.Column('ai_prompt_tokens', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('daily_summary_deliveries', 'ai_prompt_tokens')
+    op.drop_column('daily_summary_deliveries', 'ai_prompt_chars')
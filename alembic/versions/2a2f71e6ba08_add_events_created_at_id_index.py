@@ -0,0 +1,36 @@
+"""add events (created_at, id) index
+
+Revision ID: 2a2f71e6ba08
+Revises: 5013c51fe076
+Create Date: 2026-10-19 15:31:52.004127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a2f71e6ba08'
+down_revision: Union[str, Sequence[str], None] = '5013c51fe076'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ✅ events는 계속 커지는 테이블 → CONCURRENTLY로 쓰기 lock 없이 생성
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_events_created_at_id',
+            'events',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_events_created_at_id', table_name='events', postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""add change_counters table
+
+Revision ID: 5013c51fe076
+Revises: 739a0749657a
+Create Date: 2026-10-19 14:02:10.377518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5013c51fe076'
+down_revision: Union[str, Sequence[str], None] = '739a0749657a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_counters',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO change_counters (name, version) VALUES ('anomalies', 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('change_counters')
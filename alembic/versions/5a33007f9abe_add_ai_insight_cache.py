@@ -0,0 +1,42 @@
+"""add ai_insight_cache table
+
+Revision ID: 5a33007f9abe
+Revises: f5a2ddd5e373
+Create Date: 2026-10-19 18:12:45.903117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a33007f9abe'
+down_revision: Union[str, Sequence[str], None] = 'f5a2ddd5e373'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ai_insight_cache',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('prompt_version', sa.String(length=50), nullable=False),
+    sa.Column('summary_text', sa.Text(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index(op.f('ix_ai_insight_cache_expires_at'), 'ai_insight_cache', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_ai_insight_cache_last_used_at'), 'ai_insight_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ai_insight_cache_last_used_at'), table_name='ai_insight_cache')
+    op.drop_index(op.f('ix_ai_insight_cache_expires_at'), table_name='ai_insight_cache')
+    op.drop_table('ai_insight_cache')
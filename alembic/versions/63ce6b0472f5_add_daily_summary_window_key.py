@@ -0,0 +1,46 @@
+"""add daily_summary_deliveries.window_key
+
+Revision ID: 63ce6b0472f5
+Revises: d93f5c9bb046
+Create Date: 2026-10-19 23:12:41.308517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '63ce6b0472f5'
+down_revision: Union[str, Sequence[str], None] = 'd93f5c9bb046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 row는 모두 정기 실행으로 본다
+    op.add_column(
+        'daily_summary_deliveries',
+        sa.Column('window_key', sa.String(length=40), server_default='scheduled', nullable=False),
+    )
+    op.drop_constraint('uq_daily_summary_kind_date_channel', 'daily_summary_deliveries', type_='unique')
+    op.create_unique_constraint(
+        'uq_daily_summary_kind_date_channel_window',
+        'daily_summary_deliveries',
+        ['kind', 'summary_date', 'channel', 'window_key'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_daily_summary_kind_date_channel_window', 'daily_summary_deliveries', type_='unique')
+    # custom window row를 지워야 (kind, summary_date, channel) unique를 다시 만들 수 있다
+    op.execute("DELETE FROM daily_summary_deliveries WHERE window_key <> 'scheduled'")
+    op.create_unique_constraint(
+        'uq_daily_summary_kind_date_channel',
+        'daily_summary_deliveries',
+        ['kind', 'summary_date', 'channel'],
+    )
+    op.drop_column('daily_summary_deliveries', 'window_key')
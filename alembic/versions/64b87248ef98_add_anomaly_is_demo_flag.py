@@ -0,0 +1,66 @@
+"""add anomaly is_demo flag
+
+Revision ID: 64b87248ef98
+Revises: ef7693a8690a
+Create Date: 2026-10-19 11:48:05.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '64b87248ef98'
+down_revision: Union[str, Sequence[str], None] = 'ef7693a8690a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# 기존 demo 판정 규칙과 동일: title ILIKE '[demo]%' OR evidence['demo'].as_boolean()
+# (= CAST(evidence ->> 'demo' AS BOOLEAN), 즉 true / "true" / "yes" / "on" / 1 등도 demo)
+# cast를 그대로 쓰면 boolean이 아닌 문자열 하나에 migration 전체가 실패하므로,
+# PG boolean 입력 중 true가 되는 형태(공백/대소문자 무시, 앞부분 축약 허용)만 regex로 고른다.
+_BACKFILL_BATCH_SQL = sa.text(
+    r"""
+    UPDATE anomalies
+    SET is_demo = true
+    WHERE id > :lo AND id <= :hi
+      AND (
+        title ILIKE '[demo]%'
+        OR (evidence ->> 'demo') ~* '^\s*(t|tr|tru|true|y|ye|yes|on|1)\s*$'
+      )
+    """
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ✅ constant default + NOT NULL: PG11+에서는 table rewrite 없이 즉시 추가됨
+    op.add_column('anomalies', sa.Column('is_demo', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # ✅ backfill은 id 구간 batch로 (batch마다 commit → 긴 row lock / 거대한 트랜잭션 방지)
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        max_id = bind.execute(sa.text("SELECT coalesce(max(id), 0) FROM anomalies")).scalar_one()
+        lo = 0
+        while lo < max_id:
+            hi = lo + BACKFILL_BATCH_SIZE
+            bind.execute(_BACKFILL_BATCH_SQL, {"lo": lo, "hi": hi})
+            lo = hi
+
+    op.create_index(
+        'ix_anomalies_demo_status_detected_at',
+        'anomalies',
+        ['status', sa.text('detected_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_demo'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_anomalies_demo_status_detected_at', table_name='anomalies')
+    op.drop_column('anomalies', 'is_demo')
@@ -0,0 +1,48 @@
+"""add anomaly keyset pagination indexes
+
+Revision ID: 739a0749657a
+Revises: 64b87248ef98
+Create Date: 2026-10-19 13:20:44.613790
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '739a0749657a'
+down_revision: Union[str, Sequence[str], None] = '64b87248ef98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ✅ id tie-breaker까지 포함해야 (rank, detected_at, id) keyset 조건이 index range scan이 됨
+    op.drop_index('ix_anomalies_status_severity_rank_detected_at', table_name='anomalies')
+    op.create_index(
+        'ix_anomalies_status_severity_rank_detected_at',
+        'anomalies',
+        ['status', sa.text('severity_rank DESC'), sa.text('detected_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_anomalies_detected_at_id',
+        'anomalies',
+        [sa.text('detected_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_anomalies_detected_at_id', table_name='anomalies')
+    op.drop_index('ix_anomalies_status_severity_rank_detected_at', table_name='anomalies')
+    op.create_index(
+        'ix_anomalies_status_severity_rank_detected_at',
+        'anomalies',
+        ['status', sa.text('severity_rank DESC'), sa.text('detected_at DESC')],
+        unique=False,
+    )
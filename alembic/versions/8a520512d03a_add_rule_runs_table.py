@@ -0,0 +1,47 @@
+"""add rule_runs table
+
+Revision ID: 8a520512d03a
+Revises: 174091ecfa5e
+Create Date: 2026-10-19 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a520512d03a'
+down_revision: Union[str, Sequence[str], None] = '174091ecfa5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rule_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('rule_code', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('wall_ms', sa.Float(), nullable=False),
+    sa.Column('db_ms', sa.Float(), nullable=False),
+    sa.Column('statement_count', sa.Integer(), nullable=False),
+    sa.Column('rows_scanned', sa.Integer(), nullable=False),
+    sa.Column('anomalies_created', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_rule_runs_rule_code_started_at', 'rule_runs', ['rule_code', 'started_at'], unique=False)
+    op.create_index(op.f('ix_rule_runs_started_at'), 'rule_runs', ['started_at'], unique=False)
+    op.create_index(op.f('ix_rule_runs_status'), 'rule_runs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_rule_runs_status'), table_name='rule_runs')
+    op.drop_index(op.f('ix_rule_runs_started_at'), table_name='rule_runs')
+    op.drop_index('ix_rule_runs_rule_code_started_at', table_name='rule_runs')
+    op.drop_table('rule_runs')
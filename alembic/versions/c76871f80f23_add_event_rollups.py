@@ -0,0 +1,41 @@
+"""add event_rollups and rollup_watermarks
+
+Revision ID: c76871f80f23
+Revises: 2a2f71e6ba08
+Create Date: 2026-10-19 16:48:27.511203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c76871f80f23'
+down_revision: Union[str, Sequence[str], None] = '2a2f71e6ba08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_rollups',
+    sa.Column('bucket_seconds', sa.Integer(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('event_count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_seconds', 'bucket_start', 'event_type', 'status')
+    )
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('refreshed_until', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rollup_watermarks')
+    op.drop_table('event_rollups')
@@ -0,0 +1,50 @@
+"""add daily_summary_deliveries.channel / lease_expires_at
+
+Revision ID: cb64c6bdce3f
+Revises: 1581f8222145
+Create Date: 2026-10-19 19:48:20.771946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cb64c6bdce3f'
+down_revision: Union[str, Sequence[str], None] = '1581f8222145'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'daily_summary_deliveries',
+        sa.Column('channel', sa.String(length=50), server_default='default', nullable=False),
+    )
+    op.add_column(
+        'daily_summary_deliveries',
+        sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.drop_constraint('uq_daily_summary_kind_date', 'daily_summary_deliveries', type_='unique')
+    op.create_unique_constraint(
+        'uq_daily_summary_kind_date_channel',
+        'daily_summary_deliveries',
+        ['kind', 'summary_date', 'channel'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_daily_summary_kind_date_channel', 'daily_summary_deliveries', type_='unique')
+    # channel이 여러 개였던 날은 default만 남겨야 unique를 다시 만들 수 있다
+    op.execute("DELETE FROM daily_summary_deliveries WHERE channel <> 'default'")
+    op.create_unique_constraint(
+        'uq_daily_summary_kind_date',
+        'daily_summary_deliveries',
+        ['kind', 'summary_date'],
+    )
+    op.drop_column('daily_summary_deliveries', 'lease_expires_at')
+    op.drop_column('daily_summary_deliveries', 'channel')
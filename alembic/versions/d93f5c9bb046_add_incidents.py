@@ -0,0 +1,59 @@
+"""add incidents + anomalies.incident_id
+
+Revision ID: d93f5c9bb046
+Revises: cb64c6bdce3f
+Create Date: 2026-10-19 20:31:07.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93f5c9bb046'
+down_revision: Union[str, Sequence[str], None] = 'cb64c6bdce3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'incidents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('family', sa.String(length=50), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('severity', sa.String(length=10), nullable=False),
+        sa.Column('severity_rank', sa.SmallInteger(), nullable=False),
+        sa.Column('rule_codes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('anomaly_count', sa.Integer(), nullable=False),
+        sa.Column('window_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('window_end', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('first_detected_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_detected_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_incidents_family_window_end', 'incidents', ['family', 'window_end'], unique=False)
+    op.create_index('ix_incidents_last_detected_at_id', 'incidents', ['last_detected_at', 'id'], unique=False)
+
+    op.add_column('anomalies', sa.Column('incident_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_anomalies_incident_id'), 'anomalies', ['incident_id'], unique=False)
+    op.create_foreign_key(
+        'anomalies_incident_id_fkey', 'anomalies', 'incidents', ['incident_id'], ['id'], ondelete='SET NULL'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('anomalies_incident_id_fkey', 'anomalies', type_='foreignkey')
+    op.drop_index(op.f('ix_anomalies_incident_id'), table_name='anomalies')
+    op.drop_column('anomalies', 'incident_id')
+
+    op.drop_index('ix_incidents_last_detected_at_id', table_name='incidents')
+    op.drop_index('ix_incidents_family_window_end', table_name='incidents')
+    op.drop_table('incidents')
@@ -0,0 +1,44 @@
+"""add anomaly severity_rank generated column
+
+Revision ID: ef7693a8690a
+Revises: 8a520512d03a
+Create Date: 2026-10-19 11:03:27.540112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef7693a8690a'
+down_revision: Union[str, Sequence[str], None] = '8a520512d03a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ✅ STORED generated column: 기존 row도 ADD COLUMN 시점에 계산됨 (별도 backfill 불필요)
+    op.add_column('anomalies', sa.Column(
+        'severity_rank',
+        sa.SmallInteger(),
+        sa.Computed(
+            "CASE severity WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 0 END",
+            persisted=True,
+        ),
+        nullable=False,
+    ))
+    op.create_index(
+        'ix_anomalies_status_severity_rank_detected_at',
+        'anomalies',
+        ['status', sa.text('severity_rank DESC'), sa.text('detected_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_anomalies_status_severity_rank_detected_at', table_name='anomalies')
+    op.drop_column('anomalies', 'severity_rank')
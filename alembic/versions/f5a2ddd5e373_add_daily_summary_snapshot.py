@@ -0,0 +1,32 @@
+"""add daily_summary_deliveries.snapshot
+
+Revision ID: f5a2ddd5e373
+Revises: c76871f80f23
+Create Date: 2026-10-19 17:36:04.218930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a2ddd5e373'
+down_revision: Union[str, Sequence[str], None] = 'c76871f80f23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'daily_summary_deliveries',
+        sa.Column('snapshot', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('daily_summary_deliveries', 'snapshot')
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Callable, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from sentinelops.core import fast_json
 from sentinelops.core.anomaly_status import ANOMALY_STATUSES
+from sentinelops.core.response_cache import ResponseCache, etag_matches, make_etag
 from sentinelops.db.session import get_db
 from sentinelops.models.anomaly import Anomaly
-from sentinelops.services.anomaly_lifecycle import apply_status_change
-from sentinelops.services.reporting.anomalies_query import list_anomalies
+from sentinelops.services.anomaly_changes import current_anomaly_version
+from sentinelops.services.anomaly_stream import anomaly_broadcaster
+from sentinelops.services.anomaly_lifecycle import (
+    apply_status_change,
+    bulk_apply_status_change,
+)
+from sentinelops.services.reporting.anomalies_query import (
+    encode_anomaly_cursor,
+    list_anomaly_rows,
+)
 
 from sentinelops.api.v1.schemas.anomaly import (
+    AnomalyBulkOutcomeOut,
+    AnomalyBulkUpdateIn,
+    AnomalyBulkUpdateOut,
     AnomalyListOut,
     AnomalyOut,
     AnomalyStatusUpdateIn,
@@ -19,54 +34,167 @@ from sentinelops.api.v1.schemas.anomaly import (
 
 router = APIRouter(prefix="/anomalies", tags=["anomalies"])
 
+# 대시보드 polling용: (path, query, anomaly version) → 직렬화된 응답
+_list_cache = ResponseCache(max_entries=256)
+
+
+def _json_response(body: bytes, etag: str) -> Response:
+    # no-cache: 브라우저는 저장하되 매번 If-None-Match로 재검증
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def _conditional_list(
+    request: Request,
+    db: Session,
+    if_none_match: Optional[str],
+    build: Callable[[], bytes],
+) -> Response:
+    """
+    변경이 없으면 버전 row 1개만 읽고 끝난다.
+    - If-None-Match 일치 → 304 (본문 없음)
+    - 캐시 hit → 저장된 bytes 그대로
+    - miss → 조회 + 직렬화 후 캐시에 저장
+    """
+    version = current_anomaly_version(db)
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), version)
+    etag = make_etag(key)
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    body = _list_cache.get(key)
+    if body is None:
+        body = build()
+        _list_cache.put(key, body)
+    return _json_response(body, etag)
+
+
+def _list_page(db: Session, *, sort: str, limit: int, cursor: Optional[str], **filters) -> bytes:
+    """
+    AnomalyListOut 모양의 JSON을 직접 만든다.
+    - 필요한 컬럼만 row mapping으로 읽고, row마다 pydantic 검증 없이 orjson으로 직렬화
+    - limit + 1개를 읽어서 다음 페이지 존재 여부를 판단 (COUNT 쿼리 없음)
+    """
+    try:
+        rows = list_anomaly_rows(db, sort=sort, limit=limit + 1, cursor=cursor, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    page = rows[:limit]
+    next_cursor = encode_anomaly_cursor(page[-1], sort) if len(rows) > limit else None
+
+    for r in page:
+        del r["severity_rank"]
+    return fast_json.dumps({"items": page, "count": len(page), "next_cursor": next_cursor})
+
 
 @router.get("", response_model=AnomalyListOut)
 def get_anomalies(
+    request: Request,
     db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
     status: Optional[str] = Query(default=None, description="open/acknowledged/resolved"),
     only_open: bool = Query(default=False),
     demo_only: bool = Query(default=False, description="Filter demo anomalies only"),
     sort: str = Query(default="recent", pattern="^(recent|severity_desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
 ):
     if status is not None and status not in ANOMALY_STATUSES:
         raise HTTPException(status_code=422, detail=f"Invalid status: {status}")
 
-    rows = list_anomalies(
+    return _conditional_list(
+        request,
         db,
-        status=status,
-        only_open=only_open,
-        sort=sort,
-        limit=limit,
-        demo_only=demo_only,
+        if_none_match,
+        lambda: _list_page(
+            db,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            only_open=only_open,
+            demo_only=demo_only,
+        ),
     )
-    items = [AnomalyOut.model_validate(r) for r in rows]
-    return AnomalyListOut(items=items, count=len(items))
 
 
 @router.get("/open", response_model=AnomalyListOut)
 def get_open_anomalies_sorted_by_severity(
+    request: Request,
     db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
     demo_only: bool = Query(default=False, description="Filter demo anomalies only"),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
 ):
-    rows = list_anomalies(
+    return _conditional_list(
+        request,
         db,
-        only_open=True,
-        demo_only=demo_only,
-        sort="severity_desc",
-        limit=limit,
+        if_none_match,
+        lambda: _list_page(
+            db,
+            sort="severity_desc",
+            limit=limit,
+            cursor=cursor,
+            only_open=True,
+            demo_only=demo_only,
+        ),
+    )
+
+
+_SSE_KEEPALIVE_SEC = 15.0
+
+
+async def _anomaly_event_stream(request: Request) -> AsyncIterator[bytes]:
+    q = anomaly_broadcaster.subscribe()
+    try:
+        yield b"retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                payload = await asyncio.wait_for(q.get(), timeout=_SSE_KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                # proxy idle timeout 방지 + 끊긴 연결 감지
+                yield b": keep-alive\n\n"
+                continue
+            yield f"event: anomaly\ndata: {payload}\n\n".encode("utf-8")
+    finally:
+        anomaly_broadcaster.unsubscribe(q)
+
+
+# ⚠️ "/{anomaly_id}" 보다 먼저 선언해야 "stream"이 id로 매칭되지 않음
+@router.get("/stream")
+async def stream_anomaly_changes(request: Request):
+    """
+    Server-Sent Events: anomaly 생성 / 상태 변경을 push.
+    data: {"change": "created" | "status_changed", "ids": [...], "status": ..., "rule_code": ...}
+    """
+    return StreamingResponse(
+        _anomaly_event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    items = [AnomalyOut.model_validate(r) for r in rows]
-    return AnomalyListOut(items=items, count=len(items))
 
 
 @router.get("/{anomaly_id}", response_model=AnomalyOut)
-def get_anomaly_by_id(anomaly_id: int, db: Session = Depends(get_db)):
+def get_anomaly_by_id(
+    anomaly_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    # 존재 확인이 먼저: ETag는 전역 변경 version이라 없는 id에도 맞을 수 있다 (→ 304 대신 404)
     row = db.get(Anomaly, anomaly_id)
     if row is None:
         raise HTTPException(status_code=404, detail="Anomaly not found")
-    return AnomalyOut.model_validate(row)
+
+    etag = make_etag(("anomaly", anomaly_id, current_anomaly_version(db)))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return _json_response(AnomalyOut.model_validate(row).model_dump_json().encode("utf-8"), etag)
 
 
 @router.patch("/{anomaly_id}", response_model=AnomalyOut)
@@ -89,6 +217,35 @@ def update_anomaly_status(
     return AnomalyOut.model_validate(row)
 
 
+@router.post("/bulk", response_model=AnomalyBulkUpdateOut)
+def bulk_update_anomaly_status(payload: AnomalyBulkUpdateIn, db: Session = Depends(get_db)):
+    new_status = payload.status
+    if new_status not in ANOMALY_STATUSES:
+        raise HTTPException(status_code=422, detail=f"Invalid status: {new_status}")
+
+    if payload.ids is not None:
+        result = bulk_apply_status_change(db, new_status, ids=payload.ids)
+    else:
+        assert payload.filter is not None
+        result = bulk_apply_status_change(
+            db,
+            new_status,
+            rule_code=payload.filter.rule_code,
+            detected_from=payload.filter.detected_from,
+            detected_to=payload.filter.detected_to,
+        )
+    db.commit()
+
+    items = [AnomalyBulkOutcomeOut(id=o.id, outcome=o.outcome, status=o.status) for o in result.outcomes]
+    return AnomalyBulkUpdateOut(
+        status=new_status,
+        updated_count=sum(1 for o in result.outcomes if o.outcome == "updated"),
+        truncated=result.truncated,
+        remaining=result.remaining,
+        items=items,
+    )
+
+
 @router.post("/{anomaly_id}/ack", response_model=AnomalyOut)
 def ack_anomaly(anomaly_id: int, db: Session = Depends(get_db)):
     row = db.get(Anomaly, anomaly_id)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from sentinelops.api.v1.schemas.event import EventListOut
+from sentinelops.core.fast_json import ORJSONResponse
+from sentinelops.db.session import get_db
+from sentinelops.services.events_query import encode_event_cursor, event_to_dict, list_events
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("", response_model=EventListOut, response_class=ORJSONResponse)
+def get_events(
+    db: Session = Depends(get_db),
+    start: Optional[datetime] = Query(default=None, alias="from", description="inclusive (ISO 8601)"),
+    end: Optional[datetime] = Query(default=None, alias="to", description="exclusive (ISO 8601)"),
+    status: Optional[str] = Query(default=None, description="verified/invalid"),
+    event_type: Optional[str] = Query(default=None),
+    source: Optional[str] = Query(default=None),
+    livemode: Optional[bool] = Query(default=None),
+    include_raw: bool = Query(default=False, description="Include raw provider payload"),
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+):
+    try:
+        rows = list_events(
+            db,
+            start=start,
+            end=end,
+            status=status,
+            event_type=event_type,
+            source=source,
+            livemode=livemode,
+            limit=limit + 1,
+            cursor=cursor,
+            include_raw=include_raw,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    page = rows[:limit]
+    next_cursor = encode_event_cursor(page[-1]) if len(rows) > limit else None
+
+    # row → dict → orjson (row마다 pydantic 검증 생략)
+    items = [event_to_dict(r, include_raw=include_raw) for r in page]
+    return ORJSONResponse({"items": items, "count": len(items), "next_cursor": next_cursor})
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterator, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from sentinelops.db.session import SessionLocal
+from sentinelops.services.export import (
+    iter_csv,
+    iter_export_rows,
+    iter_ndjson,
+    resolve_export_columns,
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+def _stream(
+    kind: str,
+    *,
+    start: datetime,
+    end: datetime,
+    columns: list[str],
+    fmt: str,
+) -> Iterator[bytes]:
+    # ✅ 응답이 끝날 때까지 cursor가 살아 있어야 하므로 dependency 세션 대신
+    #    generator가 직접 세션을 열고 닫는다.
+    db = SessionLocal()
+    try:
+        rows = iter_export_rows(db, kind, start=start, end=end, columns=columns)
+        if fmt == "csv":
+            yield from iter_csv(rows, columns)
+        else:
+            yield from iter_ndjson(rows)
+    finally:
+        db.close()
+
+
+@router.get("/{kind}")
+def export_rows(
+    kind: Literal["events", "anomalies"],
+    start: datetime = Query(..., alias="from", description="inclusive (ISO 8601)"),
+    end: datetime = Query(..., alias="to", description="exclusive (ISO 8601)"),
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    columns: Optional[str] = Query(
+        default=None,
+        description="comma separated column names (events: raw is only included when listed)",
+    ),
+):
+    if end <= start:
+        raise HTTPException(status_code=422, detail="'to' must be after 'from'")
+
+    requested = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    try:
+        selected = resolve_export_columns(kind, requested)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"{kind}_{start:%Y%m%dT%H%M}_{end:%Y%m%dT%H%M}.{format}"
+
+    return StreamingResponse(
+        _stream(kind, start=start, end=end, columns=selected, fmt=format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from sentinelops.api.v1.schemas.anomaly import AnomalyOut
+from sentinelops.api.v1.schemas.incident import IncidentDetailOut, IncidentListOut
+from sentinelops.core.fast_json import ORJSONResponse
+from sentinelops.db.session import get_db
+from sentinelops.models.incident import Incident
+from sentinelops.services.incidents import (
+    encode_incident_cursor,
+    incident_to_dict,
+    list_incident_anomalies,
+    list_incidents,
+)
+
+router = APIRouter(prefix="/incidents", tags=["incidents"])
+
+
+@router.get("", response_model=IncidentListOut, response_class=ORJSONResponse)
+def get_incidents(
+    db: Session = Depends(get_db),
+    status: Optional[str] = Query(default=None, description="active/resolved"),
+    family: Optional[str] = Query(default=None),
+    since: Optional[datetime] = Query(default=None, description="last_detected_at >= since (ISO 8601)"),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+):
+    try:
+        rows = list_incidents(db, status=status, family=family, since=since, limit=limit + 1, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    page = rows[:limit]
+    next_cursor = encode_incident_cursor(page[-1].Incident) if len(rows) > limit else None
+
+    items = [incident_to_dict(r.Incident, open_anomalies=int(r.open_anomalies)) for r in page]
+    return ORJSONResponse({"items": items, "count": len(items), "next_cursor": next_cursor})
+
+
+@router.get("/{incident_id}", response_model=IncidentDetailOut)
+def get_incident(incident_id: int, db: Session = Depends(get_db)):
+    incident = db.get(Incident, incident_id)
+    if incident is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+
+    anomalies = list_incident_anomalies(db, incident_id)
+    open_count = sum(1 for a in anomalies if a.status == "open")
+    return IncidentDetailOut(
+        **incident_to_dict(incident, open_anomalies=open_count),
+        anomalies=[AnomalyOut.model_validate(a) for a in anomalies],
+    )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from sentinelops.api.v1.schemas.metrics import TimeseriesOut, TimeseriesPointOut
+from sentinelops.db.session import get_db
+from sentinelops.services.event_rollups import event_timeseries
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+BUCKETS: dict[str, int] = {"1m": 60, "5m": 300, "1h": 3600}
+
+
+@router.get("/timeseries", response_model=TimeseriesOut)
+def get_timeseries(
+    db: Session = Depends(get_db),
+    metric: Literal["events", "invalid", "failures"] = Query(default="events"),
+    bucket: Literal["1m", "5m", "1h"] = Query(default="5m"),
+    start: Optional[datetime] = Query(default=None, alias="from", description="inclusive (ISO 8601), default: to - 24h"),
+    end: Optional[datetime] = Query(default=None, alias="to", description="exclusive (ISO 8601), default: now"),
+    event_type: Optional[str] = Query(default=None),
+):
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(hours=24)
+
+    try:
+        result = event_timeseries(
+            db,
+            metric=metric,
+            bucket_seconds=BUCKETS[bucket],
+            start=start,
+            end=end,
+            event_type=event_type,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return TimeseriesOut(
+        metric=result["metric"],
+        bucket=bucket,
+        start=result["start"],
+        end=result["end"],
+        event_type=result["event_type"],
+        rolled_up_until=result["rolled_up_until"],
+        points=[TimeseriesPointOut(**p) for p in result["points"]],
+    )
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from sentinelops.core.metrics import CONTENT_TYPE, REGISTRY
+
+# Prometheus scrape 관례상 /api/v1 prefix 없이 /metrics 로 노출
+router = APIRouter(tags=["telemetry"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
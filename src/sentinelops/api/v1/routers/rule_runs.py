@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from sentinelops.api.v1.schemas.rule_run import (
+    RuleRunListOut,
+    RuleRunOut,
+    RuleRunSummaryListOut,
+    RuleRunSummaryOut,
+)
+from sentinelops.db.session import get_db
+from sentinelops.services.rule_runs import list_rule_runs, summarize_rule_runs
+
+router = APIRouter(prefix="/rule-runs", tags=["rule-runs"])
+
+
+@router.get("", response_model=RuleRunListOut)
+def get_rule_runs(
+    db: Session = Depends(get_db),
+    rule_code: Optional[str] = Query(default=None),
+    status: Optional[str] = Query(default=None, description="ok/error"),
+    limit: int = Query(default=50, ge=1, le=200),
+):
+    rows = list_rule_runs(db, rule_code=rule_code, status=status, limit=limit)
+    items = [RuleRunOut.model_validate(r) for r in rows]
+    return RuleRunListOut(items=items, count=len(items))
+
+
+@router.get("/summary", response_model=RuleRunSummaryListOut)
+def get_rule_run_summary(
+    db: Session = Depends(get_db),
+    since_hours: int = Query(default=24, ge=1, le=24 * 30),
+):
+    rows = summarize_rule_runs(db, since_hours=since_hours)
+    items = [RuleRunSummaryOut(**r) for r in rows]
+    return RuleRunSummaryListOut(since_hours=since_hours, items=items)
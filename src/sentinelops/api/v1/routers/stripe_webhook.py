@@ -1,7 +1,10 @@
+import time
+
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from sentinelops.api.deps import db_session
+from sentinelops.core.metrics import WEBHOOK_LATENCY
 from sentinelops.integrations.stripe.webhook import construct_event
 from sentinelops.services.events_ingest import save_invalid_event, save_verified_event
 
@@ -14,32 +17,41 @@ async def stripe_webhook(
     db: Session = Depends(db_session),
     stripe_signature: str | None = Header(default=None, alias="Stripe-Signature"),
 ):
-    if not stripe_signature:
-        raise HTTPException(status_code=400, detail="Missing Stripe-Signature header")
-
-    payload = await request.body()
-
-    # 1) Verify + parse
+    started = time.perf_counter()
+    outcome = "rejected"
     try:
-        event = construct_event(payload, stripe_signature)
-    except Exception as e:
-        # ✅ invalid도 "수신된 사실"로 남긴다
-        save_invalid_event(db, payload=payload, signature=stripe_signature, reason=str(e))
-        return {"ok": False, "invalid": True, "reason": str(e)}
-
-    provider_event_id = event["id"]
-    event_type = event["type"]
-
-    # 2) Save (idempotent)
-    result = save_verified_event(
-        db,
-        provider_event_id=provider_event_id,
-        event_type=event_type,
-        raw=event,
-        signature=stripe_signature,
-    )
-
-    if result["deduped"]:
-        return {"ok": True, "deduped": True, "provider_event_id": provider_event_id}
-
-    return {"ok": True, "saved": True, "provider_event_id": provider_event_id, "event_type": event_type}
+        if not stripe_signature:
+            raise HTTPException(status_code=400, detail="Missing Stripe-Signature header")
+
+        payload = await request.body()
+
+        # 1) Verify + parse
+        try:
+            event = construct_event(payload, stripe_signature)
+        except Exception as e:
+            # ✅ invalid도 "수신된 사실"로 남긴다
+            save_invalid_event(db, payload=payload, signature=stripe_signature, reason=str(e))
+            outcome = "invalid"
+            return {"ok": False, "invalid": True, "reason": str(e)}
+
+        provider_event_id = event["id"]
+        event_type = event["type"]
+
+        # 2) Save (idempotent)
+        result = save_verified_event(
+            db,
+            provider_event_id=provider_event_id,
+            event_type=event_type,
+            raw=event,
+            signature=stripe_signature,
+        )
+
+        if result["deduped"]:
+            outcome = "deduped"
+            return {"ok": True, "deduped": True, "provider_event_id": provider_event_id}
+
+        outcome = "verified"
+        return {"ok": True, "saved": True, "provider_event_id": provider_event_id, "event_type": event_type}
+    finally:
+        # 예외(DB 오류 등)로 빠져나가도 "rejected"로 남김
+        WEBHOOK_LATENCY.labels(outcome).observe(time.perf_counter() - started)
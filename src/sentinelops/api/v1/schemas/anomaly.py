@@ -3,13 +3,46 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class AnomalyStatusUpdateIn(BaseModel):
     status: str
 
 
+class AnomalyBulkFilterIn(BaseModel):
+    rule_code: Optional[str] = None
+    detected_from: Optional[datetime] = None
+    detected_to: Optional[datetime] = None
+
+
+class AnomalyBulkUpdateIn(BaseModel):
+    status: str
+    ids: Optional[list[int]] = Field(default=None, min_length=1, max_length=500)
+    filter: Optional[AnomalyBulkFilterIn] = None
+
+    @model_validator(mode="after")
+    def _ids_or_filter(self) -> "AnomalyBulkUpdateIn":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        return self
+
+
+class AnomalyBulkOutcomeOut(BaseModel):
+    id: int
+    outcome: str
+    status: Optional[str] = None
+
+
+class AnomalyBulkUpdateOut(BaseModel):
+    status: str
+    updated_count: int
+    # filter mode에서 cap(BULK_MAX_ANOMALIES)을 넘어 이번에 처리되지 않은 row가 있으면 True
+    truncated: bool = False
+    remaining: int = 0
+    items: list[AnomalyBulkOutcomeOut]
+
+
 class AnomalyOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -27,8 +60,11 @@ class AnomalyOut(BaseModel):
     acknowledged_at: Optional[datetime] = None
     resolved_at: Optional[datetime] = None
     updated_at: datetime
+    incident_id: Optional[int] = None
 
 
 class AnomalyListOut(BaseModel):
     items: list[AnomalyOut]
     count: int
+    # 다음 페이지가 있으면 opaque cursor, 없으면 None
+    next_cursor: Optional[str] = None
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class EventOut(BaseModel):
+    id: int
+    source: str
+    provider_event_id: Optional[str] = None
+    event_type: Optional[str] = None
+    status: str
+    livemode: Optional[bool] = None
+    created_at_provider: Optional[datetime] = None
+    created_at: datetime
+    # include_raw=true일 때만 포함
+    raw: Optional[dict[str, Any]] = None
+
+
+class EventListOut(BaseModel):
+    items: list[EventOut]
+    count: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from sentinelops.api.v1.schemas.anomaly import AnomalyOut
+
+
+class IncidentOut(BaseModel):
+    id: int
+    family: str
+    title: str
+    severity: str
+    rule_codes: list[str]
+    anomaly_count: int
+    open_anomalies: int
+    window_start: datetime
+    window_end: datetime
+    first_detected_at: datetime
+    last_detected_at: datetime
+
+
+class IncidentListOut(BaseModel):
+    items: list[IncidentOut]
+    count: int
+    next_cursor: Optional[str] = None
+
+
+class IncidentDetailOut(IncidentOut):
+    anomalies: list[AnomalyOut]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TimeseriesPointOut(BaseModel):
+    bucket_start: datetime
+    value: int
+
+
+class TimeseriesOut(BaseModel):
+    metric: str
+    bucket: str
+    start: datetime
+    end: datetime
+    event_type: Optional[str] = None
+    # 이 시각 이전은 rollup, 이후는 raw events에서 센 값
+    rolled_up_until: Optional[datetime] = None
+    points: list[TimeseriesPointOut]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RuleRunOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    rule_code: str
+    status: str
+    started_at: datetime
+    wall_ms: float
+    db_ms: float
+    statement_count: int
+    rows_scanned: int
+    anomalies_created: int
+    error: Optional[str] = None
+
+
+class RuleRunListOut(BaseModel):
+    items: list[RuleRunOut]
+    count: int
+
+
+class RuleRunSummaryOut(BaseModel):
+    rule_code: str
+    runs: int
+    error_runs: int
+    avg_wall_ms: float
+    p95_wall_ms: float
+    max_wall_ms: float
+    avg_db_ms: float
+    avg_statements: float
+    avg_rows_scanned: float
+    anomalies_created: int
+
+
+class RuleRunSummaryListOut(BaseModel):
+    since_hours: int
+    items: list[RuleRunSummaryOut]
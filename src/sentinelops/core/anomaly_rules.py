@@ -14,6 +14,11 @@ class RuleDef:
     severity: Severity
     title: str
     description: str
+    # 같은 원인을 다른 각도로 보는 rule끼리 묶는 이름 (incident grouping 단위)
+    family: str
+    # open anomaly를 다음 window로 연장할 때 더해 가는 evidence 숫자 key
+    # (window 전체 건수여야 함. sample 개수처럼 잘린 값은 넣지 않는다)
+    extend_counters: tuple[str, ...] = ()
 
 # 실제 룰 인스턴스 (데이터)
 RULES: list[RuleDef] = [
@@ -22,35 +27,51 @@ RULES: list[RuleDef] = [
         severity="high",
         title="Payment failure spike",
         description="결제 실패율이 최근 구간에서 기준 대비 급증",
+        family="payment_failures",
+        extend_counters=("failed_count",),
     ),
     RuleDef(
         code="refund_spike",
         severity="high",
         title="Refund spike",
         description="환불 건수/금액이 기준 대비 급증",
+        family="refunds",
     ),
     RuleDef(
         code="churn_spike",
         severity="high",
         title="Churn spike / subscription loss",
         description="구독 해지 또는 인보이스 실패가 기준 대비 급증",
+        family="churn",
     ),
     RuleDef(
         code="amount_spike",
         severity="medium",
         title="Amount spike",
         description="단일 결제 금액이 최근 30일 평균 대비 과도하게 큼",
+        family="amounts",
     ),
     RuleDef(
         code="webhook_integrity",
         severity="low",
         title="Webhook integrity anomaly",
         description="invalid / deduped / 지연 등 webhook 관측 품질 이상",
+        family="webhook_integrity",
+        extend_counters=("invalid_event_count",),
     ),
     RuleDef(
         code="rapid_retry_failure",
         severity="high",
         title="Rapid payment failure retries (5m)",
         description="Multiple payment failures detected within 5 minutes, possible checkout issue or card declines spike.",
+        family="payment_failures",
+        extend_counters=("failed_count",),
     )
 ]
+
+
+def rule_family(rule_code: str) -> str:
+    """등록 안 된 rule_code(데모 데이터 등)는 rule_code 자체가 family"""
+    rule = next((r for r in RULES if r.code == rule_code), None)
+    return rule.family if rule is not None else rule_code
+
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,11 +20,56 @@ class Settings(BaseSettings):
     stripe_webhook_secret: SecretStr | None = None
 
     slack_webhook_url: SecretStr | None = None
+    # summary 전송 channel별 webhook: "ops=https://hooks...,finance=https://hooks..."
+    # ("default" channel은 slack_webhook_url)
+    slack_summary_webhooks: SecretStr | None = None
+    # Slack delivery client (integrations.slack.client): pool + webhook별 rate limit + Retry-After
+    slack_timeout_sec: float = 10.0
+    slack_rate_per_sec: float = 1.0          # webhook 1개당
+    slack_burst: int = 3
+    slack_max_attempts: int = 3
+    slack_max_wait_sec: float = 30.0         # rate limit / Retry-After 대기 총량
+    slack_max_concurrency: int = 4           # send_many 동시 전송 수
 
     # ✅ AI 관련 추가
     openai_api_key: SecretStr | None = None
     ai_summary_model: str | None = None
-    ai_summary_timeout_sec: int = 12
+    openai_base_url: str | None = None    # 로컬 fake server 등 (기본: OpenAI API)
+    ai_summary_timeout_sec: int = 12      # attempt 1번의 timeout
+    ai_summary_deadline_sec: int = 20     # retry 포함 전체 예산 (넘으면 AI 없이 전송)
+    ai_cache_ttl_hours: int = 72          # 0이면 캐시 끔
+    ai_cache_max_entries: int = 500
+
+    # ✅ Rule engine 병렬 실행
+    rules_max_workers: int = 4
+    rules_timeout_sec: int = 20
+
+    # ✅ Incident grouping: 같은 rule family의 window가 이 간격(분) 안이면 같은 incident
+    incident_merge_gap_minutes: int = 0
+    # 같은 rule이 open anomaly 바로 다음 window에서 또 걸리면 새 row 대신 기존 row의 window_end를 연장
+    anomaly_extend_open: bool = True
+
+    # ✅ Summary job 병렬 실행 (kind × window × channel)
+    summary_max_workers: int = 4
+    summary_lease_sec: int = 300             # claim 후 이 시간 안에 못 끝내면 다른 worker가 재시도
+
+    # ✅ Event rollups (timeseries 사전 집계)
+    rollup_lookback_minutes: int = 10
+
+    # ✅ Logging (JSON lines → stderr, QueueListener thread에서 출력)
+    log_level: str = "INFO"
+    log_levels: str = ""                     # "module=LEVEL,module=LEVEL"
+    log_format: Literal["json", "text"] = "json"
+    log_rate_limit_sec: int = 300            # 반복 메시지 최소 간격
+    # 1번 돌고 끝나는 script(run_rules 등)가 실행 사이에 rate limit state를 유지하는 파일
+    log_rate_limit_state_file: str = ".sentinelops/log_rate_limit.json"
+
+    # ✅ Profiling (opt-in, 기본 off)
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.01      # 요청 중 profiling 비율
+    profiling_job_sample_rate: float = 1.0   # batch job 중 profiling 비율
+    profiling_dir: str = "profiles"
+    profiling_format: Literal["pstats", "collapsed"] = "pstats"
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+# OPT_UTC_Z: UTC datetime을 pydantic과 같은 "...Z" 형태로 직렬화
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # orjson이 기본으로 못 다루는 타입. Decimal(SUM/numeric 컬럼)은 pydantic처럼 문자열로
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    list 응답용 빠른 JSON 직렬화.
+    dict / list / datetime / UUID / Decimal(문자열로) 외 타입은 pydantic 모델을 거쳐야 함.
+    """
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(Response):
+    """
+    row mapping(dict)을 pydantic 검증 없이 바로 직렬화하는 response class.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,194 @@
+"""
+Structured logging (JSON lines, non-blocking)
+
+- 호출 thread는 QueueHandler로 record를 queue에 넣기만 하고,
+  실제 stdout/stderr 쓰기는 QueueListener thread가 한다 → hot path가 I/O에 안 막힘
+- extra={...}로 넘긴 필드(rule_code, anomaly_id, duration_ms, error_code 등)는
+  JSON의 최상위 key로 나간다
+- 모듈별 level: LOG_LEVELS="sentinelops.services.rules_runner=DEBUG,sqlalchemy.engine=WARNING"
+- 같은 메시지가 반복되는 경우(예: "no failure spike") extra={"rate_limited": True}로
+  찍으면 RateLimitFilter가 LOG_RATE_LIMIT_SEC 동안 1번만 내보내고 나머지는 개수만 센다
+  - API처럼 오래 사는 process는 메모리 state로 충분
+  - cron으로 1번씩 도는 script(run_rules 등)는 setup_logging(persist_rate_limit=True)
+    → state를 LOG_RATE_LIMIT_STATE_FILE에 저장/복원해서 실행 사이에도 rate limit 유지
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sentinelops.core import fast_json
+from sentinelops.core.config import settings
+
+# LogRecord 기본 속성 (이 밖의 속성 = extra 필드)
+_RESERVED = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+    | {"message", "asctime", "rate_limited", "taskName"}
+)
+
+_JSON_SAFE = (str, int, float, bool, type(None), datetime)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_rate_limit_filter: Optional[RateLimitFilter] = None
+_setup_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        out: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                out[key] = value
+        if record.exc_info:
+            out["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            out["exc_info"] = record.exc_text
+        try:
+            return fast_json.dumps(out).decode("utf-8")
+        except TypeError:
+            # 직렬화 안 되는 extra 값이 있어도 로그는 남긴다
+            safe = {k: v if isinstance(v, _JSON_SAFE) else repr(v) for k, v in out.items()}
+            return fast_json.dumps(safe).decode("utf-8")
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    extra={"rate_limited": True}인 record만 대상.
+    (logger, 메시지 템플릿) 단위로 interval_sec에 1번만 통과시키고,
+    통과하는 record에 그 사이 버려진 개수를 suppressed로 붙인다.
+
+    state_path를 주면 시작할 때 state를 읽고 save()에서 다시 쓴다 (process를 넘어 유지).
+    실행 간 비교라서 시각은 wall clock(time.time)을 쓴다.
+    """
+
+    def __init__(self, interval_sec: float, state_path: Optional[str] = None) -> None:
+        super().__init__()
+        self._interval = interval_sec
+        self._state_path = state_path
+        self._state: dict[tuple[str, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        if state_path:
+            self._state = self._read_state(state_path)
+
+    @staticmethod
+    def _read_state(path: str) -> dict[tuple[str, str], tuple[float, int]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+            return {(name, msg): (float(last), int(suppressed)) for name, msg, last, suppressed in raw}
+        except (OSError, ValueError, TypeError):
+            # 없는 파일 / 깨진 파일이면 빈 state로 시작 (로그를 더 내보낼 뿐)
+            return {}
+
+    def save(self) -> None:
+        """state를 state_path에 기록. 같은 파일을 쓰는 다른 process 값과는 최근 것 우선으로 합친다."""
+        if not self._state_path:
+            return
+        cutoff = time.time() - self._interval
+        with self._lock:
+            merged = self._read_state(self._state_path)
+            for key, (last, suppressed) in self._state.items():
+                if key not in merged or merged[key][0] <= last:
+                    merged[key] = (last, suppressed)
+        # interval이 지난 entry는 다음 실행에서 어차피 통과 → suppressed가 남은 것만 유지
+        rows = [[n, m, last, sup] for (n, m), (last, sup) in merged.items() if last >= cutoff or sup]
+        try:
+            directory = os.path.dirname(self._state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{self._state_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(tmp, self._state_path)
+        except OSError:
+            pass
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "rate_limited", False):
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.time()
+        with self._lock:
+            last, suppressed = self._state.get(key, (0.0, 0))
+            if last and now - last < self._interval:
+                self._state[key] = (last, suppressed + 1)
+                return False
+            self._state[key] = (now, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+def _parse_levels(spec: str) -> dict[str, str]:
+    levels: dict[str, str] = {}
+    for part in spec.split(","):
+        name, sep, level = part.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(*, persist_rate_limit: bool = False) -> None:
+    """
+    프로세스당 1번 (API 시작 / script main에서 호출). 여러 번 불러도 안전.
+    - persist_rate_limit: 1번 돌고 끝나는 script용. rate limit state를 실행 사이에 유지
+    """
+    global _listener, _rate_limit_filter
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        sink = logging.StreamHandler(sys.stderr)
+        if settings.log_format == "json":
+            sink.setFormatter(JsonFormatter())
+        else:
+            sink.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # 버릴 record는 queue에 넣기 전에 caller thread에서 바로 버린다
+        _rate_limit_filter = RateLimitFilter(
+            settings.log_rate_limit_sec,
+            state_path=settings.log_rate_limit_state_file if persist_rate_limit else None,
+        )
+        queue_handler.addFilter(_rate_limit_filter)
+
+        root = logging.getLogger()
+        root.handlers = [queue_handler]
+        root.setLevel(settings.log_level.upper())
+        for name, level in _parse_levels(settings.log_levels).items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, sink, respect_handler_level=True)
+        _listener.start()
+        # 종료 시 queue에 남은 로그까지 flush
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    global _listener, _rate_limit_filter
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        if _rate_limit_filter is not None:
+            _rate_limit_filter.save()
+            _rate_limit_filter = None
@@ -0,0 +1,290 @@
+"""
+In-process metrics registry (Prometheus text exposition format 0.0.4)
+
+- 외부 의존성 없이 Counter / Histogram / callback Gauge만 최소로 구현
+- hot path 비용: labels()는 dict 조회 1번, observe/inc는 lock 1번 + bisect
+  → 요청당 수 µs 이하
+- 프로세스 단위 값이다. uvicorn worker가 여러 개면 worker별로 scrape되며,
+  Prometheus 쪽에서 sum()으로 합친다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+# 초 단위 latency 기본 bucket (1ms ~ 30s)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(v: float) -> str:
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, doc: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        ...
+
+
+class _LabeledMetric(_Metric):
+    """label 값 조합마다 child(값 저장소)를 두는 metric (Counter / Histogram)"""
+
+    def __init__(self, name: str, doc: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, doc, labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> object:
+        ...
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+
+# -------------------------
+# Counter
+# -------------------------
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        return self._value
+
+
+class Counter(_LabeledMetric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, child in sorted(self._children.items()):
+            lines.append(f"{self.name}{_label_str(self.labelnames, key)} {_format_value(child.get())}")
+        return lines
+
+
+# -------------------------
+# Histogram
+# -------------------------
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)  # 마지막 칸 = +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class Histogram(_LabeledMetric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, doc, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, child in sorted(self._children.items()):
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, c in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += c
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_str(self.labelnames, key, le)} {cumulative}")
+            labels = _label_str(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# -------------------------
+# Gauge (scrape 시점에 callback으로 읽음)
+# -------------------------
+
+class CallbackGauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, doc: str, fn: Callable[[], float]) -> None:
+        super().__init__(name, doc)
+        self._fn = fn
+
+    def render(self) -> list[str]:
+        try:
+            value = float(self._fn())
+        except Exception:
+            # scrape가 실패하면 값만 빠지고 나머지 metric은 나가야 함
+            return []
+        return [*self._header(), f"{self.name} {_format_value(value)}"]
+
+
+# -------------------------
+# Registry
+# -------------------------
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing: Optional[_Metric] = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, doc: str, labelnames: Iterable[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, doc, labelnames))  # type: ignore[return-value]
+
+
+def histogram(
+    name: str,
+    doc: str,
+    labelnames: Iterable[str] = (),
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, doc, labelnames, buckets))  # type: ignore[return-value]
+
+
+def gauge_callback(name: str, doc: str, fn: Callable[[], float]) -> CallbackGauge:
+    return REGISTRY.register(CallbackGauge(name, doc, fn))  # type: ignore[return-value]
+
+
+# -------------------------
+# SentinelOps metrics
+# -------------------------
+
+WEBHOOK_LATENCY = histogram(
+    "sentinelops_webhook_request_duration_seconds",
+    "Stripe webhook handling time by outcome (verified/invalid/deduped/rejected).",
+    ["outcome"],
+)
+
+DB_POOL_CHECKOUTS = counter(
+    "sentinelops_db_pool_checkouts_total",
+    "Connections checked out from the SQLAlchemy pool.",
+)
+DB_POOL_WAIT = histogram(
+    "sentinelops_db_pool_wait_seconds",
+    "Time spent waiting for a pooled DB connection.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+RULE_RUN_DURATION = histogram(
+    "sentinelops_rule_run_duration_seconds",
+    "Rule execution wall time by rule and status.",
+    ["rule_code", "status"],
+)
+
+SLACK_LATENCY = histogram(
+    "sentinelops_slack_request_duration_seconds",
+    "Slack webhook call latency by target (alert/summary) and result code.",
+    ["target", "code"],
+)
+
+OPENAI_LATENCY = histogram(
+    "sentinelops_openai_request_duration_seconds",
+    "OpenAI API call latency per attempt by result code.",
+    ["code"],
+)
+AI_INSIGHT_RESULTS = counter(
+    "sentinelops_ai_insight_total",
+    "generate_ai_insight results (ok or ai_error code).",
+    ["code"],
+)
+AI_CACHE_LOOKUPS = counter(
+    "sentinelops_ai_insight_cache_lookups_total",
+    "AI insight cache lookups by result (hit/miss).",
+    ["result"],
+)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+# Keyset(cursor) pagination 토큰
+# - 클라이언트에게는 opaque 문자열 (내부 구조에 의존하지 않게)
+# - 내용은 "마지막으로 본 row의 정렬 키" → 다음 페이지는 index range scan으로 이어서 읽음
+# - 서명은 하지 않음: 변조해도 다른 위치부터 읽을 뿐, 권한 경계가 아님
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
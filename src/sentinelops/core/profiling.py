@@ -0,0 +1,223 @@
+"""
+Opt-in profiling (요청 / 배치 job 샘플링)
+
+- PROFILING_ENABLED=false(기본)면 middleware 자체를 등록하지 않고,
+  job wrapper는 bool 하나 확인 후 바로 실행 → 비용 거의 0
+- format
+  - pstats:    cProfile 결과 (.prof) → `python -m pstats`, snakeviz 등으로 확인
+  - collapsed: stack sampler 결과 (.folded, "a;b;c count") → flamegraph.pl / speedscope
+- cProfile은 "시작한 thread"만 본다.
+  - async endpoint(webhook 등)는 event loop thread에서 돌므로 그대로 잡힘
+    (같은 시간에 loop에서 돈 다른 요청도 섞인다)
+  - sync endpoint는 threadpool에서 돌기 때문에 pstats로는 안 잡힌다 → collapsed 사용
+  - job은 all_threads=True로 새로 뜨는 worker thread(rule pool 등)까지 포함
+- collapsed sampler는 항상 전체 thread를 샘플링한다 (stack 맨 앞에 thread 이름)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import itertools
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sentinelops.core.config import settings
+
+_SAMPLE_INTERVAL_SEC = 0.005
+_seq = itertools.count(1)
+
+# 같은 thread에서 profiler가 겹치면 결과가 깨지므로 thread당 1개만
+_active = threading.local()
+
+
+def _should_sample(rate: float) -> bool:
+    return rate >= 1.0 or random.random() < rate
+
+
+def _output_path(name: str, suffix: str) -> Path:
+    out_dir = Path(settings.profiling_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "profile"
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    return out_dir / f"{safe}-{ts}-{os.getpid()}-{next(_seq)}{suffix}"
+
+
+# -------------------------
+# pstats (cProfile)
+# -------------------------
+
+class _CProfileSession:
+    def __init__(self, *, all_threads: bool) -> None:
+        self._main = cProfile.Profile()
+        self._all_threads = all_threads
+        self._thread_profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def _thread_bootstrap(self, *args) -> None:
+        # threading.setprofile 훅: 새 thread 첫 호출 때 그 thread 전용 profiler로 교체
+        prof = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(prof)
+        prof.enable()
+
+    def start(self) -> None:
+        if self._all_threads:
+            threading.setprofile(self._thread_bootstrap)
+        self._main.enable()
+
+    def stop(self, name: str) -> Path:
+        self._main.disable()
+        if self._all_threads:
+            threading.setprofile(None)
+
+        stats = pstats.Stats(self._main)
+        with self._lock:
+            for prof in self._thread_profiles:
+                # 아직 살아 있는 worker thread의 profile도 지금까지 수집된 만큼 합친다
+                stats.add(prof)
+
+        path = _output_path(name, ".prof")
+        stats.dump_stats(str(path))
+        return path
+
+
+# -------------------------
+# collapsed stacks (sampler thread)
+# -------------------------
+
+class _StackSampler:
+    def __init__(self, interval_sec: float = _SAMPLE_INTERVAL_SEC) -> None:
+        self._interval = interval_sec
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample_once(self, own_ident: int) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            parts: list[str] = []
+            f = frame
+            while f is not None:
+                code = f.f_code
+                parts.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                f = f.f_back
+            parts.append(names.get(ident, str(ident)))
+            self._stacks[";".join(reversed(parts))] += 1
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self._interval):
+            self._sample_once(own)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, name: str) -> Path:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+        path = _output_path(name, ".folded")
+        with path.open("w", encoding="utf-8") as fp:
+            for stack, count in self._stacks.most_common():
+                fp.write(f"{stack} {count}\n")
+        return path
+
+
+# -------------------------
+# Public API
+# -------------------------
+
+@contextmanager
+def profile_section(
+    name: str,
+    *,
+    sample_rate: Optional[float] = None,
+    all_threads: bool = False,
+) -> Iterator[Optional[Path]]:
+    """
+    감싼 구간을 확률적으로 profiling 한다.
+    - 비활성 / 샘플링 제외 / 이 thread에서 이미 profiling 중이면 그냥 실행
+    - profiling 실패가 요청/job을 깨면 안 되므로 출력 오류는 삼킨다
+    """
+    rate = settings.profiling_sample_rate if sample_rate is None else sample_rate
+    if not settings.profiling_enabled or not _should_sample(rate) or getattr(_active, "on", False):
+        yield None
+        return
+
+    if settings.profiling_format == "collapsed":
+        session: _CProfileSession | _StackSampler = _StackSampler()
+    else:
+        session = _CProfileSession(all_threads=all_threads)
+
+    _active.on = True
+    started = time.perf_counter()
+    try:
+        session.start()
+        yield None
+    finally:
+        _active.on = False
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        try:
+            session.stop(f"{name}-{elapsed_ms}ms")
+        except Exception:
+            pass
+
+
+@contextmanager
+def profiled_job(name: str) -> Iterator[None]:
+    """
+    batch script(run_rules, run_daily_summary 등) 전체를 감싸는 wrapper.
+    job은 드물게 돌기 때문에 요청과 별도의 sample rate를 쓴다.
+    """
+    with profile_section(
+        f"job-{name}",
+        sample_rate=settings.profiling_job_sample_rate,
+        all_threads=True,
+    ):
+        yield
+
+
+# -------------------------
+# ASGI middleware
+# -------------------------
+
+# 오래 열려 있는 연결(SSE/export)이나 scrape는 profiling 대상에서 제외
+_SKIP_SUFFIXES = ("/stream", "/metrics")
+_SKIP_PREFIXES = ("/api/v1/export/",)
+
+
+class ProfilingMiddleware:
+    """
+    요청 샘플링 profiling. main.py에서 PROFILING_ENABLED일 때만 등록한다.
+    (pure ASGI: BaseHTTPMiddleware와 달리 streaming 응답을 버퍼링하지 않음)
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope.get("path", "")
+        if path.endswith(_SKIP_SUFFIXES) or path.startswith(_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        with profile_section(f"{scope.get('method', 'GET')}{path}"):
+            await self.app(scope, receive, send)
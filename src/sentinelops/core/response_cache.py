@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+def make_etag(key: Hashable) -> str:
+    # key에는 (path, query params, version)이 들어있음 → 버전이 바뀌면 ETag도 바뀜
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        c = candidate.strip()
+        if c == "*":
+            return True
+        if c.startswith("W/"):
+            c = c[2:]
+        if c == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    직렬화된 응답(bytes)을 담는 작은 in-process LRU.
+    - 키에 버전이 포함되므로 명시적 invalidation 없이 오래된 항목은 LRU로 밀려남
+    - uvicorn threadpool에서 동시에 접근하므로 lock으로 보호
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._items: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            body = self._items.get(key)
+            if body is not None:
+                self._items.move_to_end(key)
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        with self._lock:
+            self._items[key] = body
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._items.popitem(last=False)
@@ -21,3 +21,10 @@ INTERESTED_EVENT_TYPES: set[str] = {
     "invoice.payment_succeeded",
     "invoice.payment_failed",
 }
+
+# 결제 실패로 보는 이벤트 (rules_runner의 failure 룰 / metrics timeseries 공용)
+# 리포트와 룰이 같은 정의를 써야 숫자가 어긋나지 않음
+FAILURE_EVENT_TYPES: tuple[str, ...] = (
+    "payment_intent.payment_failed",
+    "charge.failed",
+)
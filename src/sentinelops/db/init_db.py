@@ -4,7 +4,7 @@ from sentinelops.db.session import engine
 from sentinelops.db.base import Base
 
 # 모델 import (Base에 테이블 등록되게)
-from sentinelops.models import anomaly, event, daily_summary_delivery  # noqa: F401
+from sentinelops.models import anomaly, event, daily_summary_delivery, rule_run, change_counter, event_rollup, ai_insight_cache, incident  # noqa: F401
 
 
 def create_all() -> None:
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import time
+
+from sqlalchemy.pool import QueuePool
+
+from sentinelops.core.metrics import DB_POOL_CHECKOUTS, DB_POOL_WAIT
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool + checkout 대기 시간 측정.
+    SQLAlchemy pool event에는 "checkout 대기 시작" 훅이 없어서 _do_get을 감싼다.
+    (pool이 가득 차서 기다린 시간 + 새 커넥션 connect 시간이 같이 잡힘)
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+            DB_POOL_CHECKOUTS.inc()
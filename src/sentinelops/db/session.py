@@ -4,8 +4,27 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from sentinelops.core.config import settings
+from sentinelops.core.metrics import gauge_callback
+from sentinelops.db.pool import InstrumentedQueuePool
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(settings.database_url, pool_pre_ping=True, poolclass=InstrumentedQueuePool)
+
+# pool 상태는 scrape 시점에 읽는다 (hot path 비용 0)
+gauge_callback(
+    "sentinelops_db_pool_checked_out",
+    "Connections currently checked out from the pool.",
+    lambda: engine.pool.checkedout(),
+)
+gauge_callback(
+    "sentinelops_db_pool_overflow",
+    "Connections opened beyond pool_size (negative = idle capacity not yet opened).",
+    lambda: engine.pool.overflow(),
+)
+gauge_callback(
+    "sentinelops_db_pool_size",
+    "Configured pool_size.",
+    lambda: engine.pool.size(),
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,235 @@
+"""
+Slack Incoming Webhook delivery client (공용)
+
+- requests.Session + HTTPAdapter connection pool → webhook host별 keep-alive 재사용
+  (메시지마다 TCP+TLS handshake 안 함)
+- webhook URL별 token bucket: Slack webhook 한도(대략 초당 1건 + 짧은 burst)를 넘기 전에 client에서 조절
+- 429 / 5xx: Retry-After(초)만큼 그 webhook의 bucket을 멈추고 재시도.
+  다른 thread에서 같은 webhook으로 보내는 메시지도 같이 기다린다
+- 전체 대기(rate limit + retry)는 max_wait_sec 안으로 제한
+- send_many: 여러 메시지를 bounded thread pool로 동시에 전송 (webhook이 다르면 서로 안 막힘)
+
+알림(rules_runner)과 summary 전송이 같은 client(get_slack_client())를 공유한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sentinelops.core.config import settings
+from sentinelops.core.metrics import SLACK_LATENCY
+
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_DEFAULT_RETRY_AFTER_SEC = 1.0
+_MAX_RETRY_AFTER_SEC = 60.0
+
+
+class SlackDeliveryError(RuntimeError):
+    def __init__(self, message: str, *, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class SlackResponse:
+    status_code: int
+    text: str
+    attempts: int
+    waited_sec: float        # rate limit / Retry-After로 기다린 시간 합
+
+
+class _TokenBucket:
+    """초당 rate개, 최대 burst개까지 모아둘 수 있는 bucket (thread-safe)"""
+
+    def __init__(self, rate_per_sec: float, burst: int) -> None:
+        self._rate = max(rate_per_sec, 1e-6)
+        self._capacity = float(max(burst, 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """token 1개를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 돌려준다"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self, deadline: float) -> float:
+        wait = self._reserve()
+        if time.monotonic() + wait > deadline:
+            with self._lock:
+                self._tokens += 1.0  # 예약 취소
+            raise SlackDeliveryError("slack rate limit wait exceeds max_wait_sec")
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def block_for(self, seconds: float) -> None:
+        # Retry-After: 이 webhook으로 가는 모든 전송을 멈춘다
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _retry_after_sec(resp: requests.Response) -> float:
+    raw = resp.headers.get("Retry-After")
+    try:
+        value = float(raw) if raw is not None else _DEFAULT_RETRY_AFTER_SEC
+    except ValueError:
+        value = _DEFAULT_RETRY_AFTER_SEC
+    return min(max(value, 0.0), _MAX_RETRY_AFTER_SEC)
+
+
+class SlackClient:
+    def __init__(
+        self,
+        *,
+        timeout_sec: Optional[float] = None,
+        rate_per_sec: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        max_wait_sec: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        self.timeout_sec = timeout_sec or settings.slack_timeout_sec
+        self.rate_per_sec = rate_per_sec or settings.slack_rate_per_sec
+        self.burst = burst or settings.slack_burst
+        self.max_attempts = max(1, max_attempts or settings.slack_max_attempts)
+        self.max_wait_sec = max_wait_sec if max_wait_sec is not None else settings.slack_max_wait_sec
+        self.max_concurrency = max(1, max_concurrency or settings.slack_max_concurrency)
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,                     # webhook host 수 (보통 hooks.slack.com 1개)
+            pool_maxsize=self.max_concurrency * 2,  # host당 keep-alive connection 수
+            max_retries=0,                          # retry는 아래에서 Retry-After 기준으로
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _bucket(self, url: str) -> _TokenBucket:
+        bucket = self._buckets.get(url)
+        if bucket is None:
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(url, _TokenBucket(self.rate_per_sec, self.burst))
+        return bucket
+
+    def post(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        *,
+        target: str,
+        timeout_sec: Optional[float] = None,
+        max_wait_sec: Optional[float] = None,
+    ) -> SlackResponse:
+        """
+        webhook 1건 전송. 2xx면 SlackResponse, 끝내 실패하면 SlackDeliveryError.
+        - target: metric label (alert / summary)
+        - max_wait_sec: rate limit + Retry-After 대기 총량 (기본 SLACK_MAX_WAIT_SEC)
+        """
+        timeout = timeout_sec or self.timeout_sec
+        deadline = time.monotonic() + (self.max_wait_sec if max_wait_sec is None else max_wait_sec)
+        bucket = self._bucket(url)
+
+        waited = 0.0
+        last_error = "no attempt"
+        last_status: Optional[int] = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                waited += bucket.acquire(deadline)
+            except SlackDeliveryError:
+                if attempt == 1:
+                    raise
+                break
+
+            started = time.perf_counter()
+            code = "error"
+            try:
+                resp = self._session.post(url, json=payload, timeout=timeout)
+                code = str(resp.status_code)
+            except requests.ConnectionError as e:
+                # 연결 실패 / 끊긴 keep-alive connection: 잠깐 쉬고 재시도
+                # (requests 에러 문구에는 webhook path(= secret)가 들어 있어서 class 이름만 남긴다)
+                code = type(e).__name__
+                last_error, last_status = type(e).__name__, None
+                bucket.block_for(min(_DEFAULT_RETRY_AFTER_SEC * attempt, 5.0))
+                continue
+            except requests.Timeout as e:
+                # 응답만 늦었을 수 있음(이미 전송됐을 수 있음) → 중복 메시지 방지를 위해 재시도 안 함
+                code = type(e).__name__
+                raise SlackDeliveryError(f"Slack webhook timed out: {type(e).__name__}") from None
+            finally:
+                SLACK_LATENCY.labels(target, code).observe(time.perf_counter() - started)
+
+            if resp.status_code < 400:
+                return SlackResponse(resp.status_code, (resp.text or "").strip(), attempt, round(waited, 3))
+
+            last_error, last_status = f"HTTP {resp.status_code}", resp.status_code
+            if resp.status_code not in _RETRY_STATUS:
+                break
+            retry_after = _retry_after_sec(resp)
+            if time.monotonic() + retry_after > deadline:
+                break
+            bucket.block_for(retry_after)
+
+        raise SlackDeliveryError(f"Slack webhook failed: {last_error}", status_code=last_status)
+
+    def send_many(
+        self,
+        messages: list[tuple[str, dict[str, Any]]],
+        *,
+        target: str,
+        timeout_sec: Optional[float] = None,
+        max_wait_sec: Optional[float] = None,
+    ) -> list[SlackResponse | SlackDeliveryError]:
+        """
+        (url, payload) 여러 건을 동시에 전송. 결과는 입력 순서대로 (실패는 예외 객체로).
+        """
+        def _send(item: tuple[str, dict[str, Any]]) -> SlackResponse | SlackDeliveryError:
+            url, payload = item
+            try:
+                return self.post(url, payload, target=target, timeout_sec=timeout_sec, max_wait_sec=max_wait_sec)
+            except SlackDeliveryError as e:
+                return e
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="slack")
+        return list(self._pool.map(_send, messages))
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+        self._session.close()
+
+
+_client: Optional[SlackClient] = None
+_client_lock = threading.Lock()
+
+
+def get_slack_client() -> SlackClient:
+    """프로세스 공용 client (connection pool / rate limit 상태 공유)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SlackClient()
+        return _client
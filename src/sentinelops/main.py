@@ -3,15 +3,40 @@ from fastapi import FastAPI
 from sentinelops.api.v1.routers.health import router as health_router
 from sentinelops.api.v1.routers.stripe_webhook import router as stripe_router
 from sentinelops.api.v1.routers.anomalies import router as anomalies_router
+from sentinelops.api.v1.routers.rule_runs import router as rule_runs_router
+from sentinelops.api.v1.routers.export import router as export_router
+from sentinelops.api.v1.routers.events import router as events_router
+from sentinelops.api.v1.routers.incidents import router as incidents_router
+from sentinelops.api.v1.routers.metrics import router as metrics_router
+from sentinelops.api.v1.routers.prometheus import router as prometheus_router
 from sentinelops.core.config import settings
+from sentinelops.core.logging import setup_logging
+from sentinelops.core.profiling import ProfilingMiddleware
+from sentinelops.services.anomaly_stream import anomaly_broadcaster
+
+setup_logging()
 
 app = FastAPI(title="SentinelOps", version="0.1.0")
 app.include_router(health_router, prefix="/api/v1")
 app.include_router(stripe_router, prefix="/api/v1")
 app.include_router(anomalies_router, prefix="/api/v1")
+app.include_router(rule_runs_router, prefix="/api/v1")
+app.include_router(export_router, prefix="/api/v1")
+app.include_router(events_router, prefix="/api/v1")
+app.include_router(incidents_router, prefix="/api/v1")
+app.include_router(metrics_router, prefix="/api/v1")
+app.include_router(prometheus_router)
+
+# 비활성이면 middleware 자체를 등록하지 않는다 (요청당 비용 0)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
 
 @app.on_event("startup")
 def validate_settings() -> None:
     if settings.env == "local" and not settings.db_password:
         raise RuntimeError("DB_PASSWORD is missing. Check your .env file.")
 
+
+@app.on_event("shutdown")
+def stop_anomaly_listener() -> None:
+    anomaly_broadcaster.stop()
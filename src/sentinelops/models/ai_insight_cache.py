@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sentinelops.db.base import Base
+
+
+class AiInsightCache(Base):
+    """
+    AI insight 결과 캐시 (content-addressed).
+
+    - cache_key: sha256(정규화한 ai_payload + model + prompt version)
+      → 같은 입력이면 재전송 / 재시도 / 조용한 날 반복에도 OpenAI를 다시 부르지 않음
+    - 성공한 결과만 저장 (에러는 캐시하지 않음)
+    - expires_at 지난 row / 오래 안 쓴 row는 저장 시점에 정리 (TTL + max entries)
+    """
+    __tablename__ = "ai_insight_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    model: Mapped[str] = mapped_column(String(100))
+    prompt_version: Mapped[str] = mapped_column(String(50))
+    summary_text: Mapped[str] = mapped_column(Text)
+
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
@@ -1,12 +1,27 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    SmallInteger,
+    String,
+    false,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sentinelops.db.base import Base
 
+# high > medium > low (모르는 값은 0). 정렬용 rank를 DB가 저장 시점에 계산한다.
+SEVERITY_RANK_SQL = (
+    "CASE severity WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 0 END"
+)
+
 
 class Anomaly(Base):
     __tablename__ = "anomalies"
@@ -16,6 +31,10 @@ class Anomaly(Base):
     rule_code: Mapped[str] = mapped_column(String(50), index=True)
     # v0.2에서는 severity/status를 string으로 두자. (단순 + 빠름)
     severity: Mapped[str] = mapped_column(String(10), index=True)
+    # generated column: severity에서 자동 계산 (직접 쓰지 않음)
+    severity_rank: Mapped[int] = mapped_column(
+        SmallInteger, Computed(SEVERITY_RANK_SQL, persisted=True)
+    )
 
     title: Mapped[str] = mapped_column(String(200))
     # v0.2에서는 severity/status를 string으로 두자. (단순 + 빠름)
@@ -33,8 +52,42 @@ class Anomaly(Base):
 
     evidence: Mapped[dict] = mapped_column(JSONB, default=dict)
 
+    # 묶인 incident (services.incidents). 같은 family + 이어지는 window면 같은 incident
+    incident_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("incidents.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+
+    # ✅ 데모 데이터 플래그 (title prefix / evidence.demo 대신 인덱스 가능한 컬럼)
+    is_demo: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+
     acknowledged_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+# open anomalies 대시보드(status 필터 + severity/최신순 정렬)를 index scan으로 처리
+# id는 keyset pagination tie-breaker
+Index(
+    "ix_anomalies_status_severity_rank_detected_at",
+    Anomaly.status,
+    Anomaly.severity_rank.desc(),
+    Anomaly.detected_at.desc(),
+    Anomaly.id.desc(),
+)
+
+# recent 정렬 keyset pagination: (detected_at, id) range scan
+Index(
+    "ix_anomalies_detected_at_id",
+    Anomaly.detected_at.desc(),
+    Anomaly.id.desc(),
+)
+
+# demo_only 필터: 데모 row만 담긴 작은 partial index
+Index(
+    "ix_anomalies_demo_status_detected_at",
+    Anomaly.status,
+    Anomaly.detected_at.desc(),
+    postgresql_where=Anomaly.is_demo,
+)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sentinelops.db.base import Base
+
+
+class ChangeCounter(Base):
+    """
+    테이블 단위 변경 버전 카운터 (예: name="anomalies").
+
+    - 쓰기 트랜잭션 안에서 +1 → 데이터와 같이 commit되므로
+      "버전은 올라갔는데 데이터는 아직 안 보이는" 구간이 없음
+    - 읽기 쪽은 row 1개만 읽고 ETag / 응답 캐시 키로 사용
+    """
+    __tablename__ = "change_counters"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0)
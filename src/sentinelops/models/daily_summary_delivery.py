@@ -3,34 +3,50 @@ from __future__ import annotations
 from datetime import datetime, date
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, String, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sentinelops.db.base import Base
 
+# 정기 실행(now 기준 kind 기본 window)의 window_key. custom window는 "YYYYMMDDTHHMMZ-YYYYMMDDTHHMMZ"
+SCHEDULED_WINDOW_KEY = "scheduled"
+
 
 class DailySummaryDelivery(Base):
     """
     하루 1회 전송(idempotency)을 위한 delivery ledger.
 
-    - kind + summary_date 유니크로 '하루 1번만' 보장
+    - kind + summary_date + channel + window_key 유니크로 'channel마다 하루 1번만' 보장
+      (--from/--to custom window는 window_key가 달라서 정기 실행 row를 건드리지 않음)
     - status:
-        - pending: 실행 시작(락 역할)
+        - pending: row만 생성됨 (아직 아무 worker도 claim 안 함)
+        - sending: worker가 claim해서 실행 중 (lease_expires_at까지 유효)
         - sent: 전송 완료
         - failed: 전송 실패(원하면 다음 실행에서 재시도 가능)
         - skipped: 이미 sent였거나 정책상 스킵
     """
     __tablename__ = "daily_summary_deliveries"
     __table_args__ = (
-        UniqueConstraint("kind", "summary_date", name="uq_daily_summary_kind_date"),
+        UniqueConstraint(
+            "kind", "summary_date", "channel", "window_key", name="uq_daily_summary_kind_date_channel_window"
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     kind: Mapped[str] = mapped_column(String(50), index=True)  # 예: "daily_ops"
     summary_date: Mapped[date] = mapped_column(Date, index=True)  # window_end 기준 날짜
+    # 전송 대상 (SLACK_SUMMARY_WEBHOOKS의 이름, "default" = SLACK_WEBHOOK_URL)
+    channel: Mapped[str] = mapped_column(String(50), default="default", server_default="default")
+    # 정기 실행 = SCHEDULED_WINDOW_KEY, custom window = window 범위 (trend history는 정기 실행만)
+    window_key: Mapped[str] = mapped_column(
+        String(40), default=SCHEDULED_WINDOW_KEY, server_default=SCHEDULED_WINDOW_KEY
+    )
 
     status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+    # sending 상태의 claim 만료 시각 (worker가 죽어도 이 시각 이후 다른 worker가 다시 claim)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     window_start: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     window_end: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -39,9 +55,15 @@ class DailySummaryDelivery(Base):
 
     used_ai: Mapped[Optional[bool]] = mapped_column(nullable=True)
     ai_error: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    # OpenAI로 보낸 prompt 크기 (AI latency/비용 추적용, cache hit이면 NULL)
+    ai_prompt_chars: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    ai_prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     slack_response: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
 
+    # 전송한 summary의 집계/요약 값 (다음 summary의 trend 비교용, reporting.trends)
+    snapshot: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
@@ -9,6 +9,10 @@ from sentinelops.db.base import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # 시간 범위 조회 / export / keyset pagination 공용
+        Index("ix_events_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     source: Mapped[str] = mapped_column(String(50), default="stripe", index=True)
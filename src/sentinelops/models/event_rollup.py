@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sentinelops.db.base import Base
+
+
+class EventRollup(Base):
+    """
+    events를 시간 bucket 단위로 미리 센 집계 (timeseries / 리포트용).
+
+    - bucket_seconds: 60(1분) / 3600(1시간)
+    - event_type: null은 ''로 저장 (PK에 null 불가)
+    - refresh는 bucket 전체를 다시 세서 덮어씀 → 여러 번 돌려도 결과 동일
+    """
+    __tablename__ = "event_rollups"
+
+    bucket_seconds: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    event_count: Mapped[int] = mapped_column(BigInteger)
+
+
+class RollupWatermark(Base):
+    """
+    rollup이 어디까지 반영됐는지 (refreshed_until 이전 events는 rollup에 포함).
+    그 이후 구간은 조회 시 raw events에서 직접 센다.
+    """
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    refreshed_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, SmallInteger, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sentinelops.db.base import Base
+
+
+class Incident(Base):
+    """
+    같은 rule family + 겹치거나 이어지는 window의 anomaly들을 묶은 단위.
+
+    - anomaly가 생길 때마다 incremental하게 갱신 (services.incidents.attach_to_incident)
+    - window_start / window_end: 묶인 anomaly window 전체 범위
+    - severity / severity_rank: 묶인 anomaly 중 최고값
+    - rule_codes: 묶인 rule 목록 (등장 순, 중복 없음)
+    - 상태는 따로 저장하지 않고 묶인 anomaly 상태로 판단한다
+      (anomaly 전이 API를 그대로 쓰기 위해. open anomaly가 있으면 열린 incident)
+    """
+    __tablename__ = "incidents"
+    __table_args__ = (
+        # attach 시 같은 family의 최근 incident 조회 (window_end 역순)
+        Index("ix_incidents_family_window_end", "family", "window_end"),
+        # 목록 keyset pagination
+        Index("ix_incidents_last_detected_at_id", "last_detected_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    family: Mapped[str] = mapped_column(String(50))
+    title: Mapped[str] = mapped_column(String(200))
+    severity: Mapped[str] = mapped_column(String(10))
+    severity_rank: Mapped[int] = mapped_column(SmallInteger, default=0)
+
+    rule_codes: Mapped[list] = mapped_column(JSONB, default=list)
+    anomaly_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    window_start: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    window_end: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    first_detected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    last_detected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sentinelops.db.base import Base
+
+
+class RuleRun(Base):
+    """
+    룰 1회 실행의 비용 기록 (cost accounting).
+
+    - wall_ms: 룰 함수 전체 실행 시간
+    - db_ms / statement_count / rows_scanned: SQLAlchemy cursor event hook으로 측정
+      (rows_scanned는 cursor.rowcount 합계 = 반환/변경된 row 수 기준)
+    - anomalies_created: 이번 실행에서 새로 만든 anomaly 수
+    """
+    __tablename__ = "rule_runs"
+    __table_args__ = (
+        Index("ix_rule_runs_rule_code_started_at", "rule_code", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    rule_code: Mapped[str] = mapped_column(String(50))
+    status: Mapped[str] = mapped_column(String(20), index=True)  # ok / error
+
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    wall_ms: Mapped[float] = mapped_column(Float)
+    db_ms: Mapped[float] = mapped_column(Float)
+    statement_count: Mapped[int] = mapped_column(Integer)
+    rows_scanned: Mapped[int] = mapped_column(Integer)
+    anomalies_created: Mapped[int] = mapped_column(Integer)
+
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,127 @@
+"""
+Anomaly list 직렬화 벤치마크 (DB 없이 실행 가능)
+
+비교
+- orm:  row → Anomaly ORM 객체 → AnomalyOut.model_validate → AnomalyListOut.model_dump_json
+- fast: row → dict(mapping) → orjson.dumps
+
+사용
+    python -m sentinelops.scripts.bench_anomaly_list_serialization --rows 200 --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sentinelops.api.v1.schemas.anomaly import AnomalyListOut, AnomalyOut
+from sentinelops.core import fast_json
+from sentinelops.models.anomaly import Anomaly
+
+
+def _fake_rows(n: int) -> list[tuple[Any, ...]]:
+    # DB에서 읽어 온 row tuple을 흉내 (ANOMALY_LIST_COLUMNS 순서)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(n):
+        window_start = now - timedelta(minutes=30 * i)
+        rows.append(
+            (
+                i + 1,
+                "payment_failure_spike",
+                "high",
+                "Payment failure spike",
+                "open",
+                None,
+                None,
+                window_start,
+                window_start + timedelta(minutes=30),
+                window_start + timedelta(minutes=3),
+                {"failed_count": 5 + i, "threshold": 3, "window_minutes": 30},
+                None,
+                None,
+                window_start + timedelta(minutes=3),
+                None,
+            )
+        )
+    return rows
+
+
+_KEYS = (
+    "id",
+    "rule_code",
+    "severity",
+    "title",
+    "status",
+    "event_type",
+    "provider_event_id",
+    "window_start",
+    "window_end",
+    "detected_at",
+    "evidence",
+    "acknowledged_at",
+    "resolved_at",
+    "updated_at",
+    "incident_id",
+)
+
+
+def _orm_path(rows: list[tuple[Any, ...]]) -> bytes:
+    objs = [Anomaly(**dict(zip(_KEYS, r, strict=True))) for r in rows]
+    items = [AnomalyOut.model_validate(o) for o in objs]
+    return AnomalyListOut(items=items, count=len(items)).model_dump_json().encode("utf-8")
+
+
+def _fast_path(rows: list[tuple[Any, ...]]) -> bytes:
+    items = [dict(zip(_KEYS, r, strict=True)) for r in rows]
+    return fast_json.dumps({"items": items, "count": len(items), "next_cursor": None})
+
+
+def _measure(fn: Callable[[list[tuple[Any, ...]]], bytes], rows: list[tuple[Any, ...]], iterations: int) -> dict[str, float]:
+    for _ in range(min(20, iterations)):
+        fn(rows)  # warm-up
+
+    samples: list[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn(rows)
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    # 한 번 실행하는 동안의 최대 할당량
+    tracemalloc.start()
+    fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "peak_kib": peak / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = _fake_rows(args.rows)
+
+    print(f"rows={args.rows} iterations={args.iterations}")
+    for name, fn in (("orm", _orm_path), ("fast", _fast_path)):
+        r = _measure(fn, rows, args.iterations)
+        print(
+            f"{name:>5}: p50={r['p50_ms']:.3f}ms p99={r['p99_ms']:.3f}ms "
+            f"peak_alloc={r['peak_kib']:.1f}KiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""
+Slack 전송 벤치마크 (로컬 HTTP stub, 실제 Slack/네트워크 없이 실행 가능)
+
+비교
+- naive:  메시지마다 requests.post (매번 새 connection, 순차)
+- pooled: SlackClient.send_many (keep-alive pool + 동시 전송 + webhook별 rate limit)
+
+stub은 --latency-ms만큼 늦게 응답하고, --rate-limit-every N이면 N번째 요청마다
+429 + Retry-After를 돌려준다 (pooled는 재시도, naive는 실패로 센다).
+
+사용
+    python -m sentinelops.scripts.bench_slack_delivery --messages 200 --webhooks 4 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+import requests
+
+from sentinelops.integrations.slack.client import SlackClient, SlackDeliveryError
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True  # 작은 응답이 delayed ACK에 걸리지 않게
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server: _StubServer = self.server  # type: ignore[assignment]
+        n = next(server.counter)
+        if server.latency_sec:
+            time.sleep(server.latency_sec)
+
+        if server.rate_limit_every and n % server.rate_limit_every == 0:
+            body, status = b"rate_limited", 429
+        else:
+            body, status = b"ok", 200
+
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", str(server.retry_after_sec))
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency_sec: float, rate_limit_every: int, retry_after_sec: float) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency_sec = latency_sec
+        self.rate_limit_every = rate_limit_every
+        self.retry_after_sec = retry_after_sec
+        self.counter = itertools.count(1)
+
+
+def _naive(messages: list[tuple[str, dict[str, Any]]]) -> tuple[int, list[float]]:
+    failures = 0
+    samples: list[float] = []
+    for url, payload in messages:
+        t0 = time.perf_counter()
+        try:
+            resp = requests.post(url, json=payload, timeout=10)
+            failures += resp.status_code >= 400
+        except requests.RequestException:
+            failures += 1
+        samples.append((time.perf_counter() - t0) * 1000)
+    return failures, samples
+
+
+def _pooled(client: SlackClient) -> Callable[[list[tuple[str, dict[str, Any]]]], tuple[int, list[float]]]:
+    def run(messages: list[tuple[str, dict[str, Any]]]) -> tuple[int, list[float]]:
+        results = client.send_many(messages, target="bench")
+        return sum(1 for r in results if isinstance(r, SlackDeliveryError)), []
+
+    return run
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--webhooks", type=int, default=4, help="distinct webhook paths (rate limit is per webhook)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub response latency")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="stub returns 429 every N requests (0 = never)")
+    parser.add_argument("--retry-after", type=float, default=0.2, help="Retry-After seconds for stub 429s")
+    parser.add_argument("--rate", type=float, default=1000.0,
+                        help="client token bucket rate per webhook (default high so the stub, not the limiter, is measured)")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server = _StubServer(args.latency_ms / 1000, args.rate_limit_every, args.retry_after)
+    threading.Thread(target=server.serve_forever, name="slack-stub", daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    messages = [
+        (f"{base}/services/hook{i % args.webhooks}", {"text": f"bench message {i}"})
+        for i in range(args.messages)
+    ]
+    client = SlackClient(
+        rate_per_sec=args.rate,
+        burst=args.burst,
+        max_concurrency=args.concurrency,
+        max_wait_sec=60.0,
+    )
+
+    print(
+        f"messages={args.messages} webhooks={args.webhooks} latency={args.latency_ms}ms "
+        f"rate_limit_every={args.rate_limit_every} concurrency={args.concurrency}"
+    )
+    try:
+        for name, fn in (("naive", _naive), ("pooled", _pooled(client))):
+            t0 = time.perf_counter()
+            failures, samples = fn(messages)
+            elapsed = time.perf_counter() - t0
+            line = f"{name:>6}: total={elapsed * 1000:.1f}ms throughput={len(messages) / elapsed:.1f} msg/s failures={failures}"
+            if samples:
+                line += f" p50={statistics.median(samples):.2f}ms"
+            print(line)
+    finally:
+        client.close()
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,26 +1,64 @@
 from __future__ import annotations
 
+import argparse
 from datetime import datetime, timezone
 
-from sentinelops.services.reporting.daily_summary import run_daily_ops_summary
+from sentinelops.core.logging import setup_logging
+from sentinelops.core.profiling import profiled_job
+from sentinelops.services.reporting.delivery.slack import DEFAULT_CHANNEL
+from sentinelops.services.reporting.kinds import SUMMARY_KINDS
+from sentinelops.services.reporting.runner import SummaryJob, parse_summary_job, run_summary_jobs
 
 
 def main() -> int:
+    setup_logging(persist_rate_limit=True)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kind", choices=sorted(SUMMARY_KINDS), default="daily_ops")
+    parser.add_argument("--channel", action="append", default=None,
+                        help="summary channel (repeatable, default: 'default' = SLACK_WEBHOOK_URL)")
+    parser.add_argument("--job", action="append", type=parse_summary_job, default=None,
+                        help="extra job as kind[:channel] (repeatable), e.g. weekly_ops:finance")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="max concurrent jobs (default: SUMMARY_MAX_WORKERS)")
+    parser.add_argument("--from", dest="window_start", type=datetime.fromisoformat, default=None,
+                        help="custom window start (ISO 8601, UTC if no offset)")
+    parser.add_argument("--to", dest="window_end", type=datetime.fromisoformat, default=None,
+                        help="custom window end (ISO 8601, UTC if no offset)")
+    args = parser.parse_args()
+
+    # --job만 주면 그 job들만, 아니면 --kind × --channel
+    jobs: list[SummaryJob] = []
+    if args.channel or not args.job:
+        jobs = [
+            SummaryJob(args.kind, channel, args.window_start, args.window_end)
+            for channel in (args.channel or [DEFAULT_CHANNEL])
+        ]
+    for job in args.job or []:
+        jobs.append(SummaryJob(job.kind, job.channel, args.window_start, args.window_end))
+
     now = datetime.now(timezone.utc)
-    result = run_daily_ops_summary(now=now)  # ✅ dict 반환
-
-    if result.get("skipped"):
-        print(f"⏭️ Daily summary skipped: {result.get('skip_reason')}")
-        return 0
-
-    print(f"✅ Daily summary delivered: {result.get('delivered')}")
-    print(f"🤖 AI used: {result.get('used_ai')}")
-    if result.get("ai_error"):
-        print(f"AI insight error: {result.get('ai_error')}")
-    if result.get("message_preview"):
-        print("----- message preview -----")
-        print(result["message_preview"])
-    return 0
+    with profiled_job("run_summary_jobs" if len(jobs) > 1 else f"run_{jobs[0].kind}_summary"):
+        results = run_summary_jobs(jobs, max_workers=args.workers, now=now)
+
+    failed = 0
+    for result in results:
+        label = f"{result.get('kind')}[{result.get('channel')}]"
+        if result.get("error"):
+            failed += 1
+            print(f"❌ {label} summary failed: {result['error']}")
+            continue
+        if result.get("skipped"):
+            print(f"⏭️ {label} summary skipped: {result.get('skip_reason')}")
+            continue
+
+        print(f"✅ {label} summary delivered: {result.get('delivered')}")
+        print(f"🤖 AI used: {result.get('used_ai')}")
+        if result.get("ai_error"):
+            print(f"AI insight error: {result.get('ai_error')}")
+        if result.get("message_preview") and len(results) == 1:
+            print("----- message preview -----")
+            print(result["message_preview"])
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
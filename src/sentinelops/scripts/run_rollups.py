@@ -0,0 +1,23 @@
+from sentinelops.core.logging import setup_logging
+from sentinelops.db.session import SessionLocal
+from sentinelops.services.event_rollups import refresh_event_rollups
+
+
+def main() -> int:
+    setup_logging(persist_rate_limit=True)
+    # 1~5분 주기로 cron/scheduler에서 실행 (idempotent)
+    db = SessionLocal()
+    try:
+        result = refresh_event_rollups(db)
+    finally:
+        db.close()
+
+    print(
+        f"event_rollups refreshed: from={result['from'].isoformat()} "
+        f"until={result['until'].isoformat()} upserted_rows={result['upserted_rows']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,26 @@
-from sentinelops.db.session import SessionLocal
-from sentinelops.services.rules_runner import run_all_rules
+from sentinelops.core.logging import setup_logging
+from sentinelops.core.profiling import profiled_job
+from sentinelops.services.rules_runner import run_all_rules_parallel
 
 
 def main() -> int:
-    db = SessionLocal()
-    try:
-        run_all_rules(db)
-        return 0
-    finally:
-        db.close()
+    setup_logging(persist_rate_limit=True)
+    with profiled_job("run_rules"):
+        outcomes = run_all_rules_parallel()
+
+    for o in outcomes:
+        line = f"[{o.status}] {o.rule_code} ({o.duration_ms}ms)"
+        if o.stats:
+            line += (
+                f" db={o.stats.db_ms}ms stmts={o.stats.statement_count}"
+                f" rows={o.stats.rows_scanned} anomalies={o.stats.anomalies_created}"
+            )
+        if o.error:
+            line += f" - {o.error}"
+        print(line)
+
+    # 하나라도 실패하면 스케줄러가 알 수 있게 non-zero
+    return 0 if all(o.status == "ok" for o in outcomes) else 1
 
 
 if __name__ == "__main__":
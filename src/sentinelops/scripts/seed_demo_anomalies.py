@@ -3,10 +3,10 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import true as sql_true
 
 from sentinelops.db.session import SessionLocal
 from sentinelops.models.anomaly import Anomaly
+from sentinelops.services.anomaly_changes import record_anomaly_change
 
 
 def _floor_to_minutes(dt: datetime, minutes: int) -> datetime:
@@ -16,14 +16,12 @@ def _floor_to_minutes(dt: datetime, minutes: int) -> datetime:
 
 
 def _demo_open_exists(db: Session, rule_code: str) -> Anomaly | None:
-    # ✅ demo를 title prefix 또는 evidence.demo=true 둘 중 하나로 판정
+    # ✅ demo 판정은 is_demo 컬럼으로 (partial index 사용)
     return (
         db.query(Anomaly)
         .filter(Anomaly.rule_code == rule_code)
         .filter(Anomaly.status == "open")
-        .filter(
-            (Anomaly.title.ilike("[demo]%")) | (Anomaly.evidence["demo"].as_boolean() == sql_true())
-        )
+        .filter(Anomaly.is_demo)
         .order_by(Anomaly.detected_at.desc())
         .first()
     )
@@ -55,9 +53,12 @@ def _create_demo_anomaly(
         window_end=window_end,
         detected_at=now,
         evidence=evidence,
+        is_demo=True,
     )
 
     db.add(row)
+    db.flush()
+    record_anomaly_change(db, change="created", ids=[row.id], status="open", rule_code=rule_code)
     db.commit()
     db.refresh(row)
     return row
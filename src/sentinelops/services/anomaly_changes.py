@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from sentinelops.models.change_counter import ChangeCounter
+
+ANOMALIES_COUNTER = "anomalies"
+
+# LISTEN/NOTIFY 채널 (live feed)
+ANOMALY_NOTIFY_CHANNEL = "anomaly_changes"
+
+
+def bump_anomaly_version(db: Session) -> None:
+    """
+    anomaly insert / status 변경과 같은 트랜잭션에서 호출한다. (commit은 호출자 책임)
+    row가 없어도 동작하도록 upsert.
+    """
+    stmt = insert(ChangeCounter).values(name=ANOMALIES_COUNTER, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChangeCounter.name],
+        set_={"version": ChangeCounter.version + 1},
+    )
+    db.execute(stmt)
+
+
+def current_anomaly_version(db: Session) -> int:
+    stmt = select(ChangeCounter.version).where(ChangeCounter.name == ANOMALIES_COUNTER)
+    return int(db.execute(stmt).scalar_one_or_none() or 0)
+
+
+def record_anomaly_change(
+    db: Session,
+    *,
+    change: str,
+    ids: list[int],
+    status: Optional[str] = None,
+    rule_code: Optional[str] = None,
+) -> None:
+    """
+    anomaly 쓰기 경로의 공통 후처리 (같은 트랜잭션 안에서 호출):
+    - 버전 +1 (ETag / 응답 캐시)
+    - pg_notify → live feed. NOTIFY는 commit 시점에만 전달되고 rollback되면 사라짐
+
+    change: "created" | "status_changed" | "extended"
+    """
+    bump_anomaly_version(db)
+
+    payload: dict[str, object] = {"change": change, "ids": ids}
+    if status is not None:
+        payload["status"] = status
+    if rule_code is not None:
+        payload["rule_code"] = rule_code
+
+    db.execute(select(func.pg_notify(ANOMALY_NOTIFY_CHANNEL, json.dumps(payload, separators=(",", ":")))))
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, object_session
+
+from sentinelops.models.anomaly import Anomaly
+from sentinelops.services.anomaly_changes import record_anomaly_change
 
 ALLOWED_TRANSITIONS: dict[str, set[str]] = {
     "open": {"acknowledged", "resolved"},
@@ -37,4 +44,155 @@ def apply_status_change(row, new_status: str):
         row.acknowledged_at = None
         row.resolved_at = None
 
+    # 목록 캐시 / ETag 버전 + live feed 알림 (호출자의 commit과 함께 반영)
+    db = object_session(row)
+    if db is not None:
+        record_anomaly_change(db, change="status_changed", ids=[row.id], status=new_status)
+
     return row
+
+
+# -----------------------------
+# Bulk (set-based) transitions
+# -----------------------------
+BULK_MAX_ANOMALIES = 500
+
+
+@dataclass(frozen=True)
+class BulkTransitionOutcome:
+    id: int
+    outcome: str  # "updated" | "noop" | "invalid_transition" | "not_found"
+    status: Optional[str]  # 호출 후 상태 (not_found면 None)
+
+
+def _allowed_sources(new_status: str) -> list[str]:
+    # ALLOWED_TRANSITIONS를 뒤집어서 "new_status로 갈 수 있는 현재 상태" 목록
+    return sorted(src for src, targets in ALLOWED_TRANSITIONS.items() if new_status in targets)
+
+
+def _transition_values(new_status: str) -> dict[str, Any]:
+    # apply_status_change와 같은 timestamp 규칙을 SQL 식으로 표현
+    now = datetime.now(timezone.utc)
+    values: dict[str, Any] = {"status": new_status}
+
+    if new_status == "acknowledged":
+        values["acknowledged_at"] = now
+        values["resolved_at"] = None
+    elif new_status == "resolved":
+        values["acknowledged_at"] = func.coalesce(Anomaly.acknowledged_at, now)
+        values["resolved_at"] = now
+    elif new_status == "open":
+        values["acknowledged_at"] = None
+        values["resolved_at"] = None
+
+    return values
+
+
+@dataclass(frozen=True)
+class BulkTransitionResult:
+    outcomes: list[BulkTransitionOutcome]
+    # filter mode: cap 때문에 이번에 처리하지 못한 (전이 가능한) row 수. ids mode는 항상 0
+    remaining: int = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.remaining > 0
+
+
+def _bulk_filter(
+    stmt,
+    *,
+    rule_code: Optional[str],
+    detected_from: Optional[datetime],
+    detected_to: Optional[datetime],
+):
+    if rule_code is not None:
+        stmt = stmt.where(Anomaly.rule_code == rule_code)
+    if detected_from is not None:
+        stmt = stmt.where(Anomaly.detected_at >= detected_from)
+    if detected_to is not None:
+        stmt = stmt.where(Anomaly.detected_at < detected_to)
+    return stmt
+
+
+def bulk_apply_status_change(
+    db: Session,
+    new_status: str,
+    *,
+    ids: Optional[list[int]] = None,
+    rule_code: Optional[str] = None,
+    detected_from: Optional[datetime] = None,
+    detected_to: Optional[datetime] = None,
+) -> BulkTransitionResult:
+    """
+    여러 anomaly를 UPDATE ... WHERE status IN (...) RETURNING 한 번으로 전이한다.
+    - 대상: ids 또는 filter(rule_code + detected_at 범위), 최대 BULK_MAX_ANOMALIES개
+    - filter mode는 전이 가능한 상태의 row만 골라서 cap을 채운다
+      (이미 ack/resolve된 오래된 row가 cap을 먹지 않게). 남은 수는 remaining으로 알려줌
+    - 전이 검증은 WHERE status IN (허용된 이전 상태)로 SQL 안에서 처리
+    - 반영되지 않은 row는 한 번 더 읽어서 noop / invalid_transition / not_found로 분류
+    - commit은 호출자 책임 (단건 API와 동일)
+    """
+    if new_status not in ALLOWED_TRANSITIONS:
+        raise HTTPException(status_code=422, detail=f"Invalid status: {new_status}")
+
+    sources = _allowed_sources(new_status)
+    filters = {"rule_code": rule_code, "detected_from": detected_from, "detected_to": detected_to}
+
+    if ids is not None:
+        if len(ids) > BULK_MAX_ANOMALIES:
+            raise HTTPException(status_code=422, detail=f"Too many ids (max {BULK_MAX_ANOMALIES})")
+        target_ids = list(ids)
+    else:
+        if rule_code is None and detected_from is None and detected_to is None:
+            raise HTTPException(status_code=422, detail="Bulk filter must not be empty")
+        # 대상 id를 먼저 고정: UPDATE 뒤에 같은 filter를 다시 돌리면 다음 page가 잡힌다
+        target = (
+            _bulk_filter(select(Anomaly.id), **filters)
+            .where(Anomaly.status.in_(sources))
+            .order_by(Anomaly.id)
+            .limit(BULK_MAX_ANOMALIES)
+        )
+        target_ids = list(db.execute(target).scalars().all())
+
+    updated_ids: set[int] = set()
+    skipped: dict[int, str] = {}
+    if target_ids:
+        stmt = (
+            update(Anomaly)
+            .where(Anomaly.id.in_(target_ids))
+            .where(Anomaly.status.in_(sources))
+            .values(**_transition_values(new_status))
+            .returning(Anomaly.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = set(db.execute(stmt).scalars().all())
+
+        skipped_stmt = select(Anomaly.id, Anomaly.status).where(Anomaly.id.in_(target_ids))
+        if updated_ids:
+            skipped_stmt = skipped_stmt.where(Anomaly.id.not_in(updated_ids))
+        skipped = {row_id: status for row_id, status in db.execute(skipped_stmt).all()}
+
+    if updated_ids:
+        record_anomaly_change(db, change="status_changed", ids=sorted(updated_ids), status=new_status)
+
+    outcomes = [BulkTransitionOutcome(id=i, outcome="updated", status=new_status) for i in sorted(updated_ids)]
+    for row_id, status in sorted(skipped.items()):
+        outcome = "noop" if status == new_status else "invalid_transition"
+        outcomes.append(BulkTransitionOutcome(id=row_id, outcome=outcome, status=status))
+
+    remaining = 0
+    if ids is not None:
+        seen = updated_ids | skipped.keys()
+        for missing in sorted(set(ids) - seen):
+            outcomes.append(BulkTransitionOutcome(id=missing, outcome="not_found", status=None))
+    elif len(target_ids) >= BULK_MAX_ANOMALIES:
+        # new_status는 sources에 없으므로, 아직 sources 상태인 row = 처리 못 한 row
+        remaining = int(
+            db.execute(
+                _bulk_filter(select(func.count()).select_from(Anomaly), **filters)
+                .where(Anomaly.status.in_(sources))
+            ).scalar_one()
+        )
+
+    return BulkTransitionResult(outcomes=outcomes, remaining=remaining)
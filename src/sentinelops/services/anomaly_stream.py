@@ -0,0 +1,121 @@
+"""
+Anomaly live feed (Postgres LISTEN/NOTIFY → SSE fan-out)
+
+- 프로세스당 LISTEN 전용 커넥션 1개 (pool과 별도, autocommit)
+- 알림 1건을 연결된 모든 SSE 구독자 queue로 복사 (fan-out)
+- 구독자가 0명이 되어도 listener는 유지 (재연결 비용보다 싸다), 앱 종료 시 stop()
+- 느린 구독자의 queue가 가득 차면 그 구독자에게는 알림을 버린다.
+  feed는 "변경 힌트"이므로 클라이언트는 목록 API(ETag)로 다시 맞추면 됨
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+import psycopg
+
+from sentinelops.db.session import engine
+from sentinelops.services.anomaly_changes import ANOMALY_NOTIFY_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 100
+_RECONNECT_DELAY_SEC = 3.0
+
+
+class AnomalyBroadcaster:
+    def __init__(self, channel: str = ANOMALY_NOTIFY_CHANNEL) -> None:
+        self._channel = channel
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # -------------------------
+    # Subscriber side (event loop)
+    # -------------------------
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        q: asyncio.Queue[str] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(q)
+            self._ensure_listener()
+        return q
+
+    def unsubscribe(self, q: asyncio.Queue[str]) -> None:
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # -------------------------
+    # Listener side (background thread)
+    # -------------------------
+
+    def _ensure_listener(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="anomaly-listener", daemon=True)
+        self._thread.start()
+
+    def _conninfo(self) -> str:
+        # SQLAlchemy URL(postgresql+psycopg://...) → libpq URI
+        return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self._conninfo(), autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self._channel}")
+                    while not self._stop.is_set():
+                        # timeout마다 빠져나와서 stop 여부 확인
+                        for notify in conn.notifies(timeout=1.0):
+                            self._dispatch(notify.payload)
+            except Exception as e:
+                # DB 재시작 / 네트워크 끊김 → 잠시 후 재연결
+                # (잘못된 DSN / 인증 실패도 여기로 오므로 조용히 넘기지 않는다. 반복은 rate limit)
+                logger.warning(
+                    "anomaly listener disconnected, reconnecting",
+                    extra={
+                        "channel": self._channel,
+                        "error": type(e).__name__,
+                        "error_detail": " ".join(str(e).split())[:200],
+                        "retry_in_sec": _RECONNECT_DELAY_SEC,
+                        "rate_limited": True,
+                    },
+                )
+                if self._stop.wait(_RECONNECT_DELAY_SEC):
+                    return
+
+    def _dispatch(self, payload: str) -> None:
+        with self._lock:
+            loop = self._loop
+            subscribers = list(self._subscribers)
+        if loop is None or not subscribers:
+            return
+        for q in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, q, payload)
+            except RuntimeError:
+                # event loop가 이미 닫힘 (앱 종료 중)
+                return
+
+
+def _offer(q: asyncio.Queue[str], payload: str) -> None:
+    try:
+        q.put_nowait(payload)
+    except asyncio.QueueFull:
+        pass
+
+
+anomaly_broadcaster = AnomalyBroadcaster()
@@ -0,0 +1,381 @@
+"""
+Event rollups (시간 bucket 사전 집계)
+
+- refresh: 마지막 watermark - lookback 부터 "완료된 분"까지 bucket을 다시 세서 upsert
+  (늦게 commit된 events를 lookback 구간에서 다시 주워 담음)
+- 조회: [rollup 1시간 | rollup 1분 | raw tail] 구간으로 나눠서 센 뒤 합친다.
+  응답 시간은 events 양이 아니라 반환 bucket 수 + watermark 이후 raw tail 크기에 비례
+- metric 정의는 rules_runner / aggregation과 같은 predicate를 쓴다.
+  - events:   전체
+  - invalid:  status == "invalid"
+  - failures: status == "verified" AND event_type IN FAILURE_EVENT_TYPES
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import false, func, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from sentinelops.core.config import settings
+from sentinelops.core.stripe_events import FAILURE_EVENT_TYPES
+from sentinelops.models.event import Event
+from sentinelops.models.event_rollup import EventRollup, RollupWatermark
+
+EVENT_ROLLUPS_WATERMARK = "event_rollups"
+
+MINUTE = 60
+HOUR = 3600
+ROLLUP_GRAINS: tuple[int, ...] = (HOUR, MINUTE)  # 큰 grain부터
+
+METRICS: tuple[str, ...] = ("events", "invalid", "failures")
+MAX_POINTS = 2000
+
+
+# -------------------------
+# Time helpers
+# -------------------------
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def floor_to_bucket(dt: datetime, bucket_seconds: int) -> datetime:
+    ts = int(_as_utc(dt).timestamp())
+    return datetime.fromtimestamp(ts - ts % bucket_seconds, tz=timezone.utc)
+
+
+def ceil_to_bucket(dt: datetime, bucket_seconds: int) -> datetime:
+    floored = floor_to_bucket(dt, bucket_seconds)
+    return floored if floored == _as_utc(dt) else floored + timedelta(seconds=bucket_seconds)
+
+
+def _bucket_expr(col, bucket_seconds: int):
+    # epoch 기준 floor → UTC 정각/정분 정렬
+    # bucket 크기는 SQL에 그대로 박는다: bind param이면 SELECT와 GROUP BY가
+    # 서로 다른 파라미터가 되어 Postgres가 같은 식으로 보지 않음
+    size = literal_column(str(int(bucket_seconds)))
+    return func.to_timestamp(func.floor(func.extract("epoch", col) / size) * size)
+
+
+# -------------------------
+# Metric predicates (events / event_rollups 공용 컬럼명)
+# -------------------------
+
+def metric_filters(metric: str, status_col, event_type_col) -> list[Any]:
+    if metric == "events":
+        return []
+    if metric == "invalid":
+        return [status_col == "invalid"]
+    if metric == "failures":
+        return [status_col == "verified", event_type_col.in_(FAILURE_EVENT_TYPES)]
+    raise ValueError(f"Unknown metric: {metric}")
+
+
+# -------------------------
+# Segment planner
+# -------------------------
+
+@dataclass(frozen=True)
+class Segment:
+    """source: "rollup" (grain=bucket_seconds) 또는 "raw" (grain=None)"""
+    source: str
+    start: datetime
+    end: datetime
+    grain: Optional[int] = None
+
+
+def _plan_rollup(start: datetime, end: datetime, grains: tuple[int, ...]) -> list[Segment]:
+    if start >= end:
+        return []
+    if not grains:
+        return [Segment("raw", start, end)]
+
+    grain, rest = grains[0], grains[1:]
+    seg_start = ceil_to_bucket(start, grain)
+    seg_end = floor_to_bucket(end, grain)
+    if seg_end <= seg_start:
+        return _plan_rollup(start, end, rest)
+
+    # 가운데는 큰 grain, 앞뒤 자투리는 더 작은 grain으로
+    return (
+        _plan_rollup(start, seg_start, rest)
+        + [Segment("rollup", seg_start, seg_end, grain)]
+        + _plan_rollup(seg_end, end, rest)
+    )
+
+
+def plan_segments(
+    start: datetime,
+    end: datetime,
+    watermark: Optional[datetime],
+    *,
+    max_grain: int = HOUR,
+) -> list[Segment]:
+    """
+    [start, end)를 읽을 구간으로 나눈다.
+    - watermark 이전: 경계가 맞는 범위에서 가능한 큰 grain의 rollup (max_grain 이하)
+    - watermark 이후: raw events
+    """
+    start, end = _as_utc(start), _as_utc(end)
+    if start >= end:
+        return []
+
+    rolled_end = start
+    if watermark is not None and floor_to_bucket(start, MINUTE) == start:
+        rolled_end = max(start, floor_to_bucket(min(end, _as_utc(watermark)), MINUTE))
+
+    grains = tuple(g for g in ROLLUP_GRAINS if g <= max_grain)
+    segments = _plan_rollup(start, rolled_end, grains)
+    if rolled_end < end:
+        segments.append(Segment("raw", rolled_end, end))
+    return segments
+
+
+# -------------------------
+# Refresh
+# -------------------------
+
+def get_rollup_watermark(db: Session) -> Optional[datetime]:
+    stmt = select(RollupWatermark.refreshed_until).where(
+        RollupWatermark.name == EVENT_ROLLUPS_WATERMARK
+    )
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def _upsert_grain(db: Session, grain: int, start: datetime, end: datetime) -> int:
+    bucket = _bucket_expr(Event.created_at, grain)
+    event_type = func.coalesce(Event.event_type, literal_column("''"))
+    source = (
+        select(
+            literal_column(str(int(grain))).label("bucket_seconds"),
+            bucket.label("bucket_start"),
+            event_type.label("event_type"),
+            Event.status,
+            func.count().label("event_count"),
+        )
+        .where(Event.created_at >= start, Event.created_at < end)
+        .group_by(bucket, event_type, Event.status)
+    )
+    stmt = insert(EventRollup).from_select(
+        ["bucket_seconds", "bucket_start", "event_type", "status", "event_count"], source
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["bucket_seconds", "bucket_start", "event_type", "status"],
+        set_={"event_count": stmt.excluded.event_count},
+    )
+    return db.execute(stmt).rowcount or 0
+
+
+def refresh_event_rollups(
+    db: Session,
+    *,
+    now: Optional[datetime] = None,
+    lookback_minutes: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    rollup 갱신 (idempotent).
+    - 끝: 현재 시각을 분 단위로 내림 (진행 중인 분은 raw tail에서 센다)
+    - 시작: watermark - lookback (처음이면 events 최소 created_at)
+    - 각 grain의 bucket은 경계에 맞춰 "통째로" 다시 센다. 마지막 시간 bucket은
+      end까지의 부분합이고, 다음 refresh에서 다시 덮어쓴다.
+    """
+    now = _as_utc(now or datetime.now(timezone.utc))
+    lookback = timedelta(minutes=lookback_minutes or settings.rollup_lookback_minutes)
+    end = floor_to_bucket(now, MINUTE)
+
+    watermark = get_rollup_watermark(db)
+    if watermark is not None:
+        start = _as_utc(watermark) - lookback
+    else:
+        first = db.execute(select(func.min(Event.created_at))).scalar_one_or_none()
+        start = _as_utc(first) if first is not None else end
+
+    upserted = 0
+    if start < end:
+        for grain in ROLLUP_GRAINS:
+            upserted += _upsert_grain(db, grain, floor_to_bucket(start, grain), end)
+
+    wm = insert(RollupWatermark).values(name=EVENT_ROLLUPS_WATERMARK, refreshed_until=end)
+    wm = wm.on_conflict_do_update(
+        index_elements=["name"],
+        # 동시에 두 번 돌아도 watermark가 뒤로 가지 않게
+        set_={"refreshed_until": func.greatest(RollupWatermark.refreshed_until, wm.excluded.refreshed_until)},
+    )
+    db.execute(wm)
+    db.commit()
+
+    return {"from": start, "until": end, "upserted_rows": upserted}
+
+
+# -------------------------
+# Query
+# -------------------------
+
+def _count_segment(
+    db: Session,
+    segment: Segment,
+    *,
+    metric: str,
+    bucket_seconds: int,
+    event_type: Optional[str],
+) -> list[tuple[datetime, int]]:
+    if segment.source == "rollup":
+        bucket = _bucket_expr(EventRollup.bucket_start, bucket_seconds)
+        stmt = (
+            select(bucket, func.sum(EventRollup.event_count))
+            .where(
+                EventRollup.bucket_seconds == segment.grain,
+                EventRollup.bucket_start >= segment.start,
+                EventRollup.bucket_start < segment.end,
+                *metric_filters(metric, EventRollup.status, EventRollup.event_type),
+            )
+            .group_by(bucket)
+        )
+        if event_type is not None:
+            stmt = stmt.where(EventRollup.event_type == event_type)
+    else:
+        bucket = _bucket_expr(Event.created_at, bucket_seconds)
+        stmt = (
+            select(bucket, func.count())
+            .where(
+                Event.created_at >= segment.start,
+                Event.created_at < segment.end,
+                *metric_filters(metric, Event.status, Event.event_type),
+            )
+            .group_by(bucket)
+        )
+        if event_type is not None:
+            stmt = stmt.where(Event.event_type == event_type)
+
+    return [(_as_utc(b), int(c or 0)) for b, c in db.execute(stmt).all()]
+
+
+def event_counts_source(
+    start: datetime,
+    end: datetime,
+    watermark: Optional[datetime],
+):
+    """
+    [start, end)의 (event_type, status, event_count) 집계를 segment별로 UNION ALL 한 selectable.
+    - event_type null은 '' (rollup과 동일)
+    - 리포트 쪽에서 이걸 CTE로 감싸 metric을 한 번에 뽑는다 (aggregation.py)
+    """
+    parts = []
+    for seg in plan_segments(start, end, watermark):
+        if seg.source == "rollup":
+            parts.append(
+                select(
+                    EventRollup.event_type.label("event_type"),
+                    EventRollup.status.label("status"),
+                    func.sum(EventRollup.event_count).label("event_count"),
+                )
+                .where(
+                    EventRollup.bucket_seconds == seg.grain,
+                    EventRollup.bucket_start >= seg.start,
+                    EventRollup.bucket_start < seg.end,
+                )
+                .group_by(EventRollup.event_type, EventRollup.status)
+            )
+        else:
+            event_type = func.coalesce(Event.event_type, literal_column("''"))
+            parts.append(
+                select(
+                    event_type.label("event_type"),
+                    Event.status.label("status"),
+                    func.count().label("event_count"),
+                )
+                .where(Event.created_at >= seg.start, Event.created_at < seg.end)
+                .group_by(event_type, Event.status)
+            )
+
+    if not parts:
+        # 빈 window: 같은 컬럼 모양의 0-row select
+        return select(
+            literal_column("''").label("event_type"),
+            literal_column("''").label("status"),
+            literal_column("0").label("event_count"),
+        ).where(false())
+    return parts[0] if len(parts) == 1 else union_all(*parts)
+
+
+def count_events(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    *,
+    metric: str = "events",
+    event_type: Optional[str] = None,
+) -> int:
+    """
+    [start, end) 합계 1개 (리포트용). rollup + raw tail을 합쳐서 센다.
+    """
+    watermark = get_rollup_watermark(db)
+    span = int((_as_utc(end) - _as_utc(start)).total_seconds())
+    total = 0
+    for seg in plan_segments(start, end, watermark):
+        # bucket을 구간 전체 크기로 잡으면 bucket당 row 1~2개
+        for _, c in _count_segment(
+            db, seg, metric=metric, bucket_seconds=max(span, MINUTE), event_type=event_type
+        ):
+            total += c
+    return total
+
+
+def event_timeseries(
+    db: Session,
+    *,
+    metric: str,
+    bucket_seconds: int,
+    start: datetime,
+    end: datetime,
+    event_type: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    bucket_seconds 간격 timeseries (빈 bucket은 0으로 채움).
+    - start는 bucket 경계로 내림, end는 올림
+    - bucket 수가 MAX_POINTS를 넘으면 ValueError
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+    if bucket_seconds < MINUTE or bucket_seconds % MINUTE:
+        raise ValueError("bucket must be a multiple of 1 minute")
+
+    start = floor_to_bucket(start, bucket_seconds)
+    end = ceil_to_bucket(end, bucket_seconds)
+    if start >= end:
+        raise ValueError("'from' must be earlier than 'to'")
+
+    n_points = int((end - start).total_seconds()) // bucket_seconds
+    if n_points > MAX_POINTS:
+        raise ValueError(f"Too many buckets ({n_points} > {MAX_POINTS}); widen bucket or narrow range")
+
+    watermark = get_rollup_watermark(db)
+    # target bucket보다 큰 grain의 rollup은 쪼갤 수 없으므로 max_grain 제한
+    segments = plan_segments(start, end, watermark, max_grain=bucket_seconds)
+
+    counts: dict[datetime, int] = {}
+    for seg in segments:
+        for bucket, c in _count_segment(
+            db, seg, metric=metric, bucket_seconds=bucket_seconds, event_type=event_type
+        ):
+            counts[bucket] = counts.get(bucket, 0) + c
+
+    step = timedelta(seconds=bucket_seconds)
+    points = [
+        {"bucket_start": start + step * i, "value": counts.get(start + step * i, 0)}
+        for i in range(n_points)
+    ]
+    return {
+        "metric": metric,
+        "bucket_seconds": bucket_seconds,
+        "start": start,
+        "end": end,
+        "event_type": event_type,
+        "rolled_up_until": watermark,
+        "points": points,
+    }
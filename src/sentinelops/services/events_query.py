@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import desc, select, tuple_
+from sqlalchemy.orm import Session, defer
+
+from sentinelops.core.pagination import decode_cursor, encode_cursor
+from sentinelops.models.event import Event
+
+
+def encode_event_cursor(row: Event) -> str:
+    return encode_cursor({"c": row.created_at.isoformat(), "i": row.id})
+
+
+def _decode_event_cursor(token: str) -> tuple[datetime, int]:
+    payload = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def list_events(
+    db: Session,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    status: Optional[str] = None,
+    event_type: Optional[str] = None,
+    source: Optional[str] = None,
+    livemode: Optional[bool] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    include_raw: bool = False,
+) -> list[Event]:
+    """
+    최신순 events 조회 (keyset: created_at, id).
+    - raw(JSONB payload)는 기본 defer → SELECT 목록에서 빠짐
+      include_raw=False인데 row.raw에 접근하면 row마다 추가 쿼리가 나가므로 호출자가 주의
+    - 잘못된 cursor면 ValueError
+    """
+    stmt = select(Event)
+    if not include_raw:
+        stmt = stmt.options(defer(Event.raw))
+
+    if start is not None:
+        stmt = stmt.where(Event.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(Event.created_at < end)
+    if status is not None:
+        stmt = stmt.where(Event.status == status)
+    if event_type is not None:
+        stmt = stmt.where(Event.event_type == event_type)
+    if source is not None:
+        stmt = stmt.where(Event.source == source)
+    if livemode is not None:
+        stmt = stmt.where(Event.livemode.is_(livemode))
+
+    if cursor:
+        created_at, event_id = _decode_event_cursor(cursor)
+        stmt = stmt.where(tuple_(Event.created_at, Event.id) < tuple_(created_at, event_id))
+
+    stmt = stmt.order_by(desc(Event.created_at), desc(Event.id)).limit(limit)
+    return list(db.execute(stmt).scalars().all())
+
+
+def event_to_dict(row: Event, *, include_raw: bool = False) -> dict[str, Any]:
+    out: dict[str, Any] = {
+        "id": row.id,
+        "source": row.source,
+        "provider_event_id": row.provider_event_id,
+        "event_type": row.event_type,
+        "status": row.status,
+        "livemode": row.livemode,
+        "created_at_provider": row.created_at_provider,
+        "created_at": row.created_at,
+    }
+    if include_raw:
+        out["raw"] = row.raw
+    return out
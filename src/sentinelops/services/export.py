@@ -0,0 +1,167 @@
+"""
+Events / anomalies 대량 export (incident review, finance audit 용)
+
+- server-side cursor(yield_per)로 batch 단위로만 메모리에 올림
+  → 범위가 한 달이든 일 년이든 메모리 사용량은 batch 크기로 고정
+- column projection: raw 같은 큰 컬럼은 요청했을 때만 SELECT
+- 출력은 NDJSON / CSV 두 가지, 둘 다 chunk(bytes) generator
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinelops.core import fast_json
+from sentinelops.models.anomaly import Anomaly
+from sentinelops.models.event import Event
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS: dict[str, dict[str, Any]] = {
+    "events": {
+        "id": Event.id,
+        "source": Event.source,
+        "provider_event_id": Event.provider_event_id,
+        "event_type": Event.event_type,
+        "status": Event.status,
+        "livemode": Event.livemode,
+        "created_at_provider": Event.created_at_provider,
+        "created_at": Event.created_at,
+        "signature": Event.signature,
+        "raw": Event.raw,
+    },
+    "anomalies": {
+        "id": Anomaly.id,
+        "rule_code": Anomaly.rule_code,
+        "severity": Anomaly.severity,
+        "title": Anomaly.title,
+        "status": Anomaly.status,
+        "event_type": Anomaly.event_type,
+        "provider_event_id": Anomaly.provider_event_id,
+        "window_start": Anomaly.window_start,
+        "window_end": Anomaly.window_end,
+        "detected_at": Anomaly.detected_at,
+        "evidence": Anomaly.evidence,
+        "is_demo": Anomaly.is_demo,
+        "acknowledged_at": Anomaly.acknowledged_at,
+        "resolved_at": Anomaly.resolved_at,
+        "updated_at": Anomaly.updated_at,
+        "incident_id": Anomaly.incident_id,
+    },
+}
+
+# columns를 지정하지 않았을 때: 큰 payload 컬럼(raw, signature)은 제외
+DEFAULT_EXPORT_COLUMNS: dict[str, list[str]] = {
+    "events": [
+        "id",
+        "source",
+        "provider_event_id",
+        "event_type",
+        "status",
+        "livemode",
+        "created_at_provider",
+        "created_at",
+    ],
+    "anomalies": list(EXPORT_COLUMNS["anomalies"].keys()),
+}
+
+# 범위 필터 + 정렬 기준 (각각 (time, id) 인덱스가 있음)
+_TIME_COLUMN = {
+    "events": Event.created_at,
+    "anomalies": Anomaly.detected_at,
+}
+_ID_COLUMN = {
+    "events": Event.id,
+    "anomalies": Anomaly.id,
+}
+
+
+def resolve_export_columns(kind: str, columns: list[str] | None) -> list[str]:
+    """
+    요청된 컬럼 이름 검증. 잘못된 이름이면 ValueError.
+    """
+    if not columns:
+        return list(DEFAULT_EXPORT_COLUMNS[kind])
+
+    available = EXPORT_COLUMNS[kind]
+    unknown = [c for c in columns if c not in available]
+    if unknown:
+        raise ValueError(f"Unknown columns for {kind}: {', '.join(unknown)}")
+
+    # 중복 제거 (순서 유지)
+    return list(dict.fromkeys(columns))
+
+
+def iter_export_rows(
+    db: Session,
+    kind: str,
+    *,
+    start: datetime,
+    end: datetime,
+    columns: list[str],
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    time_col = _TIME_COLUMN[kind]
+    selected = [EXPORT_COLUMNS[kind][c].label(c) for c in columns]
+
+    stmt = (
+        select(*selected)
+        .where(time_col >= start, time_col < end)
+        .order_by(time_col, _ID_COLUMN[kind])
+        .execution_options(yield_per=batch_size)  # ✅ stream_results → server-side cursor
+    )
+
+    for row in db.execute(stmt).mappings():
+        yield dict(row)
+
+
+def iter_ndjson(rows: Iterable[dict[str, Any]], *, chunk_rows: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    buf: list[bytes] = []
+    for row in rows:
+        buf.append(fast_json.dumps(row))
+        if len(buf) >= chunk_rows:
+            yield b"\n".join(buf) + b"\n"
+            buf.clear()
+    if buf:
+        yield b"\n".join(buf) + b"\n"
+
+
+def _csv_value(v: Any) -> Any:
+    if v is None:
+        return ""
+    if isinstance(v, datetime):
+        return v.isoformat()
+    if isinstance(v, (dict, list)):
+        return fast_json.dumps(v).decode("utf-8")
+    return v
+
+
+def iter_csv(
+    rows: Iterable[dict[str, Any]],
+    columns: list[str],
+    *,
+    chunk_rows: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(columns)
+
+    n = 0
+    for row in rows:
+        writer.writerow([_csv_value(row[c]) for c in columns])
+        n += 1
+        if n >= chunk_rows:
+            yield out.getvalue().encode("utf-8")
+            out.seek(0)
+            out.truncate(0)
+            n = 0
+
+    tail = out.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
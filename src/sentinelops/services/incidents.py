@@ -0,0 +1,198 @@
+"""
+Incident grouping (anomaly → incident)
+
+- 같은 rule family(core.anomaly_rules.RuleDef.family)이고 window가 겹치거나 이어지는
+  (간격 <= INCIDENT_MERGE_GAP_MINUTES) anomaly는 하나의 incident로 묶는다
+  예) payment_failure_spike(30m) + rapid_retry_failure(5m) 동시 발생 → incident 1개
+      webhook_integrity가 연속된 30m window마다 발생 → incident 1개
+- anomaly insert와 같은 트랜잭션에서 incremental하게 갱신 (재집계 없음)
+- rule들은 병렬 thread/process에서 돌기 때문에 family 단위 pg_advisory_xact_lock으로 직렬화
+  (lock은 commit/rollback 때 자동 해제)
+- 묶인 anomaly가 모두 resolved면 그 incident에는 더 붙이지 않고 새 incident를 연다
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import desc, exists, func, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from sentinelops.core.anomaly_rules import rule_family
+from sentinelops.core.config import settings
+from sentinelops.core.pagination import decode_cursor, encode_cursor
+from sentinelops.models.anomaly import Anomaly
+from sentinelops.models.incident import Incident
+
+# models.anomaly.SEVERITY_RANK_SQL과 같은 순서
+_SEVERITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+_LOCK_PREFIX = "sentinelops:incident:"
+
+
+def _has_unresolved_anomaly():
+    return exists().where(Anomaly.incident_id == Incident.id, Anomaly.status != "resolved")
+
+
+def attach_to_incident(db: Session, anomaly: Anomaly) -> tuple[Incident, bool]:
+    """
+    flush된(id 있는) anomaly를 incident에 붙인다. commit은 호출자 책임.
+    반환: (incident, created) — created=True일 때만 알림을 보내면 된다.
+    """
+    family = rule_family(anomaly.rule_code)
+    detected_at = anomaly.detected_at or datetime.now(timezone.utc)
+    window_start = anomaly.window_start or detected_at
+    window_end = anomaly.window_end or detected_at
+    gap = timedelta(minutes=settings.incident_merge_gap_minutes)
+
+    # 같은 family의 attach는 한 번에 하나씩 (동시에 incident 2개가 생기지 않게)
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(_LOCK_PREFIX + family))))
+
+    incident = db.execute(
+        select(Incident)
+        .where(
+            Incident.family == family,
+            Incident.window_end >= window_start - gap,
+            Incident.window_start <= window_end + gap,
+            _has_unresolved_anomaly(),
+        )
+        .order_by(Incident.window_end.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+
+    rank = _SEVERITY_RANK.get(anomaly.severity, 0)
+    created = incident is None
+    if incident is None:
+        incident = Incident(
+            family=family,
+            title=anomaly.title,
+            severity=anomaly.severity,
+            severity_rank=rank,
+            rule_codes=[anomaly.rule_code],
+            anomaly_count=1,
+            window_start=window_start,
+            window_end=window_end,
+            first_detected_at=detected_at,
+            last_detected_at=detected_at,
+        )
+        db.add(incident)
+        db.flush()
+    else:
+        incident.window_start = min(incident.window_start, window_start)
+        incident.window_end = max(incident.window_end, window_end)
+        incident.last_detected_at = max(incident.last_detected_at, detected_at)
+        incident.anomaly_count += 1
+        if rank > incident.severity_rank:
+            incident.severity = anomaly.severity
+            incident.severity_rank = rank
+        if anomaly.rule_code not in incident.rule_codes:
+            # JSONB는 in-place 변경을 추적하지 않으므로 새 list로 교체
+            incident.rule_codes = [*incident.rule_codes, anomaly.rule_code]
+
+    anomaly.incident_id = incident.id
+    db.flush()
+    return incident, created
+
+
+def extend_incident(db: Session, incident_id: int, *, window_end: datetime, detected_at: datetime) -> None:
+    """
+    anomaly가 제자리에서 연장됐을 때 incident 범위도 같이 늘린다 (UPDATE 1번, commit은 호출자).
+    anomaly 수는 그대로 (row가 늘지 않았으므로)
+    """
+    db.execute(
+        update(Incident)
+        .where(Incident.id == incident_id)
+        .values(
+            window_end=func.greatest(Incident.window_end, window_end),
+            last_detected_at=func.greatest(Incident.last_detected_at, detected_at),
+        )
+    )
+
+
+# -------------------------
+# Query
+# -------------------------
+
+def _open_anomalies_expr():
+    return (
+        select(func.count())
+        .where(Anomaly.incident_id == Incident.id, Anomaly.status == "open")
+        .correlate(Incident)
+        .scalar_subquery()
+    )
+
+
+def encode_incident_cursor(row: Any) -> str:
+    return encode_cursor({"d": row.last_detected_at.isoformat(), "i": row.id})
+
+
+def _decode_incident_cursor(token: str) -> tuple[datetime, int]:
+    payload = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(payload["d"]), int(payload["i"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def list_incidents(
+    db: Session,
+    *,
+    status: Optional[str] = None,
+    family: Optional[str] = None,
+    since: Optional[datetime] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> list[Any]:
+    """
+    최신순 incident 목록 (keyset: last_detected_at, id).
+    - status: "active" = 아직 resolved 안 된 anomaly가 있음, "resolved" = 모두 resolved
+    - 잘못된 status / cursor면 ValueError
+    """
+    stmt = select(Incident, _open_anomalies_expr().label("open_anomalies"))
+
+    if status == "active":
+        stmt = stmt.where(_has_unresolved_anomaly())
+    elif status == "resolved":
+        stmt = stmt.where(~_has_unresolved_anomaly())
+    elif status is not None:
+        raise ValueError("status must be 'active' or 'resolved'")
+
+    if family is not None:
+        stmt = stmt.where(Incident.family == family)
+    if since is not None:
+        stmt = stmt.where(Incident.last_detected_at >= since)
+
+    if cursor:
+        detected_at, incident_id = _decode_incident_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Incident.last_detected_at, Incident.id) < tuple_(detected_at, incident_id)
+        )
+
+    stmt = stmt.order_by(desc(Incident.last_detected_at), desc(Incident.id)).limit(limit)
+    return list(db.execute(stmt).all())
+
+
+def list_incident_anomalies(db: Session, incident_id: int) -> list[Anomaly]:
+    stmt = (
+        select(Anomaly)
+        .where(Anomaly.incident_id == incident_id)
+        .order_by(Anomaly.detected_at, Anomaly.id)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def incident_to_dict(incident: Incident, *, open_anomalies: int) -> dict[str, Any]:
+    return {
+        "id": incident.id,
+        "family": incident.family,
+        "title": incident.title,
+        "severity": incident.severity,
+        "rule_codes": list(incident.rule_codes or []),
+        "anomaly_count": incident.anomaly_count,
+        "open_anomalies": open_anomalies,
+        "window_start": incident.window_start,
+        "window_end": incident.window_end,
+        "first_detected_at": incident.first_detected_at,
+        "last_detected_at": incident.last_detected_at,
+    }
@@ -1,14 +1,36 @@
-import requests
+import logging
+
 from sentinelops.core.config import settings
+from sentinelops.integrations.slack.client import get_slack_client
+
+logger = logging.getLogger(__name__)
+
+# 알림은 rule 실행 thread에서 보내므로 오래 붙잡지 않는다
+_ALERT_TIMEOUT_SEC = 3.0
+_ALERT_MAX_WAIT_SEC = 5.0
 
 
 def send_slack_message(text: str) -> None:
-    url = settings.slack_webhook_url
+    url = settings.slack_webhook_url.get_secret_value() if settings.slack_webhook_url else None
     if not url:
         return  # 운영 안정성: 없으면 조용히 스킵
 
     try:
-        requests.post(url, json={"text": text}, timeout=3)
-    except Exception:
-        # 알림 실패가 시스템을 깨면 안 됨
-        pass
+        get_slack_client().post(
+            url,
+            {"text": text},
+            target="alert",
+            timeout_sec=_ALERT_TIMEOUT_SEC,
+            max_wait_sec=_ALERT_MAX_WAIT_SEC,
+        )
+    except Exception as e:
+        # 알림 실패가 시스템을 깨면 안 됨 (latency/code는 client가 metric으로 기록)
+        # str(e)는 쓰지 않는다: 예외 종류에 따라 webhook URL(secret)이 들어갈 수 있음
+        logger.warning(
+            "slack alert failed",
+            extra={
+                "error": type(e).__name__,
+                "status_code": getattr(e, "status_code", None),
+                "rate_limited": True,
+            },
+        )
@@ -6,6 +6,9 @@ def anomaly_to_slack_text(anomaly) -> str:
         f"*Status:* {anomaly.status}",
     ]
 
+    if getattr(anomaly, "incident_id", None):
+        lines.append(f"*Incident:* #{anomaly.incident_id}")
+
     if anomaly.window_start and anomaly.window_end:
         lines.append(
             f"*Window:* {anomaly.window_start} ~ {anomaly.window_end}"
@@ -4,26 +4,34 @@ from __future__ import annotations
 SentinelOps v0.4 - Daily Ops Summary Aggregation
 
 목표
-- 지난 24시간(또는 지정 window) 동안의 운영 신호를 "집계된 형태"로 모아 DailySummaryInput을 생성한다.
+- 지정 window(daily/weekly/monthly/custom) 동안의 운영 신호를 "집계된 형태"로 모아 DailySummaryInput을 생성한다.
 - v0.4 원칙: Raw Stripe payload를 AI/요약 레이어로 넘기지 않는다.
   -> Aggregated metrics + rule signals(anomalies)만 만든다.
 
-중요 (get_db 관련)
-- sentinelops.db.session.get_db()는 FastAPI dependency에서 흔히 쓰는 "generator(yield Session)" 패턴이다.
-- 따라서 `with get_db() as session:` 은 불가능 (context manager가 아님).
-- scripts/services 레이어에서는 `session = next(get_db())` + `try/finally session.close()`를 사용한다.
+쿼리 전략
+- window 하나에 대한 지표를 statement 1개(CTE + FILTER 집계 + window 함수 top-N)로 구한다.
+- events 지표는 event_rollups(1h/1m bucket) + watermark 이후 raw tail을 합쳐서 계산
+  → window가 길어져도 비용은 bucket 수에 비례
+- anomalies는 건수가 작아서 detected_at 범위로 직접 집계
+- incidents: window 안에서 탐지된 anomaly가 묶인 incident (같은 statement의 CTE)
+- 세션은 호출자(run_daily_ops_summary 등)가 넘긴다. 여기서 따로 열지 않음.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
-from sentinelops.db.session import get_db  # ✅ generator dependency
 from sentinelops.models.anomaly import Anomaly
-from sentinelops.models.event import Event
+from sentinelops.models.incident import Incident
+from sentinelops.services.event_rollups import (
+    event_counts_source,
+    get_rollup_watermark,
+    metric_filters,
+)
 
 
 # -------------------------
@@ -42,15 +50,30 @@ class RuleSignal:
     evidence: dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class IncidentSignal:
+    """
+    window 안에서 탐지된 anomaly가 묶인 incident.
+    anomaly_count는 incident 전체가 아니라 이 window에 속한 anomaly 수.
+    """
+    incident_id: int
+    family: str
+    severity: str
+    anomaly_count: int
+    rule_codes: list[str]
+
+
 @dataclass(frozen=True)
 class DailyMetrics:
     """
     Daily Summary에서 항상 유용한 기본 운영 지표.
     - total_events: window 내 들어온 이벤트 수
     - failure_rate_percent: 여기서는 "invalid event rate"로 정의 (명확하고 안정적)
+    - failed_payment_events: payment_intent.payment_failed / charge.failed (verified)
     """
     total_events: int
     failure_rate_percent: float | None = None  # invalid event rate (%)
+    failed_payment_events: int = 0
 
 
 @dataclass(frozen=True)
@@ -69,157 +92,208 @@ class DailySummaryInput:
     top_event_types: list[tuple[str, int]]
     open_anomalies_count: int
 
+    kind: str = "daily_ops"  # daily_ops / weekly_ops / monthly_ops (reporting.kinds)
+    incidents: list[IncidentSignal] = field(default_factory=list)
+
 
 # -------------------------
-# Query Helpers (ORM)
+# Query (single statement)
 # -------------------------
 
-def _count_events(session: Session, window_start: datetime, window_end: datetime) -> int:
+def _summary_statement(
+    window_start: datetime,
+    window_end: datetime,
+    *,
+    watermark: Optional[datetime],
+    top_n: int,
+):
     """
-    events.created_at 기준 window 내 total events
+    WITH by_type     AS (event_type별 전체 / invalid / 결제 실패 개수, rollup 기반)
+         ranked      AS (by_type에 row_number() → top-N)
+         signals     AS (anomalies를 (rule_code, severity)별로 1번 집계: hit / open 개수)
+         incident_hits AS (anomalies를 incident_id별로 집계)
+    SELECT 합계 / top-N(json) / signals(json) / open 합계 / incidents(json)  -- row 1개
     """
-    stmt = (
-        select(func.count())
-        .select_from(Event)
-        .where(Event.created_at >= window_start, Event.created_at < window_end)
+    # events는 raw 대신 rollup bucket(+ watermark 이후 raw tail)을 합친다
+    # → 비용이 event 수가 아니라 bucket 수에 비례 (weekly/monthly도 부담 없음)
+    counts = event_counts_source(window_start, window_end, watermark).subquery("event_counts")
+    by_type = (
+        select(
+            func.nullif(counts.c.event_type, literal_column("''")).label("event_type"),
+            func.sum(counts.c.event_count).label("cnt"),
+            func.sum(counts.c.event_count)
+            .filter(and_(*metric_filters("invalid", counts.c.status, counts.c.event_type)))
+            .label("invalid_cnt"),
+            func.sum(counts.c.event_count)
+            .filter(and_(*metric_filters("failures", counts.c.status, counts.c.event_type)))
+            .label("failed_cnt"),
+        )
+        .group_by(counts.c.event_type)
+        .cte("by_type")
     )
-    return int(session.execute(stmt).scalar_one())
-
 
-def _count_invalid_events(session: Session, window_start: datetime, window_end: datetime) -> int:
-    """
-    v0.4 기본 failure_rate 정의:
-    - Event.status == "invalid" 비율 (무결성/보안/운영 관점에서 확실한 신호)
-
-    장점:
-    - event_type 종류/정의에 의존하지 않음
-    - 이미 모델에서 invalid 저장을 고려해 둔 상태라 신뢰도가 높음
-    """
-    stmt = (
-        select(func.count())
-        .select_from(Event)
-        .where(
-            Event.created_at >= window_start,
-            Event.created_at < window_end,
-            Event.status == "invalid",
+    ranked = (
+        select(
+            by_type.c.event_type,
+            by_type.c.cnt,
+            func.row_number()
+            .over(order_by=(by_type.c.cnt.desc(), by_type.c.event_type))
+            .label("rn"),
         )
+        # provider_event_id가 null인 invalid 저장도 있어서 event_type이 null일 수 있음
+        .where(by_type.c.event_type.is_not(None))
+        .cte("ranked_types")
     )
-    return int(session.execute(stmt).scalar_one())
-
 
-def _aggregate_rule_signals(session: Session, window_start: datetime, window_end: datetime) -> list[RuleSignal]:
-    """
-    anomalies.detected_at 기준 window 내 (rule_code, severity)별 hit_count 집계.
-
-    왜 detected_at을 쓰나?
-    - Anomaly.window_start/end는 nullable이고, rule별 의미가 다를 수 있음
-    - 'Daily ops'는 "그날 탐지된 이상징후"를 보고 싶기 때문에 detected_at이 더 일관적
-    """
-    stmt = (
+    signals = (
         select(
             Anomaly.rule_code,
             Anomaly.severity,
             func.count().label("hit_count"),
+            func.count().filter(Anomaly.status == "open").label("open_count"),
         )
         .where(Anomaly.detected_at >= window_start, Anomaly.detected_at < window_end)
         .group_by(Anomaly.rule_code, Anomaly.severity)
-        .order_by(func.count().desc())
+        .cte("signals")
     )
 
-    rows = session.execute(stmt).all()
-
-    signals: list[RuleSignal] = []
-    for rule_code, severity, hit_count in rows:
-        signals.append(
-            RuleSignal(
-                rule_code=str(rule_code),
-                severity=str(severity),
-                hit_count=int(hit_count),
-                baseline=None,   # (선택) baseline을 따로 저장/계산한다면 채우기
-                evidence=None,   # (선택) 요약에 쓸 근거가 있으면 채우기
-            )
+    incident_hits = (
+        select(Anomaly.incident_id, func.count().label("hits"))
+        .where(
+            Anomaly.detected_at >= window_start,
+            Anomaly.detected_at < window_end,
+            Anomaly.incident_id.is_not(None),
         )
-    return signals
-
-
-def _optional_top_event_types(session: Session, window_start: datetime, window_end: datetime, limit: int = 5) -> list[tuple[str, int]]:
-    """
-    window 내 event_type Top N
-    - Daily ops에서 "어제 뭐가 많이 들어왔지?"를 한 줄로 보여줄 수 있음
-    - Slack 스팸 방지를 위해 compose 단계에서 top 1~2 정도만 쓰는 걸 추천
-    """
-    stmt = (
-        select(Event.event_type, func.count().label("cnt"))
-        .where(Event.created_at >= window_start, Event.created_at < window_end)
-        .group_by(Event.event_type)
-        .order_by(func.count().desc())
-        .limit(limit)
+        .group_by(Anomaly.incident_id)
+        .cte("incident_hits")
     )
 
-    rows = session.execute(stmt).all()
+    empty_json = literal_column("'[]'::json")
 
-    out: list[tuple[str, int]] = []
-    for event_type, cnt in rows:
-        if event_type is None:
-            # provider_event_id가 null인 invalid 저장도 있어서 event_type이 null일 수 있음
-            continue
-        out.append((str(event_type), int(cnt)))
-    return out
-
-
-def _count_open_anomalies(session: Session, window_start: datetime, window_end: datetime) -> int:
-    """
-    window 내 새로 탐지된 anomaly 중 아직 open인 것의 수.
-    - 운영자 입장에서는 "미처리 이슈가 있나?"를 바로 파악 가능
-    """
-    stmt = (
-        select(func.count())
-        .select_from(Anomaly)
-        .where(
-            Anomaly.detected_at >= window_start,
-            Anomaly.detected_at < window_end,
-            Anomaly.status == "open",
+    return select(
+        select(func.coalesce(func.sum(by_type.c.cnt), 0)).scalar_subquery().label("total_events"),
+        select(func.coalesce(func.sum(by_type.c.invalid_cnt), 0)).scalar_subquery().label("invalid_events"),
+        select(func.coalesce(func.sum(by_type.c.failed_cnt), 0)).scalar_subquery().label("failed_events"),
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_array(ranked.c.event_type, ranked.c.cnt), ranked.c.rn
+                    )
+                ),
+                empty_json,
+            )
         )
+        .where(ranked.c.rn <= top_n)
+        .scalar_subquery()
+        .label("top_event_types"),
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_array(signals.c.rule_code, signals.c.severity, signals.c.hit_count),
+                        signals.c.hit_count.desc(),
+                        signals.c.rule_code,
+                    )
+                ),
+                empty_json,
+            )
+        )
+        .scalar_subquery()
+        .label("signals"),
+        select(func.coalesce(func.sum(signals.c.open_count), 0)).scalar_subquery().label("open_anomalies"),
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_array(
+                            Incident.id,
+                            Incident.family,
+                            Incident.severity,
+                            incident_hits.c.hits,
+                            Incident.rule_codes,
+                        ),
+                        Incident.severity_rank.desc(),
+                        incident_hits.c.hits.desc(),
+                        Incident.id,
+                    )
+                ),
+                empty_json,
+            )
+        )
+        .select_from(incident_hits.join(Incident, Incident.id == incident_hits.c.incident_id))
+        .scalar_subquery()
+        .label("incidents"),
     )
-    return int(session.execute(stmt).scalar_one())
 
 
 # -------------------------
 # Public API
 # -------------------------
 
-def collect_daily_summary_input(window_start: datetime, window_end: datetime) -> DailySummaryInput:
+def collect_summary_input(
+    session: Session,
+    window_start: datetime,
+    window_end: datetime,
+    *,
+    kind: str = "daily_ops",
+    top_n: int = 5,
+) -> DailySummaryInput:
     """
-    Daily Summary 입력을 구성한다.
-
-    ⚠️ 주의:
-    - get_db()는 generator이므로 with 사용 불가
-    - 아래처럼 next(get_db()) + finally close를 사용해야 함
+    임의 window의 summary 입력을 구성한다 (watermark 조회 + statement 1개).
+
+    - total_events / failure_rate: events.created_at 기준, invalid event rate
+    - failed_payment_events: verified 결제 실패 이벤트 (rules_runner와 같은 정의)
+    - window_start/end가 분 단위로 맞춰져 있어야 rollup을 쓴다 (아니면 raw로 셈)
+    - signals: anomalies.detected_at 기준 (rule_code, severity)별 hit_count
+      (window_start/end는 nullable이고 rule별 의미가 달라서 detected_at 사용)
+    - open_anomalies_count: window 내 탐지된 anomaly 중 아직 open인 것
+    - incidents: window 내 탐지된 anomaly가 묶인 incident (severity → anomaly 수 순)
     """
-    session = next(get_db())
-    try:
-        # 1) 기본 운영 지표
-        total_events = _count_events(session, window_start, window_end)
-
-        invalid_events = _count_invalid_events(session, window_start, window_end) if total_events > 0 else 0
-        invalid_rate = round((invalid_events / total_events) * 100, 2) if total_events > 0 else None
-        metrics = DailyMetrics(total_events=total_events, failure_rate_percent=invalid_rate)
-
-        # 2) Rule signals (anomalies 기반)
-        signals = _aggregate_rule_signals(session, window_start, window_end)
-
-        # 3) 보조 운영 정보
-        top_event_types = _optional_top_event_types(session, window_start, window_end, limit=5)
-        open_anomalies_count = _count_open_anomalies(session, window_start, window_end)
-
-        return DailySummaryInput(
-            window_start=window_start,
-            window_end=window_end,
-            signals=signals,
-            metrics=metrics,
-            top_event_types=top_event_types,
-            open_anomalies_count=open_anomalies_count,
+    watermark = get_rollup_watermark(session)
+    stmt = _summary_statement(window_start, window_end, watermark=watermark, top_n=top_n)
+    row = session.execute(stmt).one()
+
+    total_events = int(row.total_events)
+    invalid_events = int(row.invalid_events)
+    invalid_rate = round((invalid_events / total_events) * 100, 2) if total_events > 0 else None
+    metrics = DailyMetrics(
+        total_events=total_events,
+        failure_rate_percent=invalid_rate,
+        failed_payment_events=int(row.failed_events),
+    )
+
+    signals = [
+        RuleSignal(
+            rule_code=str(rule_code),
+            severity=str(severity),
+            hit_count=int(hit_count),
+            baseline=None,   # (선택) baseline을 따로 저장/계산한다면 채우기
+            evidence=None,   # (선택) 요약에 쓸 근거가 있으면 채우기
         )
-    finally:
-        # generator 세션은 직접 close 해야 함
-        session.close()
+        for rule_code, severity, hit_count in row.signals
+    ]
+
+    top_event_types = [(str(event_type), int(cnt)) for event_type, cnt in row.top_event_types]
+
+    incidents = [
+        IncidentSignal(
+            incident_id=int(incident_id),
+            family=str(family),
+            severity=str(severity),
+            anomaly_count=int(hits),
+            rule_codes=[str(c) for c in (rule_codes or [])],
+        )
+        for incident_id, family, severity, hits, rule_codes in row.incidents
+    ]
+
+    return DailySummaryInput(
+        kind=kind,
+        window_start=window_start,
+        window_end=window_end,
+        signals=signals,
+        metrics=metrics,
+        top_event_types=top_event_types,
+        open_anomalies_count=int(row.open_anomalies),
+        incidents=incidents,
+    )
@@ -0,0 +1,114 @@
+"""
+AI insight cache (Postgres, content-addressed)
+
+key = sha256(canonical JSON(ai_payload - window 시각) + model + PROMPT_VERSION)
+- window_start / window_end는 매 실행마다 달라지므로 key에서 뺀다.
+  (요약 문구에 시각이 들어가지 않음 → 숫자가 같은 날이면 같은 문구를 재사용)
+- 캐시 실패(DB 오류 등)는 summary 전송을 깨면 안 되므로 miss로 취급한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from sentinelops.core.config import settings
+from sentinelops.core.metrics import AI_CACHE_LOOKUPS
+from sentinelops.models.ai_insight_cache import AiInsightCache
+
+# key에서 제외 (실행마다 바뀌지만 요약 내용에는 영향 없음)
+_VOLATILE_KEYS = frozenset({"window_start", "window_end"})
+
+
+def cache_enabled() -> bool:
+    return settings.ai_cache_ttl_hours > 0 and settings.ai_cache_max_entries > 0
+
+
+def make_cache_key(ai_payload: dict[str, Any], *, model: str, prompt_version: str) -> str:
+    stable = {k: v for k, v in ai_payload.items() if k not in _VOLATILE_KEYS}
+    canonical = json.dumps(
+        {"payload": stable, "model": model, "prompt_version": prompt_version},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_cached_insight(db: Session, cache_key: str) -> Optional[str]:
+    now = datetime.now(timezone.utc)
+    try:
+        stmt = (
+            update(AiInsightCache)
+            .where(AiInsightCache.cache_key == cache_key, AiInsightCache.expires_at > now)
+            .values(hit_count=AiInsightCache.hit_count + 1, last_used_at=now)
+            .returning(AiInsightCache.summary_text)
+        )
+        text = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+    except Exception:
+        db.rollback()
+        text = None
+
+    AI_CACHE_LOOKUPS.labels("hit" if text else "miss").inc()
+    return text
+
+
+def store_insight(
+    db: Session,
+    cache_key: str,
+    *,
+    model: str,
+    prompt_version: str,
+    summary_text: str,
+) -> None:
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=settings.ai_cache_ttl_hours)
+    try:
+        stmt = insert(AiInsightCache).values(
+            cache_key=cache_key,
+            model=model,
+            prompt_version=prompt_version,
+            summary_text=summary_text,
+            hit_count=0,
+            created_at=now,
+            last_used_at=now,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={
+                "summary_text": stmt.excluded.summary_text,
+                "last_used_at": now,
+                "expires_at": expires_at,
+            },
+        )
+        db.execute(stmt)
+        _evict(db, now)
+        db.commit()
+    except Exception:
+        db.rollback()
+
+
+def _evict(db: Session, now: datetime) -> None:
+    """
+    TTL 지난 row + max_entries를 넘는 오래된(last_used_at) row 삭제.
+    저장할 때만 실행 (하루 몇 번 수준이라 비용 무시 가능)
+    """
+    keep = (
+        select(AiInsightCache.cache_key)
+        .order_by(AiInsightCache.last_used_at.desc())
+        .limit(settings.ai_cache_max_entries)
+    )
+    db.execute(
+        delete(AiInsightCache).where(
+            or_(AiInsightCache.expires_at <= now, AiInsightCache.cache_key.not_in(keep))
+        )
+    )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from functools import lru_cache
 import random
 import re
+import threading
 import time
 from typing import Optional, cast
 
@@ -10,7 +13,17 @@ from pydantic import SecretStr
 from openai import OpenAI
 from openai import RateLimitError, APITimeoutError, APIConnectionError, AuthenticationError, PermissionDeniedError, BadRequestError
 
+from sqlalchemy.orm import Session
+
 from sentinelops.core.config import settings
+from sentinelops.core.metrics import AI_INSIGHT_RESULTS, OPENAI_LATENCY
+from sentinelops.services.reporting.ai_cache import (
+    cache_enabled,
+    get_cached_insight,
+    make_cache_key,
+    store_insight,
+)
+from sentinelops.services.reporting.ai_payload import PAYLOAD_LEGEND, count_tokens, encode_ai_payload
 
 
 @dataclass(frozen=True)
@@ -19,7 +32,13 @@ class AiInsightResult:
     model: Optional[str] = None
     error_code: Optional[str] = None     # ✅ DB에 저장할 짧은 코드
     error_detail: Optional[str] = None   # ✅ 콘솔 로그용 상세(길어질 수 있음)
+    cached: bool = False                 # ✅ ai_insight_cache에서 재사용한 결과
+    prompt_chars: Optional[int] = None   # ✅ 실제로 보낸 prompt 크기 (cache hit이면 None)
+    prompt_tokens: Optional[int] = None
+
 
+# 프롬프트(_BASE_PROMPT / tone / payload encoding / _sanitize 규칙)를 바꾸면 올린다 → 기존 캐시 무효화
+PROMPT_VERSION = "v0.5-2"
 
 _BASE_PROMPT = """You are an operations summary assistant for a billing and observability system.
 
@@ -107,36 +126,203 @@ def _pick_tone_block(max_severity: str) -> str:
     return _TONE_LOW
 
 
-def _call_openai_once(*, api_key: str, model: str, prompt: str, timeout_sec: int) -> str:
-    client = OpenAI(api_key=api_key)
-    resp = client.responses.create(
-        model=model,
-        input=prompt,
-        timeout=timeout_sec,
-    )
-    return resp.output_text or ""
+class AiDeadlineExceeded(Exception):
+    """전체 deadline(ai_summary_deadline_sec) 안에 응답을 못 받음"""
+
+
+# attempt 하나에 최소한 이 정도 시간은 남아 있어야 시도한다
+_MIN_ATTEMPT_SEC = 1.0
+
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """
+    프로세스 동안 재사용하는 client (내부 httpx connection pool 유지 → 매 시도마다 TLS handshake 안 함)
+    - retry/backoff는 _call_openai_with_retry가 deadline 기준으로 직접 하므로 SDK retry는 끈다
+    - base_url: 로컬 fake server 등으로 돌릴 때 (OPENAI_BASE_URL)
+    """
+    return OpenAI(api_key=api_key, base_url=base_url or None, max_retries=0)
 
-def _call_openai_with_retry(*, api_key: str, model: str, prompt: str, timeout_sec: int) -> str:
+
+def _call_openai_once(*, client: OpenAI, model: str, prompt: str, timeout_sec: float) -> str:
+    started = time.perf_counter()
+    code = "ok"
+    try:
+        resp = client.responses.create(
+            model=model,
+            input=prompt,
+            timeout=timeout_sec,
+        )
+        return resp.output_text or ""
+    except Exception as e:
+        code = type(e).__name__
+        raise
+    finally:
+        # retry 시도마다 1건씩 기록
+        OPENAI_LATENCY.labels(code).observe(time.perf_counter() - started)
+
+
+def _call_openai_with_retry(
+    *,
+    client: OpenAI,
+    model: str,
+    prompt: str,
+    timeout_sec: float,
+    deadline: float,
+) -> str:
+    """
+    attempt별 timeout / backoff 모두 전체 deadline(time.monotonic 기준) 안으로 자른다.
+    남은 시간이 부족하면 더 시도하지 않고 AiDeadlineExceeded.
+    """
     max_attempts = 3
     base_delay = 1.5
 
     last_err: Exception | None = None
     for attempt in range(1, max_attempts + 1):
+        remaining = deadline - time.monotonic()
+        if remaining < _MIN_ATTEMPT_SEC:
+            raise AiDeadlineExceeded(f"deadline reached after {attempt - 1} attempt(s): {last_err!r}")
         try:
-            return _call_openai_once(api_key=api_key, model=model, prompt=prompt, timeout_sec=timeout_sec)
+            return _call_openai_once(
+                client=client,
+                model=model,
+                prompt=prompt,
+                timeout_sec=min(timeout_sec, remaining),
+            )
         except (RateLimitError, APITimeoutError, APIConnectionError) as e:
             last_err = e
             if attempt == max_attempts:
                 break
             sleep_s = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 0.6)
+            remaining = deadline - time.monotonic()
+            if sleep_s + _MIN_ATTEMPT_SEC > remaining:
+                raise AiDeadlineExceeded(f"no budget left for retry {attempt + 1}: {e!r}") from e
             time.sleep(sleep_s)
 
     assert last_err is not None
     raise last_err
 
 
-def generate_ai_insight(ai_payload: dict) -> AiInsightResult:
+# -------------------------
+# Public API
+# -------------------------
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # summary job이 동시에 여러 개 돌아도 AI 호출이 서로 줄 서지 않게
+            workers = max(2, int(getattr(settings, "summary_max_workers", 2)))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-insight")
+        return _executor
+
+
+def _deadline_sec() -> float:
+    return float(getattr(settings, "ai_summary_deadline_sec", 20))
+
+
+@dataclass
+class PendingAiInsight:
+    """
+    submit_ai_insight()가 돌려주는 handle.
+    caller는 그 사이 deterministic 메시지를 만들고, result()로 남은 deadline만큼만 기다린다.
+    """
+
+    deadline: float
+    future: Future
+    db: Optional[Session] = None
+    cache_key: Optional[str] = None
+    prompt_chars: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    _result: Optional[AiInsightResult] = None
+
+    def result(self) -> AiInsightResult:
+        if self._result is not None:
+            return self._result
+
+        try:
+            result = self.future.result(timeout=max(0.0, self.deadline - time.monotonic()))
+        except FutureTimeoutError:
+            # worker는 deadline 기준으로 스스로 끝나므로 여기서는 결과만 버린다
+            result = AiInsightResult(
+                summary_text=None,
+                model=getattr(settings, "ai_summary_model", None),
+                error_code="ai_deadline_exceeded",
+                error_detail=f"no response within {_deadline_sec():g}s",
+            )
+        AI_INSIGHT_RESULTS.labels(result.error_code or "ok").inc()
+        if self.prompt_chars is not None:
+            result = replace(result, prompt_chars=self.prompt_chars, prompt_tokens=self.prompt_tokens)
+
+        # cache 저장은 caller thread에서 (Session은 thread 간에 공유하지 않는다)
+        if self.db is not None and self.cache_key and result.summary_text and result.model:
+            store_insight(
+                self.db,
+                self.cache_key,
+                model=result.model,
+                prompt_version=PROMPT_VERSION,
+                summary_text=result.summary_text,
+            )
+        self._result = result
+        return result
+
+
+def submit_ai_insight(ai_payload: dict, *, db: Optional[Session] = None) -> PendingAiInsight:
+    """
+    AI insight 생성을 background thread로 시작한다.
+    - deadline(ai_summary_deadline_sec)은 지금부터 retry 전체에 걸쳐 적용
+    - db를 넘기면 ai_insight_cache를 먼저 본다 (같은 payload + model + PROMPT_VERSION)
+      - hit: OpenAI 호출 없이 완료된 handle 반환 (cached=True)
+      - miss: 호출 후 성공한 결과만 result()에서 저장
+    """
+    deadline = time.monotonic() + _deadline_sec()
+    model = getattr(settings, "ai_summary_model", None)
+    cache_key: Optional[str] = None
+
+    if db is not None and model and getattr(settings, "openai_api_key", None) and cache_enabled():
+        cache_key = make_cache_key(ai_payload, model=model, prompt_version=PROMPT_VERSION)
+        cached_text = get_cached_insight(db, cache_key)
+        if cached_text:
+            done: Future = Future()
+            done.set_result(AiInsightResult(summary_text=cached_text, model=model, cached=True))
+            return PendingAiInsight(deadline=deadline, future=done)
+
+    prompt = _build_prompt(ai_payload)
+    future = _get_executor().submit(_generate_ai_insight, prompt, deadline)
+    return PendingAiInsight(
+        deadline=deadline,
+        future=future,
+        db=db,
+        cache_key=cache_key,
+        prompt_chars=len(prompt),
+        prompt_tokens=count_tokens(prompt, model=model),
+    )
+
+
+def generate_ai_insight(ai_payload: dict, *, db: Optional[Session] = None) -> AiInsightResult:
+    """동기 버전: submit 후 deadline까지 기다린다."""
+    return submit_ai_insight(ai_payload, db=db).result()
+
+
+def _build_prompt(ai_payload: dict) -> str:
+    max_sev = str(ai_payload.get("max_severity", "low"))
+    return (
+        _BASE_PROMPT
+        + "\n"
+        + _pick_tone_block(max_sev)
+        + "\n"
+        + "Aggregated operational snapshot (compact JSON). "
+        + PAYLOAD_LEGEND
+        + "\n"
+        + encode_ai_payload(ai_payload)
+    )
+
+
+def _generate_ai_insight(prompt: str, deadline: float) -> AiInsightResult:
     key_obj = getattr(settings, "openai_api_key", None)
     model_obj = getattr(settings, "ai_summary_model", None)
 
@@ -147,27 +333,25 @@ def generate_ai_insight(ai_payload: dict) -> AiInsightResult:
     model = cast(str, model_obj)
 
     api_key: str = key_obj.get_secret_value()
-    timeout_sec: int = int(getattr(settings, "ai_summary_timeout_sec", 12))
-
-    max_sev = str(ai_payload.get("max_severity", "low"))
-    tone_block = _pick_tone_block(max_sev)
-
-    prompt = (
-        _BASE_PROMPT
-        + "\n"
-        + tone_block
-        + "\n"
-        + "Aggregated operational snapshot:\n"
-        + repr(ai_payload)
-    )
+    timeout_sec: float = float(getattr(settings, "ai_summary_timeout_sec", 12))
+    client = _get_client(api_key, getattr(settings, "openai_base_url", None))
 
     try:
-        raw = _call_openai_with_retry(api_key=api_key, model=model, prompt=prompt, timeout_sec=timeout_sec)
+        raw = _call_openai_with_retry(
+            client=client,
+            model=model,
+            prompt=prompt,
+            timeout_sec=timeout_sec,
+            deadline=deadline,
+        )
         cleaned = _sanitize(raw)
         if not cleaned:
             return AiInsightResult(summary_text=None, model=model, error_code="ai_empty", error_detail=None)
         return AiInsightResult(summary_text=cleaned, model=model, error_code=None, error_detail=None)
 
+    except AiDeadlineExceeded as e:
+        return AiInsightResult(summary_text=None, model=model, error_code="ai_deadline_exceeded", error_detail=str(e))
+
     except RateLimitError as e:
         msg = str(e).lower()
         if "quota" in msg or "billing" in msg or "insufficient_quota" in msg:
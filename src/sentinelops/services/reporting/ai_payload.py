@@ -0,0 +1,125 @@
+"""
+AI prompt용 compact payload encoder
+
+repr(ai_payload)는 key마다 따옴표 + 긴 이름 + ISO 시각 + 모든 rule을 그대로 넣어서
+prompt token(= latency / 비용)이 불필요하게 커진다. 여기서는
+- null / 빈 값 제거
+- key를 짧은 이름으로 일관되게 치환 (prompt 앞에 legend 1줄)
+- list 길이 제한 (나머지는 "+N more")
+- float 소수 2자리
+- window 시각 제거 (요약 문구에는 기간(win)만 필요)
+후 공백 없는 JSON으로 만든다.
+
+token 수는 tiktoken이 설치돼 있으면 그걸로, 없으면 글자 수 기반 근사치로 센다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Optional
+
+try:  # optional: 정확한 token 수 (없으면 근사치)
+    import tiktoken
+except ImportError:  # pragma: no cover - 설치 여부에 따라
+    tiktoken = None  # type: ignore[assignment]
+
+MAX_LIST_ITEMS = 5
+
+# 실행마다 바뀌고 요약 문구에는 쓰이지 않는 값
+_OMIT_KEYS = frozenset({"window_start", "window_end"})
+
+# 원래 key → prompt용 key (같은 key는 어느 위치에서든 같은 이름)
+KEY_ABBREVIATIONS: dict[str, str] = {
+    "summary_window": "win",
+    "max_severity": "max_sev",
+    "open_anomalies_count": "open",
+    "top_event_types": "top",
+    "event_type": "type",
+    "count": "n",
+    "rules_triggered": "rules",
+    "rule_code": "rule",
+    "severity": "sev",
+    "hit_count": "hits",
+    "baseline": "base",
+    "system_metrics": "sys",
+    "total_events": "total",
+    "invalid_event_rate_percent": "invalid_pct",
+    "failed_payment_events": "failed_pay",
+    "incidents": "inc",
+    "family": "fam",
+    "anomaly_count": "n_anom",
+    "rule_codes": "codes",
+    "trends": "trend",
+    "metric": "m",
+    "current": "cur",
+    "average": "avg",
+    "history_count": "hist_n",
+    "change_vs_avg_percent": "chg_pct",
+}
+
+PAYLOAD_LEGEND = (
+    "Keys: win=summary window, sev=severity, open=open anomalies, top=top event types, "
+    "n=count, hits=rule hit count, base=rule baseline, sys=system metrics, "
+    "invalid_pct=invalid event rate %, failed_pay=failed payment events, "
+    "inc=incidents (related anomalies grouped: fam=rule family, n_anom=anomalies, codes=rules), "
+    "trend=change vs recent runs (cur=current, avg=recent average, hist_n=runs averaged, "
+    "chg_pct=% change vs avg). '+N more' = N items omitted."
+)
+
+# tiktoken이 없을 때: 영문/JSON 기준 대략 4글자 = 1 token
+_CHARS_PER_TOKEN = 4.0
+
+
+def _is_empty(v: Any) -> bool:
+    return v is None or v == [] or v == {} or v == ""
+
+
+def _compact(value: Any, max_items: int) -> Any:
+    if isinstance(value, dict):
+        out: dict[str, Any] = {}
+        for k, v in value.items():
+            if k in _OMIT_KEYS:
+                continue
+            v = _compact(v, max_items)
+            if _is_empty(v):
+                continue
+            out[KEY_ABBREVIATIONS.get(k, k)] = v
+        return out
+    if isinstance(value, (list, tuple)):
+        items = [c for c in (_compact(v, max_items) for v in value) if not _is_empty(c)]
+        if len(items) > max_items:
+            # 입력 list는 이미 중요도 순 (compose에서 정렬)
+            items = [*items[:max_items], f"+{len(items) - max_items} more"]
+        return items
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else round(value, 2)
+    return value
+
+
+def encode_ai_payload(ai_payload: dict[str, Any], *, max_items: int = MAX_LIST_ITEMS) -> str:
+    """compose_report().ai_payload → prompt에 넣을 compact JSON 문자열"""
+    return json.dumps(
+        _compact(ai_payload, max_items),
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def count_tokens(text: str, *, model: Optional[str] = None) -> int:
+    """
+    로컬 token 수 측정 (API 호출 없음).
+    tiktoken이 없거나 encoding을 못 쓰면 글자 수 기반 근사치.
+    """
+    if tiktoken is not None:
+        try:
+            try:
+                enc = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("o200k_base")
+            except KeyError:
+                enc = tiktoken.get_encoding("o200k_base")
+            return len(enc.encode(text))
+        except Exception:
+            # encoding 파일을 못 받는 환경 등 → 근사치로
+            pass
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
@@ -1,53 +1,152 @@
 from __future__ import annotations
 
-from typing import cast
+from datetime import datetime
+from typing import Any, Mapping, cast
 
-from sqlalchemy import case, desc, select, or_
+from sqlalchemy import Select, desc, select, tuple_
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import true as sql_true
 
+from sentinelops.core.pagination import decode_cursor, encode_cursor
 from sentinelops.models.anomaly import Anomaly
 
+# list API(AnomalyOut)에 필요한 컬럼만. ORM 객체 대신 row mapping으로 읽는다.
+ANOMALY_LIST_COLUMNS = (
+    Anomaly.id,
+    Anomaly.rule_code,
+    Anomaly.severity,
+    Anomaly.title,
+    Anomaly.status,
+    Anomaly.event_type,
+    Anomaly.provider_event_id,
+    Anomaly.window_start,
+    Anomaly.window_end,
+    Anomaly.detected_at,
+    Anomaly.evidence,
+    Anomaly.acknowledged_at,
+    Anomaly.resolved_at,
+    Anomaly.updated_at,
+    Anomaly.incident_id,
+)
+
 
 def severity_rank_expr():
     # high > medium > low (모르는 값은 맨 아래)
-    return case(
-        (Anomaly.severity == "high", 3),
-        (Anomaly.severity == "medium", 2),
-        (Anomaly.severity == "low", 1),
-        else_=0,
-    )
+    # ✅ CASE 식 대신 저장된 generated column → (status, severity_rank, detected_at) 인덱스 사용 가능
+    return Anomaly.severity_rank
 
 
-def list_anomalies(
-    db: Session,
-    status: str | None = None,
-    only_open: bool = False,
-    sort: str = "recent",
-    limit: int = 50,
-    demo_only: bool = False,
-) -> list[Anomaly]:
-    stmt = select(Anomaly)
+def _sort_key_columns(sort: str) -> list[Any]:
+    # 모든 키가 DESC → row value 비교 한 번으로 keyset 조건 표현 가능
+    # id는 detected_at이 같은 row 사이의 tie-breaker
+    if sort == "severity_desc":
+        return [severity_rank_expr(), Anomaly.detected_at, Anomaly.id]
+    return [Anomaly.detected_at, Anomaly.id]
 
+
+def encode_anomaly_cursor(row: Mapping[str, Any], sort: str) -> str:
+    # row: list_anomaly_rows()가 돌려준 mapping
+    payload: dict[str, Any] = {
+        "s": sort,
+        "d": row["detected_at"].isoformat(),
+        "i": row["id"],
+    }
+    if sort == "severity_desc":
+        payload["r"] = row["severity_rank"]
+    return encode_cursor(payload)
+
+
+def _decode_anomaly_cursor(token: str, sort: str) -> list[Any]:
+    payload = decode_cursor(token)
+    if payload.get("s") != sort:
+        raise ValueError("Cursor does not match sort order")
+
+    try:
+        detected_at = datetime.fromisoformat(payload["d"])
+        anomaly_id = int(payload["i"])
+        if sort == "severity_desc":
+            return [int(payload["r"]), detected_at, anomaly_id]
+        return [detected_at, anomaly_id]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _list_stmt(
+    stmt: Select,
+    *,
+    status: str | None,
+    only_open: bool,
+    sort: str,
+    limit: int,
+    demo_only: bool,
+    cursor: str | None,
+) -> Select:
     if only_open:
         stmt = stmt.where(Anomaly.status == "open")
     elif status:
         stmt = stmt.where(Anomaly.status == status)
 
-    # ✅ demo_only: title prefix OR evidence.demo=true 둘 중 하나면 데모로 인정
+    # ✅ demo_only: is_demo 컬럼 (partial index 사용)
     if demo_only:
-        stmt = stmt.where(
-            or_(
-                Anomaly.title.ilike("[demo]%"),
-                Anomaly.evidence["demo"].as_boolean() == sql_true(),
-            )
-        )
+        stmt = stmt.where(Anomaly.is_demo)
 
-    if sort == "severity_desc":
-        stmt = stmt.order_by(desc(severity_rank_expr()), desc(Anomaly.detected_at))
-    else:
-        # recent
-        stmt = stmt.order_by(desc(Anomaly.detected_at))
+    key_columns = _sort_key_columns(sort)
+
+    # ✅ keyset: OFFSET 없이 "마지막 키보다 작은 것"부터 → 깊은 페이지도 index range scan
+    if cursor:
+        after = _decode_anomaly_cursor(cursor, sort)
+        stmt = stmt.where(tuple_(*key_columns) < tuple_(*after))
+
+    stmt = stmt.order_by(*[desc(c) for c in key_columns])
 
-    stmt = stmt.limit(limit)
+    return stmt.limit(limit)
+
+
+def list_anomalies(
+    db: Session,
+    status: str | None = None,
+    only_open: bool = False,
+    sort: str = "recent",
+    limit: int = 50,
+    demo_only: bool = False,
+    cursor: str | None = None,
+) -> list[Anomaly]:
+    """
+    cursor: 이전 페이지 마지막 row에서 encode_anomaly_cursor()로 만든 토큰.
+    잘못된 토큰이면 ValueError.
+    """
+    stmt = _list_stmt(
+        select(Anomaly),
+        status=status,
+        only_open=only_open,
+        sort=sort,
+        limit=limit,
+        demo_only=demo_only,
+        cursor=cursor,
+    )
     return cast(list[Anomaly], db.execute(stmt).scalars().all())
+
+
+def list_anomaly_rows(
+    db: Session,
+    status: str | None = None,
+    only_open: bool = False,
+    sort: str = "recent",
+    limit: int = 50,
+    demo_only: bool = False,
+    cursor: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    list_anomalies와 같은 조건이지만 ORM 객체 대신 필요한 컬럼만 dict로 돌려준다.
+    - identity map / attribute instrumentation 비용 없음
+    - severity_rank는 cursor용으로만 포함 (응답에서는 호출자가 제거)
+    """
+    stmt = _list_stmt(
+        select(*ANOMALY_LIST_COLUMNS, severity_rank_expr().label("severity_rank")),
+        status=status,
+        only_open=only_open,
+        sort=sort,
+        limit=limit,
+        demo_only=demo_only,
+        cursor=cursor,
+    )
+    return [dict(r) for r in db.execute(stmt).mappings()]
@@ -15,10 +15,11 @@ SentinelOps v0.4 - Compose Layer
 - ComposedReport: overall_status, highlights, watch_list, ai_payload
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
 from .aggregation import DailySummaryInput, RuleSignal
+from .kinds import SummaryKind, get_summary_kind
 
 Severity = Literal["low", "medium", "high"]
 
@@ -29,6 +30,8 @@ class ComposedReport:
     highlights: list[str]
     watch_list: list[str]
     ai_payload: dict[str, Any]
+    # 이전 snapshot 대비 변화 (trends.py에서 계산된 문구)
+    trend_lines: list[str] = field(default_factory=list)
 
 
 def _severity_rank(sev: str) -> int:
@@ -60,58 +63,82 @@ def _max_severity(signals: list[RuleSignal]) -> str:
     return best if best_rank > 0 else "low"
 
 
-def _build_overall_status(signals_sorted: list[RuleSignal], open_anomalies_count: int) -> str:
+def _build_overall_status(
+    signals_sorted: list[RuleSignal],
+    open_anomalies_count: int,
+    period_label: str,
+) -> str:
     """
     Overall은 deterministic하게(규칙 기반) 만든다.
     - AI에 Overall 판단을 맡기지 않는다.
     """
     if any(s.severity == "high" for s in signals_sorted):
-        return "System had critical anomalies in the last 24 hours."
+        return f"System had critical anomalies in {period_label}."
     if any(s.severity == "medium" for s in signals_sorted):
         return "System was mostly stable with minor anomalies."
     if open_anomalies_count > 0:
         return "System was stable, but there are open anomalies to review."
-    return "System was stable in the last 24 hours."
+    return f"System was stable in {period_label}."
 
 
-def compose_report(daily_input: DailySummaryInput) -> ComposedReport:
+def compose_report(
+    daily_input: DailySummaryInput,
+    *,
+    spec: SummaryKind | None = None,
+    trend_lines: list[str] | None = None,
+    trend_payload: list[dict[str, Any]] | None = None,
+) -> ComposedReport:
+    """
+    spec: 기간 문구 / summary_window (기본은 kind 설정, custom window면 SummaryKind.for_window()).
+    trend_lines / trend_payload: 이전 snapshot과 비교한 결과 (reporting.trends).
+    compose는 받은 값을 배치만 하고 계산하지 않는다.
+    """
+    spec = spec or get_summary_kind(daily_input.kind)
     signals_sorted = _sort_signals(daily_input.signals)
     max_sev = _max_severity(signals_sorted)
 
-    overall = _build_overall_status(signals_sorted, daily_input.open_anomalies_count)
+    overall = _build_overall_status(signals_sorted, daily_input.open_anomalies_count, spec.period_label)
 
-    highlights: list[str] = []
+    metric_lines: list[str] = []
     watch: list[str] = []
 
     # ---- (A) 운영자가 항상 궁금해하는 지표 ----
-    highlights.append(f"Open anomalies: {daily_input.open_anomalies_count}")
-    highlights.append(f"Total events: {daily_input.metrics.total_events}")
+    metric_lines.append(f"Open anomalies: {daily_input.open_anomalies_count}")
+    if daily_input.incidents:
+        grouped = sum(i.anomaly_count for i in daily_input.incidents)
+        metric_lines.append(f"Incidents: {len(daily_input.incidents)} ({grouped} anomalies grouped)")
+    metric_lines.append(f"Total events: {daily_input.metrics.total_events}")
 
     if daily_input.metrics.failure_rate_percent is not None:
-        highlights.append(f"Invalid event rate: {daily_input.metrics.failure_rate_percent}%")
+        metric_lines.append(f"Invalid event rate: {daily_input.metrics.failure_rate_percent}%")
+
+    if daily_input.metrics.failed_payment_events:
+        metric_lines.append(f"Failed payment events: {daily_input.metrics.failed_payment_events}")
 
     # Top event types (상위 2개만 표시)
     if daily_input.top_event_types:
         top2 = daily_input.top_event_types[:2]
         top_text = ", ".join([f"{t}({c})" for t, c in top2])
-        highlights.append(f"Top event types: {top_text}")
+        metric_lines.append(f"Top event types: {top_text}")
 
     # ---- (B) 룰 시그널 상위 3개 ----
+    signal_lines: list[str] = []
     for s in signals_sorted[:3]:
         line = f"{s.rule_code}: {s.hit_count} hits"
         if s.baseline is not None:
             line += f" (baseline {s.baseline})"
-        highlights.append(line)
+        signal_lines.append(line)
 
     # ---- (C) watch list: 다음 우선순위 시그널 몇 개 ----
     for s in signals_sorted[3:6]:
         watch.append(f"{s.rule_code}: monitor trend (hits {s.hit_count})")
 
     # Slack 스팸 방지: highlights를 너무 길게 하지 않음
-    highlights = highlights[:6]
+    # 자르는 건 지표 줄만 (시그널 상위 3개는 watch list에도 없으므로 항상 남긴다)
+    highlights = metric_lines[: max(0, 7 - len(signal_lines))] + signal_lines
 
     ai_payload: dict[str, Any] = {
-        "summary_window": "last_24_hours",
+        "summary_window": spec.window_key,
         "window_start": daily_input.window_start.isoformat(),
         "window_end": daily_input.window_end.isoformat(),
         # ✅ AI 톤 힌트(판정은 rule engine 결과 집계)
@@ -130,7 +157,18 @@ def compose_report(daily_input: DailySummaryInput) -> ComposedReport:
         "system_metrics": {
             "total_events": daily_input.metrics.total_events,
             "invalid_event_rate_percent": daily_input.metrics.failure_rate_percent,
+            "failed_payment_events": daily_input.metrics.failed_payment_events,
         },
+        "incidents": [
+            {
+                "family": i.family,
+                "severity": i.severity,
+                "anomaly_count": i.anomaly_count,
+                "rule_codes": i.rule_codes,
+            }
+            for i in daily_input.incidents
+        ],
+        "trends": trend_payload or [],
     }
 
     return ComposedReport(
@@ -138,4 +176,5 @@ def compose_report(daily_input: DailySummaryInput) -> ComposedReport:
         highlights=highlights,
         watch_list=watch,
         ai_payload=ai_payload,
+        trend_lines=list(trend_lines or []),
     )
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, date
-from typing import Optional, Any
+from typing import Any, Optional
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
+from sentinelops.core.config import settings
 from sentinelops.db.session import get_db
+from sentinelops.services.event_rollups import floor_to_bucket
+from sentinelops.services.reporting.aggregation import collect_summary_input
 from sentinelops.services.reporting.compose import compose_report
-from sentinelops.services.reporting.ai_insight import generate_ai_insight
+from sentinelops.services.reporting.ai_insight import submit_ai_insight
+from sentinelops.services.reporting.kinds import SummaryKind, custom_window_key, get_summary_kind
+from sentinelops.services.reporting.trends import (
+    build_snapshot,
+    compute_trends,
+    format_trend_lines,
+    load_previous_snapshots,
+    trends_payload,
+)
 
 # ✅ 너 프로젝트 실제 모델 위치에 맞게 필요하면 이 import만 조정
-from sentinelops.models.daily_summary_delivery import DailySummaryDelivery  # type: ignore
+from sentinelops.models.daily_summary_delivery import (  # type: ignore
+    SCHEDULED_WINDOW_KEY,
+    DailySummaryDelivery,
+)
 
-from sentinelops.services.reporting.delivery.slack import post_to_slack
+from sentinelops.services.reporting.delivery.slack import DEFAULT_CHANNEL, post_to_slack
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -31,59 +51,99 @@ def _env_truthy(name: str) -> bool:
     return v in ("1", "true", "yes", "y", "on")
 
 
-def _summary_window(now: datetime) -> tuple[datetime, datetime, date]:
-    # last 24h window
-    window_end = now
-    window_start = now - timedelta(hours=24)
-    summary_date = now.date()
-    return window_start, window_end, summary_date
-
-
-def _begin_delivery_or_skip(
+def _summary_window(
+    spec: SummaryKind,
+    now: datetime,
+    window_start: Optional[datetime] = None,
+    window_end: Optional[datetime] = None,
+) -> tuple[datetime, datetime, date, str]:
+    """
+    기본: now 기준 spec.window 만큼 거슬러 올라간 window.
+    - 분 단위로 내림 → event_rollups bucket 경계와 맞아서 raw 스캔 없이 집계 가능
+    - summary_date = window_end 기준 날짜
+    - window_key: 정기 실행은 SCHEDULED_WINDOW_KEY, window를 직접 주면 window 자체로 만든 key
+      → (kind, summary_date, channel, window_key)가 idempotency key
+    """
+    end = floor_to_bucket(window_end or now, 60)
+    start = floor_to_bucket(window_start, 60) if window_start else end - spec.window
+    if start >= end:
+        raise ValueError("window_start must be earlier than window_end")
+    if window_start is None and window_end is None:
+        window_key = SCHEDULED_WINDOW_KEY
+    else:
+        window_key = custom_window_key(start, end)
+    return start, end, end.date(), window_key
+
+
+def _claim_delivery(
     db: Session,
     *,
     kind: str,
+    channel: str,
     summary_date: date,
+    window_key: str,
     window_start: datetime,
     window_end: datetime,
 ) -> tuple[Optional[DailySummaryDelivery], Optional[str]]:
+    """
+    (kind, summary_date, channel, window_key) row를 claim한다. 여러 worker가 동시에 돌아도 1번만 전송.
+    1) INSERT ... ON CONFLICT DO NOTHING 으로 row 보장
+    2) SELECT ... FOR UPDATE SKIP LOCKED → 다른 worker가 claim 중이면 기다리지 않고 skip
+    3) status=sending + lease_expires_at 기록 후 commit (row lock은 여기서 풀리고 lease가 대신함)
+    """
     force_resend = _env_truthy("FORCE_RESEND_DAILY_SUMMARY")
+    now = datetime.now(timezone.utc)
 
-    existing = (
-        db.query(DailySummaryDelivery)
-        .filter(DailySummaryDelivery.kind == kind)
-        .filter(DailySummaryDelivery.summary_date == summary_date)
-        .one_or_none()
+    db.execute(
+        insert(DailySummaryDelivery)
+        .values(
+            kind=kind,
+            summary_date=summary_date,
+            channel=channel,
+            window_key=window_key,
+            status="pending",
+            window_start=window_start,
+            window_end=window_end,
+            used_ai=False,
+        )
+        .on_conflict_do_nothing(index_elements=["kind", "summary_date", "channel", "window_key"])
     )
 
-    if existing and not force_resend:
-        return None, "already_sent"
-
-    if existing and force_resend:
-        # 재전송이면 기존 레코드 재사용(업데이트)
-        existing.window_start = window_start
-        existing.window_end = window_end
-        existing.status = "sending"
-        existing.used_ai = False
-        existing.ai_error = None
-        existing.slack_response = None
-        db.commit()
-        return existing, None
-
-    rec = DailySummaryDelivery(
-        kind=kind,
-        summary_date=summary_date,
-        status="sending",
-        window_start=window_start,
-        window_end=window_end,
-        delivered_at=None,
-        used_ai=False,
-        ai_error=None,
-        slack_response=None,
-    )
-    db.add(rec)
+    rec = db.execute(
+        select(DailySummaryDelivery)
+        .where(
+            DailySummaryDelivery.kind == kind,
+            DailySummaryDelivery.summary_date == summary_date,
+            DailySummaryDelivery.channel == channel,
+            DailySummaryDelivery.window_key == window_key,
+        )
+        .with_for_update(skip_locked=True)
+    ).scalar_one_or_none()
+
+    skip_reason: Optional[str] = None
+    if rec is None:
+        skip_reason = "claimed_elsewhere"
+    elif rec.status == "sending" and rec.lease_expires_at and rec.lease_expires_at > now:
+        skip_reason = "in_progress"
+    elif rec.status == "sent" and not force_resend:
+        skip_reason = "already_sent"
+
+    if skip_reason:
+        db.rollback()
+        return None, skip_reason
+
+    assert rec is not None
+    # 새 row / 실패 / lease 만료 / 재전송 모두 같은 경로로 초기화
+    rec.window_start = window_start
+    rec.window_end = window_end
+    rec.status = "sending"
+    rec.lease_expires_at = now + timedelta(seconds=settings.summary_lease_sec)
+    rec.used_ai = False
+    rec.ai_error = None
+    rec.ai_prompt_chars = None
+    rec.ai_prompt_tokens = None
+    rec.slack_response = None
     db.commit()
-    db.refresh(rec)
     return rec, None
 
 
@@ -96,28 +156,38 @@ def _finalize_record(
     used_ai: bool,
     ai_error: Optional[str],          # ✅ 코드만 저장
     slack_response: Optional[str],
+    snapshot: Optional[dict[str, Any]] = None,
+    ai_prompt_chars: Optional[int] = None,
+    ai_prompt_tokens: Optional[int] = None,
 ) -> None:
     record.status = status
+    record.lease_expires_at = None
     record.delivered_at = delivered_at
     record.used_ai = used_ai
     record.ai_error = ai_error
+    record.ai_prompt_chars = ai_prompt_chars
+    record.ai_prompt_tokens = ai_prompt_tokens
     record.slack_response = slack_response
+    if snapshot is not None:
+        record.snapshot = snapshot
 
     db.commit()
 
 
 def _compose_slack_message(
     *,
+    title: str,
     summary_date: date,
     overall: str,
     highlights: list[str],
     watch_list: list[str],
+    trend_lines: list[str],
     ai_text: Optional[str],
     ai_error_code: Optional[str],
 ) -> str:
     # Slack 출력: 기존 스타일 유지
     lines: list[str] = []
-    lines.append(f"🗓 Daily Ops Summary – {summary_date.isoformat()}")
+    lines.append(f"🗓 {title} – {summary_date.isoformat()}")
     lines.append("")
     lines.append("Overall:")
     lines.append(overall)
@@ -126,6 +196,12 @@ def _compose_slack_message(
     for h in highlights:
         lines.append(f"• {h}")
 
+    if trend_lines:
+        lines.append("")
+        lines.append("Trends:")
+        for t in trend_lines:
+            lines.append(f"• {t}")
+
     if watch_list:
         lines.append("")
         lines.append("Watch:")
@@ -144,42 +220,59 @@ def _compose_slack_message(
     return "\n".join(lines).strip() + "\n"
 
 
-def _collect_daily_summary_input_compat(
-    db: Session,
-    window_start: datetime,
-    window_end: datetime,
-) -> Any:
-    """
-    aggregation.collect_daily_summary_input 시그니처가 바뀌어도 여기서 흡수.
-    - db를 받는 버전 / 안 받는 버전 둘 다 대응
-    """
-    from sentinelops.services.reporting import aggregation as aggregation_mod  # 로컬 import
-
-    fn = getattr(aggregation_mod, "collect_daily_summary_input")
-    try:
-        return fn(db, window_start, window_end)
-    except TypeError:
-        return fn(window_start, window_end)
+def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
+    return run_ops_summary("daily_ops", now=now)
 
 
-def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
+def run_ops_summary(
+    kind: str,
+    *,
+    channel: str = DEFAULT_CHANNEL,
+    now: Optional[datetime] = None,
+    window_start: Optional[datetime] = None,
+    window_end: Optional[datetime] = None,
+) -> dict:
+    """
+    summary 파이프라인 (aggregate → compose → AI → deliver)을 kind/window/channel 단위로 실행.
+    - kind: daily_ops / weekly_ops / monthly_ops (reporting.kinds)
+    - channel: SLACK_SUMMARY_WEBHOOKS의 이름 (기본 "default" = SLACK_WEBHOOK_URL)
+    - window_start/end를 주면 custom window (기본은 now 기준 kind의 기간)
+    - 자기 session을 쓰므로 여러 job을 thread로 동시에 돌려도 된다 (reporting.runner)
+    """
+    started = time.perf_counter()
+    spec = get_summary_kind(kind)
     now = now or datetime.now(timezone.utc)
-    window_start, window_end, summary_date = _summary_window(now)
+    window_start, window_end, summary_date, window_key = _summary_window(spec, now, window_start, window_end)
+    is_custom = window_key != SCHEDULED_WINDOW_KEY
+    # custom window면 Slack 문구 / AI payload의 기간 표현도 실제 window로
+    report_spec = spec.for_window(window_start, window_end) if is_custom else spec
 
     db_gen = get_db()
     db: Session = next(db_gen)
+    record: Optional[DailySummaryDelivery] = None
+    log_extra = {
+        "kind": spec.kind,
+        "channel": channel,
+        "summary_date": summary_date.isoformat(),
+        "window_key": window_key,
+    }
 
     try:
-        record, skip_reason = _begin_delivery_or_skip(
+        record, skip_reason = _claim_delivery(
             db,
-            kind="daily_ops",
+            kind=spec.kind,
+            channel=channel,
             summary_date=summary_date,
+            window_key=window_key,
             window_start=window_start,
             window_end=window_end,
         )
 
         if skip_reason:
+            logger.info("ops summary skipped", extra={**log_extra, "skip_reason": skip_reason})
             return {
+                "kind": spec.kind,
+                "channel": channel,
                 "delivered": False,
                 "skipped": True,
                 "skip_reason": skip_reason,
@@ -191,18 +284,44 @@ def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
         assert record is not None
 
         # 1) aggregate
-        daily_input = _collect_daily_summary_input_compat(db, window_start, window_end)
+        daily_input = collect_summary_input(db, window_start, window_end, kind=spec.kind)
+
+        # 2) trends: 예전 window를 다시 집계하지 않고 이전 snapshot 몇 개만 읽는다
+        #    custom window는 길이가 제각각이라 정기 실행 history와 비교하지 않는다
+        history = (
+            []
+            if is_custom
+            else load_previous_snapshots(db, kind=spec.kind, before=summary_date, channel=channel)
+        )
+        trends = compute_trends(build_snapshot(daily_input), history)
+
+        # 3) compose
+        report = compose_report(
+            daily_input,
+            spec=report_spec,
+            trend_lines=format_trend_lines(trends, spec),
+            trend_payload=trends_payload(trends),
+        )
 
-        # 2) compose
-        report = compose_report(daily_input)
+        # 4) AI (optional): background로 시작해두고 그 사이 deterministic 메시지를 만든다
+        pending_ai = submit_ai_insight(report.ai_payload, db=db)
+        message_kwargs: dict[str, Any] = dict(
+            title=spec.title,
+            summary_date=summary_date,
+            overall=report.overall_status,
+            highlights=report.highlights,
+            watch_list=report.watch_list,
+            trend_lines=report.trend_lines,
+        )
+        snapshot = build_snapshot(daily_input, report)
 
-        # 3) AI (optional)
         ai_text: Optional[str] = None
         ai_used = False
         ai_error_code: Optional[str] = None
         ai_error_detail: Optional[str] = None
 
-        ai_result = generate_ai_insight(report.ai_payload)
+        # deadline(ai_summary_deadline_sec)까지만 기다림 → 넘으면 AI 없이 제시간에 전송
+        ai_result = pending_ai.result()
         if ai_result.summary_text:
             ai_text = ai_result.summary_text
             ai_used = True
@@ -210,30 +329,25 @@ def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
             ai_error_code = ai_result.error_code
             ai_error_detail = ai_result.error_detail
 
-        # ✅ 상세는 콘솔 로그에만
+        # ✅ 상세는 로그에만 (DB에는 코드만)
         if ai_error_code:
+            one_line: Optional[str] = None
             if ai_error_detail:
-                # 길어도 괜찮게 1줄 요약해서 찍기
+                # 길어도 괜찮게 1줄 요약
                 one_line = " ".join(ai_error_detail.split())
                 if len(one_line) > 220:
                     one_line = one_line[:220] + "…"
-                print(f"AI insight error: {ai_error_code} ({one_line})")
-            else:
-                print(f"AI insight error: {ai_error_code}")
+            logger.warning(
+                "ai insight unavailable",
+                extra={**log_extra, "error_code": ai_error_code, "error_detail": one_line},
+            )
 
-        msg = _compose_slack_message(
-            summary_date=summary_date,
-            overall=report.overall_status,
-            highlights=report.highlights,
-            watch_list=report.watch_list,
-            ai_text=ai_text,
-            ai_error_code=ai_error_code,
-        )
+        msg = _compose_slack_message(**message_kwargs, ai_text=ai_text, ai_error_code=ai_error_code)
 
-        # 4) deliver
-        resp_text = post_to_slack(msg)  # "ok" 같은 응답
+        # 5) deliver
+        resp_text = post_to_slack(msg, channel=channel)  # "ok" 같은 응답
 
-        # 5) finalize (✅ DB에는 ai_error_code만)
+        # 6) finalize (✅ DB에는 ai_error_code만 + 다음 비교용 snapshot)
         _finalize_record(
             db,
             record,
@@ -242,9 +356,26 @@ def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
             used_ai=ai_used,
             ai_error=ai_error_code,
             slack_response=(resp_text or "")[:100],  # slack_response가 VARCHAR(100)이면 안전하게
+            snapshot=snapshot,
+            ai_prompt_chars=ai_result.prompt_chars,
+            ai_prompt_tokens=ai_result.prompt_tokens,
+        )
+
+        logger.info(
+            "ops summary delivered",
+            extra={
+                **log_extra,
+                "used_ai": ai_used,
+                "ai_cached": ai_result.cached,
+                "ai_prompt_tokens": ai_result.prompt_tokens,
+                "error_code": ai_error_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
         )
 
         return {
+            "kind": spec.kind,
+            "channel": channel,
             "delivered": True,
             "skipped": False,
             "skip_reason": None,
@@ -254,11 +385,20 @@ def run_daily_ops_summary(*, now: Optional[datetime] = None) -> dict:
         }
 
     except Exception:
+        logger.exception("ops summary failed", extra=log_extra)
         # 세션이 꼬였을 수 있어서 안전하게 롤백
         try:
             db.rollback()
         except Exception:
             pass
+        # claim을 바로 풀어서 다음 실행이 lease 만료를 기다리지 않게 (best-effort)
+        if record is not None:
+            try:
+                record.status = "failed"
+                record.lease_expires_at = None
+                db.commit()
+            except Exception:
+                db.rollback()
         raise
 
     finally:
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-import requests
-
 from sentinelops.core.config import settings
+from sentinelops.integrations.slack.client import get_slack_client
+
+DEFAULT_CHANNEL = "default"
+
+
+def _channel_webhooks() -> dict[str, str]:
+    raw = settings.slack_summary_webhooks.get_secret_value() if settings.slack_summary_webhooks else ""
+    out: dict[str, str] = {}
+    for part in raw.split(","):
+        name, sep, url = part.partition("=")
+        if sep and name.strip() and url.strip():
+            out[name.strip()] = url.strip()
+    return out
 
 
-def post_to_slack(text: str) -> str:
+def resolve_webhook_url(channel: str = DEFAULT_CHANNEL) -> str:
     """
-    Slack Incoming Webhook으로 전송하고 응답 body(text)를 반환한다.
+    channel 이름 → webhook URL.
+    - SLACK_SUMMARY_WEBHOOKS에 있으면 그 값
+    - "default"는 SLACK_WEBHOOK_URL
     """
-    webhook = settings.slack_webhook_url
-    webhook_url = webhook.get_secret_value() if webhook else None
-    if not webhook_url:
+    url = _channel_webhooks().get(channel)
+    if url:
+        return url
+    if channel == DEFAULT_CHANNEL:
+        webhook = settings.slack_webhook_url
+        if webhook and webhook.get_secret_value():
+            return webhook.get_secret_value()
         raise RuntimeError("SLACK_WEBHOOK_URL is not set")
+    raise RuntimeError(f"no webhook configured for summary channel '{channel}' (SLACK_SUMMARY_WEBHOOKS)")
 
-    resp = requests.post(webhook_url, json={"text": text}, timeout=10)
-    if resp.status_code >= 400:
-        raise RuntimeError(f"Slack webhook failed: {resp.status_code} {resp.text}")
 
-    return (resp.text or "").strip()
+def post_to_slack(text: str, *, channel: str = DEFAULT_CHANNEL) -> str:
+    """
+    Slack Incoming Webhook으로 전송하고 응답 body(text)를 반환한다.
+    (공용 client: keep-alive + webhook별 rate limit + Retry-After 재시도, 실패 시 SlackDeliveryError)
+    """
+    resp = get_slack_client().post(resolve_webhook_url(channel), {"text": text}, target="summary")
+    return resp.text
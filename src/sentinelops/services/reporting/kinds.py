@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+
+
+@dataclass(frozen=True)
+class SummaryKind:
+    """
+    요약 리포트 종류별 설정 (window 길이 / 표시 문구).
+    - kind: daily_summary_deliveries.kind 값이기도 함 (idempotency key)
+    """
+    kind: str
+    title: str           # Slack 제목
+    period_label: str    # 문장 안에서 쓰는 기간 표현
+    window_key: str      # AI payload의 summary_window
+    window: timedelta
+    period_noun: str     # trend 문구용 ("7-day avg")
+
+    def for_window(self, window_start: datetime, window_end: datetime) -> SummaryKind:
+        """
+        --from/--to custom window용: 고정 문구("the last 24 hours") 대신 실제 window로 만든
+        period_label / window_key를 쓰는 사본.
+        """
+        return replace(
+            self,
+            period_label=f"the window {custom_period_label(window_start, window_end)}",
+            window_key=custom_window_key(window_start, window_end),
+            window=window_end - window_start,
+        )
+
+
+def custom_window_key(window_start: datetime, window_end: datetime) -> str:
+    """custom window의 key (UTC, 분 단위). 예: "20261019T0100Z-20261019T0903Z" """
+    start, end = window_start.astimezone(timezone.utc), window_end.astimezone(timezone.utc)
+    return f"{start:%Y%m%dT%H%MZ}-{end:%Y%m%dT%H%MZ}"
+
+
+def custom_period_label(window_start: datetime, window_end: datetime) -> str:
+    """사람이 읽는 window 표현. 예: "2026-10-19 01:00–09:03 UTC" """
+    start, end = window_start.astimezone(timezone.utc), window_end.astimezone(timezone.utc)
+    if start.date() == end.date():
+        return f"{start:%Y-%m-%d %H:%M}–{end:%H:%M} UTC"
+    return f"{start:%Y-%m-%d %H:%M} – {end:%Y-%m-%d %H:%M} UTC"
+
+
+SUMMARY_KINDS: dict[str, SummaryKind] = {
+    "daily_ops": SummaryKind(
+        kind="daily_ops",
+        title="Daily Ops Summary",
+        period_label="the last 24 hours",
+        window_key="last_24_hours",
+        window=timedelta(hours=24),
+        period_noun="day",
+    ),
+    "weekly_ops": SummaryKind(
+        kind="weekly_ops",
+        title="Weekly Ops Summary",
+        period_label="the last 7 days",
+        window_key="last_7_days",
+        window=timedelta(days=7),
+        period_noun="week",
+    ),
+    "monthly_ops": SummaryKind(
+        kind="monthly_ops",
+        title="Monthly Ops Summary",
+        period_label="the last 30 days",
+        window_key="last_30_days",
+        window=timedelta(days=30),
+        period_noun="month",
+    ),
+}
+
+
+def get_summary_kind(kind: str) -> SummaryKind:
+    try:
+        return SUMMARY_KINDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown summary kind: {kind} (expected one of {sorted(SUMMARY_KINDS)})") from None
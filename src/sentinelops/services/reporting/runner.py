@@ -0,0 +1,99 @@
+"""
+Summary job runner (kind × window × channel fan-out)
+
+- job마다 run_ops_summary()를 bounded thread pool에서 동시에 실행
+  (aggregate / AI / Slack 대기가 job끼리 줄 서지 않음)
+- 중복 전송 방지는 DailySummaryDelivery claim(FOR UPDATE SKIP LOCKED + lease)이 담당하므로
+  같은 job 목록으로 worker(process/host)를 여러 개 띄워도 안전하다
+- job 하나가 실패해도 나머지는 계속 진행, 결과는 입력 순서대로 반환
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from sentinelops.core.config import settings
+from sentinelops.services.reporting.daily_summary import run_ops_summary
+from sentinelops.services.reporting.delivery.slack import DEFAULT_CHANNEL
+from sentinelops.services.reporting.kinds import get_summary_kind
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SummaryJob:
+    kind: str
+    channel: str = DEFAULT_CHANNEL
+    window_start: Optional[datetime] = None
+    window_end: Optional[datetime] = None
+
+
+def parse_summary_job(spec: str) -> SummaryJob:
+    """CLI용: "daily_ops" / "daily_ops:finance" """
+    kind, _, channel = spec.partition(":")
+    get_summary_kind(kind.strip())  # 모르는 kind면 여기서 ValueError
+    return SummaryJob(kind=kind.strip(), channel=channel.strip() or DEFAULT_CHANNEL)
+
+
+def _run_job(job: SummaryJob, now: datetime) -> dict:
+    try:
+        return run_ops_summary(
+            job.kind,
+            channel=job.channel,
+            now=now,
+            window_start=job.window_start,
+            window_end=job.window_end,
+        )
+    except Exception as e:
+        # 상세는 run_ops_summary가 이미 logger.exception으로 남김
+        return {
+            "kind": job.kind,
+            "channel": job.channel,
+            "delivered": False,
+            "skipped": False,
+            "skip_reason": None,
+            "used_ai": False,
+            "ai_error": None,
+            "error": f"{type(e).__name__}: {e}",
+            "message_preview": "",
+        }
+
+
+def run_summary_jobs(
+    jobs: list[SummaryJob],
+    *,
+    max_workers: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> list[dict]:
+    """
+    jobs를 최대 max_workers(기본 SUMMARY_MAX_WORKERS)개씩 동시에 실행한다.
+    - now는 모든 job이 공유 → 같은 실행의 기본 window가 job마다 어긋나지 않음
+    - job마다 DB session 1개를 잡으므로 worker 수는 DB pool 크기 안에서 잡는다
+    """
+    if not jobs:
+        return []
+
+    now = now or datetime.now(timezone.utc)
+    workers = max(1, min(max_workers or settings.summary_max_workers, len(jobs)))
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summary") as pool:
+        results = list(pool.map(lambda job: _run_job(job, now), jobs))
+
+    logger.info(
+        "summary jobs finished",
+        extra={
+            "jobs": len(jobs),
+            "workers": workers,
+            "delivered": sum(1 for r in results if r.get("delivered")),
+            "skipped": sum(1 for r in results if r.get("skipped")),
+            "failed": sum(1 for r in results if r.get("error")),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+    )
+    return results
@@ -0,0 +1,205 @@
+"""
+Summary snapshots + trend 비교
+
+- 전송한 summary마다 DailySummaryInput / ComposedReport 핵심 값을 JSONB(snapshot)로 저장
+- 다음 summary는 예전 window를 다시 집계하지 않고,
+  같은 kind의 최근 snapshot 몇 개(작은 row)만 읽어서 delta를 만든다.
+  예) "Failed payment events: 14 (+40% vs 7-day avg)"
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinelops.models.daily_summary_delivery import SCHEDULED_WINDOW_KEY, DailySummaryDelivery
+
+from .aggregation import DailySummaryInput
+from .compose import ComposedReport
+from .kinds import SummaryKind
+
+SNAPSHOT_VERSION = 1
+DEFAULT_HISTORY = 7
+
+# 너무 작은 변화는 Slack에 올리지 않는다
+MIN_CHANGE_PERCENT = 20.0
+MIN_ABS_CHANGE = 3
+
+# (snapshot key, 표시 이름)
+TREND_METRICS: tuple[tuple[str, str], ...] = (
+    ("total_events", "Total events"),
+    ("failed_payment_events", "Failed payment events"),
+    ("invalid_event_rate_percent", "Invalid event rate"),
+    ("anomalies_detected", "Anomalies detected"),
+    ("open_anomalies_count", "Open anomalies"),
+    ("incidents", "Incidents"),
+)
+
+
+@dataclass(frozen=True)
+class TrendDelta:
+    metric: str
+    label: str
+    current: float
+    previous: Optional[float]       # 직전 snapshot
+    average: Optional[float]        # 최근 N개 평균
+    history_count: int
+    change_vs_avg_percent: Optional[float]
+
+
+# -------------------------
+# Snapshot
+# -------------------------
+
+def build_snapshot(summary_input: DailySummaryInput, report: Optional[ComposedReport] = None) -> dict[str, Any]:
+    metrics = summary_input.metrics
+    snapshot: dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "kind": summary_input.kind,
+        "window_start": summary_input.window_start.isoformat(),
+        "window_end": summary_input.window_end.isoformat(),
+        "metrics": {
+            "total_events": metrics.total_events,
+            "invalid_event_rate_percent": metrics.failure_rate_percent,
+            "failed_payment_events": metrics.failed_payment_events,
+            "anomalies_detected": sum(s.hit_count for s in summary_input.signals),
+            "open_anomalies_count": summary_input.open_anomalies_count,
+            "incidents": len(summary_input.incidents),
+        },
+        "signals": [
+            {"rule_code": s.rule_code, "severity": s.severity, "hit_count": s.hit_count}
+            for s in summary_input.signals
+        ],
+        "top_event_types": [[t, c] for t, c in summary_input.top_event_types],
+    }
+    if report is not None:
+        snapshot["report"] = {
+            "overall_status": report.overall_status,
+            "highlights": report.highlights,
+            "watch_list": report.watch_list,
+        }
+    return snapshot
+
+
+def load_previous_snapshots(
+    db: Session,
+    *,
+    kind: str,
+    before: date,
+    channel: str = "default",
+    limit: int = DEFAULT_HISTORY,
+) -> list[dict[str, Any]]:
+    """
+    같은 kind/channel의 정기 실행 snapshot (최신순). custom window(--from/--to)는 제외.
+    (kind, summary_date, channel, window_key) unique index로 역순 스캔.
+    """
+    stmt = (
+        select(DailySummaryDelivery.snapshot)
+        .where(
+            DailySummaryDelivery.kind == kind,
+            DailySummaryDelivery.summary_date < before,
+            DailySummaryDelivery.channel == channel,
+            DailySummaryDelivery.window_key == SCHEDULED_WINDOW_KEY,
+            DailySummaryDelivery.snapshot.is_not(None),
+        )
+        .order_by(DailySummaryDelivery.summary_date.desc())
+        .limit(limit)
+    )
+    return [s for s in db.execute(stmt).scalars().all() if isinstance(s, dict)]
+
+
+# -------------------------
+# Trends
+# -------------------------
+
+def compute_trends(current: dict[str, Any], history: list[dict[str, Any]]) -> list[TrendDelta]:
+    """
+    current / history 모두 build_snapshot() 형태. history는 최신순.
+    """
+    out: list[TrendDelta] = []
+    cur_metrics = current.get("metrics") or {}
+
+    for key, label in TREND_METRICS:
+        cur = cur_metrics.get(key)
+        if cur is None:
+            continue
+        past = [
+            float(v)
+            for v in ((h.get("metrics") or {}).get(key) for h in history)
+            if v is not None
+        ]
+        previous = past[0] if past else None
+        average = round(sum(past) / len(past), 2) if past else None
+        change = (
+            round((float(cur) - average) / average * 100, 1)
+            if average not in (None, 0)
+            else None
+        )
+        out.append(
+            TrendDelta(
+                metric=key,
+                label=label,
+                current=float(cur),
+                previous=previous,
+                average=average,
+                history_count=len(past),
+                change_vs_avg_percent=change,
+            )
+        )
+    return out
+
+
+def _fmt(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else f"{v:.2f}"
+
+
+def _is_notable(t: TrendDelta) -> bool:
+    if t.average is None:
+        return False
+    diff = abs(t.current - t.average)
+    if t.metric == "invalid_event_rate_percent":
+        # 비율 지표는 %p 차이로 판단
+        return diff >= 1.0
+    if t.change_vs_avg_percent is None:
+        # 평균 0 → 새로 생긴 경우만
+        return t.current >= MIN_ABS_CHANGE
+    return abs(t.change_vs_avg_percent) >= MIN_CHANGE_PERCENT and diff >= MIN_ABS_CHANGE
+
+
+def format_trend_lines(trends: list[TrendDelta], spec: SummaryKind, *, limit: int = 3) -> list[str]:
+    """
+    눈에 띄는 변화만 한 줄씩 (변화 폭 큰 순, 최대 limit개).
+    """
+    notable = [t for t in trends if _is_notable(t)]
+    notable.sort(key=lambda t: abs(t.change_vs_avg_percent or 100.0), reverse=True)
+
+    lines: list[str] = []
+    for t in notable[:limit]:
+        basis = f"{t.history_count}-{spec.period_noun} avg" if t.history_count > 1 else f"previous {spec.period_noun}"
+        if t.metric == "invalid_event_rate_percent":
+            delta = t.current - (t.average or 0.0)
+            lines.append(f"{t.label}: {_fmt(t.current)}% ({delta:+.2f}pp vs {basis})")
+        elif t.change_vs_avg_percent is None:
+            lines.append(f"{t.label}: {_fmt(t.current)} (was 0 over {basis})")
+        else:
+            lines.append(f"{t.label}: {_fmt(t.current)} ({t.change_vs_avg_percent:+.0f}% vs {basis})")
+    return lines
+
+
+def trends_payload(trends: list[TrendDelta]) -> list[dict[str, Any]]:
+    """AI payload용 (계산은 여기서 끝내고 숫자만 넘긴다)"""
+    return [
+        {
+            "metric": t.metric,
+            "current": t.current,
+            "average": t.average,
+            "history_count": t.history_count,
+            "change_vs_avg_percent": t.change_vs_avg_percent,
+        }
+        for t in trends
+        if t.average is not None
+    ]
@@ -0,0 +1,175 @@
+"""
+Rule 실행 비용 측정 (profiling + cost accounting)
+
+- 룰 실행 중에만 ContextVar에 RuleRunStats를 올려두고,
+  engine의 cursor event hook이 statement 수 / DB 시간 / rowcount를 누적한다.
+- 룰 밖(API 요청 등)에서는 hook이 ContextVar 조회 후 바로 return → 오버헤드 거의 없음
+- 결과는 rule_runs 테이블에 남겨서 느린 룰 / 인덱스 추가 전후 회귀를 비교한다.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from sentinelops.db.session import engine
+from sentinelops.models.rule_run import RuleRun
+
+
+@dataclass
+class RuleRunStats:
+    rule_code: str
+    wall_ms: float = 0.0
+    db_ms: float = 0.0
+    statement_count: int = 0
+    rows_scanned: int = 0
+    anomalies_created: int = 0
+
+
+_current_run: ContextVar[Optional[RuleRunStats]] = ContextVar("current_rule_run", default=None)
+
+
+# -------------------------
+# SQLAlchemy event hooks
+# -------------------------
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_run.get() is None:
+        return
+    conn.info.setdefault("rule_run_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_run.get()
+    if stats is None:
+        return
+
+    starts = conn.info.get("rule_run_query_start")
+    if starts:
+        stats.db_ms += (time.perf_counter() - starts.pop()) * 1000
+
+    stats.statement_count += 1
+    # rowcount: SELECT면 반환 row 수, DML이면 변경 row 수 (-1이면 드라이버가 모름)
+    if cursor.rowcount and cursor.rowcount > 0:
+        stats.rows_scanned += cursor.rowcount
+
+
+# -------------------------
+# Public API
+# -------------------------
+
+@contextmanager
+def profile_rule_run(rule_code: str) -> Iterator[RuleRunStats]:
+    stats = RuleRunStats(rule_code=rule_code)
+    token = _current_run.set(stats)
+    started = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.wall_ms = round((time.perf_counter() - started) * 1000, 2)
+        stats.db_ms = round(stats.db_ms, 2)
+        _current_run.reset(token)
+
+
+def record_anomaly_created() -> None:
+    stats = _current_run.get()
+    if stats is not None:
+        stats.anomalies_created += 1
+
+
+def save_rule_run(
+    db: Session,
+    stats: RuleRunStats,
+    *,
+    status: str,
+    started_at: datetime,
+    error: Optional[str] = None,
+) -> None:
+    """
+    측정 결과 저장. 저장 실패가 룰 실행 결과를 깨면 안 되므로 예외는 삼킨다.
+    """
+    try:
+        db.add(
+            RuleRun(
+                rule_code=stats.rule_code,
+                status=status,
+                started_at=started_at,
+                wall_ms=stats.wall_ms,
+                db_ms=stats.db_ms,
+                statement_count=stats.statement_count,
+                rows_scanned=stats.rows_scanned,
+                anomalies_created=stats.anomalies_created,
+                error=error,
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+
+
+def list_rule_runs(
+    db: Session,
+    *,
+    rule_code: str | None = None,
+    status: str | None = None,
+    limit: int = 50,
+) -> list[RuleRun]:
+    stmt = select(RuleRun)
+    if rule_code:
+        stmt = stmt.where(RuleRun.rule_code == rule_code)
+    if status:
+        stmt = stmt.where(RuleRun.status == status)
+    stmt = stmt.order_by(RuleRun.started_at.desc()).limit(limit)
+    return list(db.execute(stmt).scalars().all())
+
+
+def summarize_rule_runs(db: Session, *, since_hours: int = 24) -> list[dict[str, Any]]:
+    """
+    최근 since_hours 동안 rule_code별 비용 요약 (느린 룰이 위로).
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+
+    stmt = (
+        select(
+            RuleRun.rule_code,
+            func.count().label("runs"),
+            func.count().filter(RuleRun.status != "ok").label("error_runs"),
+            func.avg(RuleRun.wall_ms).label("avg_wall_ms"),
+            func.percentile_cont(0.95).within_group(RuleRun.wall_ms).label("p95_wall_ms"),
+            func.max(RuleRun.wall_ms).label("max_wall_ms"),
+            func.avg(RuleRun.db_ms).label("avg_db_ms"),
+            func.avg(RuleRun.statement_count).label("avg_statements"),
+            func.avg(RuleRun.rows_scanned).label("avg_rows_scanned"),
+            func.sum(RuleRun.anomalies_created).label("anomalies_created"),
+        )
+        .where(RuleRun.started_at >= since)
+        .group_by(RuleRun.rule_code)
+        .order_by(func.avg(RuleRun.wall_ms).desc())
+    )
+
+    out: list[dict[str, Any]] = []
+    for row in db.execute(stmt).mappings():
+        out.append(
+            {
+                "rule_code": row["rule_code"],
+                "runs": int(row["runs"]),
+                "error_runs": int(row["error_runs"]),
+                "avg_wall_ms": round(float(row["avg_wall_ms"]), 2),
+                "p95_wall_ms": round(float(row["p95_wall_ms"]), 2),
+                "max_wall_ms": round(float(row["max_wall_ms"]), 2),
+                "avg_db_ms": round(float(row["avg_db_ms"]), 2),
+                "avg_statements": round(float(row["avg_statements"]), 2),
+                "avg_rows_scanned": round(float(row["avg_rows_scanned"]), 2),
+                "anomalies_created": int(row["anomalies_created"] or 0),
+            }
+        )
+    return out
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from sqlalchemy import BigInteger, DateTime, Integer, cast, event, func, literal, update
 from sqlalchemy.orm import Session
 
 from sentinelops.core.anomaly_rules import RULES
+from sentinelops.core.config import settings
+from sentinelops.core.metrics import RULE_RUN_DURATION
+from sentinelops.core.stripe_events import FAILURE_EVENT_TYPES
+from sentinelops.db.session import SessionLocal
 from sentinelops.models.anomaly import Anomaly
 from sentinelops.models.event import Event
+from sentinelops.services.anomaly_changes import record_anomaly_change
+from sentinelops.services.incidents import attach_to_incident, extend_incident
 from sentinelops.services.notifications.slack import send_slack_message
 from sentinelops.services.notifications.templates import anomaly_to_slack_text
+from sentinelops.services.rule_runs import (
+    RuleRunStats,
+    profile_rule_run,
+    record_anomaly_created,
+    save_rule_run,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # -----------------------------
@@ -42,18 +61,66 @@ def _find_existing_open_anomaly(
     window_start: Optional[datetime],
     window_end: Optional[datetime],
 ) -> Optional[Anomaly]:
+    # window를 덮는(연장된 row 포함) open anomaly가 있으면 그걸로 충분
     q = (
         db.query(Anomaly)
         .filter(Anomaly.rule_code == rule_code)
         .filter(Anomaly.status == "open")
     )
     if window_start is not None:
-        q = q.filter(Anomaly.window_start == window_start)
+        q = q.filter(Anomaly.window_start <= window_start)
     if window_end is not None:
-        q = q.filter(Anomaly.window_end == window_end)
+        q = q.filter(Anomaly.window_end >= window_end)
     return q.first()
 
 
+def _extend_open_anomaly(
+    db: Session,
+    *,
+    rule,
+    window_start: datetime,
+    window_end: datetime,
+    evidence: dict[str, Any],
+    now: datetime,
+) -> Optional[tuple[int, Optional[int]]]:
+    """
+    같은 rule의 open anomaly가 바로 앞 window에서 끝났으면(window_end == 이번 window_start)
+    새 row 대신 UPDATE 1번으로 window_end 연장 + evidence counter 누적.
+    반환: (anomaly_id, incident_id) 또는 연장할 row가 없으면 None. commit은 호출자.
+    """
+    merged = {
+        key: func.coalesce(Anomaly.evidence[key].astext.cast(BigInteger), 0) + int(evidence.get(key) or 0)
+        for key in rule.extend_counters
+    }
+    merged["extended_windows"] = func.coalesce(Anomaly.evidence["extended_windows"].astext.cast(BigInteger), 0) + 1
+    # 연장된 row의 실제 범위 (원래 window 길이 그대로 두면 evidence가 틀려짐)
+    merged["window_minutes"] = cast(
+        func.extract("epoch", literal(window_end, DateTime(timezone=True)) - Anomaly.window_start) / 60,
+        Integer,
+    )
+    merged["last_window_start"] = window_start.isoformat()
+
+    stmt = (
+        update(Anomaly)
+        .where(
+            Anomaly.rule_code == rule.code,
+            Anomaly.status == "open",
+            Anomaly.window_end == window_start,
+        )
+        .values(
+            window_end=window_end,
+            evidence=Anomaly.evidence.op("||")(
+                func.jsonb_build_object(*[arg for key, value in merged.items() for arg in (key, value)])
+            ),
+            updated_at=now,
+        )
+        .returning(Anomaly.id, Anomaly.incident_id)
+        .execution_options(synchronize_session=False)
+    )
+    row = db.execute(stmt).first()
+    return (row.id, row.incident_id) if row is not None else None
+
+
 def _create_open_anomaly(
     db: Session,
     *,
@@ -64,7 +131,11 @@ def _create_open_anomaly(
     window_start: Optional[datetime],
     window_end: Optional[datetime],
     evidence: dict[str, Any],
-) -> Anomaly:
+) -> tuple[Anomaly, bool]:
+    """
+    anomaly insert + incident attach를 한 트랜잭션으로.
+    반환: (anomaly, 새 incident를 열었는지)
+    """
     anomaly = Anomaly(
         rule_code=rule_code,
         severity=severity,
@@ -77,9 +148,13 @@ def _create_open_anomaly(
     )
 
     db.add(anomaly)
+    db.flush()  # id 확보 (notify payload)
+    _, new_incident = attach_to_incident(db, anomaly)
+    record_anomaly_change(db, change="created", ids=[anomaly.id], status="open", rule_code=rule_code)
     db.commit()
     db.refresh(anomaly)
-    return anomaly
+    record_anomaly_created()
+    return anomaly, new_incident
 
 
 def _create_once_and_notify(
@@ -91,16 +166,44 @@ def _create_once_and_notify(
     evidence: dict[str, Any],
     now: datetime,
 ):
-    # ✅ 중복 방지: 같은 rule_code + 같은 window + open 존재하면 스킵
+    # ✅ 중복 방지: 같은 rule_code + 이 window를 덮는 open anomaly가 있으면 스킵
     existing = _find_existing_open_anomaly(
         db, rule_code=rule_code, window_start=window_start, window_end=window_end
     )
     if existing:
-        print(f"Anomaly already exists: {rule_code} (id={existing.id})")
+        logger.info("anomaly already exists", extra={"rule_code": rule_code, "anomaly_id": existing.id})
         return
 
     rule = _rule_by_code(rule_code)
-    anomaly = _create_open_anomaly(
+
+    # ✅ 바로 이어지는 window면 기존 row 연장 (row / 알림은 지속 시간이 아니라 건수에 비례)
+    if settings.anomaly_extend_open and window_start is not None and window_end is not None:
+        extended = _extend_open_anomaly(
+            db,
+            rule=rule,
+            window_start=window_start,
+            window_end=window_end,
+            evidence=evidence,
+            now=now,
+        )
+        if extended is not None:
+            anomaly_id, incident_id = extended
+            if incident_id is not None:
+                extend_incident(db, incident_id, window_end=window_end, detected_at=now)
+            record_anomaly_change(db, change="extended", ids=[anomaly_id], status="open", rule_code=rule_code)
+            db.commit()
+            logger.info(
+                "anomaly extended",
+                extra={
+                    "rule_code": rule_code,
+                    "anomaly_id": anomaly_id,
+                    "incident_id": incident_id,
+                    "window_end": window_end.isoformat(),
+                },
+            )
+            return
+
+    anomaly, new_incident = _create_open_anomaly(
         db,
         rule_code=rule.code,
         title=rule.title,
@@ -111,9 +214,19 @@ def _create_once_and_notify(
         evidence=evidence,
     )
 
-    # side effect
-    send_slack_message(anomaly_to_slack_text(anomaly))
-    print(f"Anomaly created: {rule_code} (id={anomaly.id})")
+    # side effect: 알림은 incident 단위로 1번 (이미 열린 incident에 붙으면 조용히)
+    if new_incident:
+        send_slack_message(anomaly_to_slack_text(anomaly))
+    logger.info(
+        "anomaly created",
+        extra={
+            "rule_code": rule_code,
+            "anomaly_id": anomaly.id,
+            "severity": anomaly.severity,
+            "incident_id": anomaly.incident_id,
+            "new_incident": new_incident,
+        },
+    )
 
 
 # -----------------------------
@@ -125,20 +238,21 @@ def run_webhook_integrity_rule(db: Session) -> None:
     window_start = floor_to_30min(now)
     window_end = window_start + timedelta(minutes=30)
 
-    invalid_events = (
+    invalid_q = (
         db.query(Event)
         .filter(Event.status == "invalid")
         .filter(Event.created_at >= window_start)
         .filter(Event.created_at < window_end)
-        .order_by(Event.created_at.desc())
-        .limit(5)
-        .all()
     )
+    # sample은 최근 5개만, count는 window 전체 (open anomaly 연장 시 window끼리 더해지는 값)
+    invalid_events = invalid_q.order_by(Event.created_at.desc()).limit(5).all()
 
     if not invalid_events:
-        print("No invalid events found.")
+        logger.info("no invalid events", extra={"rule_code": "webhook_integrity", "rate_limited": True})
         return
 
+    invalid_count = invalid_q.count() if len(invalid_events) == 5 else len(invalid_events)
+
     _create_once_and_notify(
         db,
         rule_code="webhook_integrity",
@@ -146,7 +260,7 @@ def run_webhook_integrity_rule(db: Session) -> None:
         window_end=window_end,
         now=now,
         evidence={
-            "invalid_event_count": len(invalid_events),
+            "invalid_event_count": invalid_count,
             "sample_event_ids": [e.id for e in invalid_events],
         },
     )
@@ -161,7 +275,7 @@ def run_payment_failure_spike_rule(db: Session) -> None:
     failed_count = (
         db.query(Event)
         .filter(Event.status == "verified")
-        .filter(Event.event_type.in_(["payment_intent.payment_failed", "charge.failed"]))
+        .filter(Event.event_type.in_(FAILURE_EVENT_TYPES))
         .filter(Event.created_at >= window_start)
         .filter(Event.created_at < window_end)
         .count()
@@ -169,7 +283,15 @@ def run_payment_failure_spike_rule(db: Session) -> None:
 
     THRESHOLD = 3
     if failed_count < THRESHOLD:
-        print(f"No failure spike. failed_count={failed_count}")
+        logger.info(
+            "no failure spike",
+            extra={
+                "rule_code": "payment_failure_spike",
+                "failed_count": failed_count,
+                "threshold": THRESHOLD,
+                "rate_limited": True,
+            },
+        )
         return
 
     _create_once_and_notify(
@@ -195,7 +317,7 @@ def run_rapid_retry_failure_rule(db: Session) -> None:
     failed_count = (
         db.query(Event)
         .filter(Event.status == "verified")
-        .filter(Event.event_type.in_(["payment_intent.payment_failed", "charge.failed"]))
+        .filter(Event.event_type.in_(FAILURE_EVENT_TYPES))
         .filter(Event.created_at >= window_start)
         .filter(Event.created_at < window_end)
         .count()
@@ -203,7 +325,15 @@ def run_rapid_retry_failure_rule(db: Session) -> None:
 
     THRESHOLD = 2  # 5분 안에 2번이면 즉시 대응 신호
     if failed_count < THRESHOLD:
-        print(f"No rapid retry failure. failed_count={failed_count}")
+        logger.info(
+            "no rapid retry failure",
+            extra={
+                "rule_code": "rapid_retry_failure",
+                "failed_count": failed_count,
+                "threshold": THRESHOLD,
+                "rate_limited": True,
+            },
+        )
         return
 
     _create_once_and_notify(
@@ -225,3 +355,142 @@ def run_all_rules(db: Session) -> None:
     run_webhook_integrity_rule(db)
     run_payment_failure_spike_rule(db)
     run_rapid_retry_failure_rule(db)
+
+
+# -----------------------------
+# Parallel execution
+# -----------------------------
+RuleFn = Callable[[Session], None]
+
+# 서로 독립적인 룰만 등록한다. 각 룰은 자기 세션에서 따로 실행된다.
+RULE_RUNNERS: list[tuple[str, RuleFn]] = [
+    ("webhook_integrity", run_webhook_integrity_rule),
+    ("payment_failure_spike", run_payment_failure_spike_rule),
+    ("rapid_retry_failure", run_rapid_retry_failure_rule),
+]
+
+
+@dataclass(frozen=True)
+class RuleRunOutcome:
+    rule_code: str
+    status: str  # "ok" | "error" | "timeout"
+    duration_ms: float
+    error: Optional[str] = None
+    stats: Optional[RuleRunStats] = None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _apply_statement_timeout(db: Session, timeout_sec: int) -> None:
+    """
+    룰 하나가 DB에서 무한정 붙잡혀 있지 않도록 statement_timeout을 건다.
+    - SET LOCAL은 트랜잭션 범위라 pool로 돌아간 커넥션에 설정이 남지 않음
+    - 룰 중간에 commit이 있어도 새 트랜잭션마다 다시 적용됨 (after_begin)
+    """
+    timeout_ms = int(timeout_sec * 1000)
+
+    @event.listens_for(db, "after_begin")
+    def _set_local_timeout(session, transaction, connection) -> None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+
+def _run_rule_isolated(rule_code: str, fn: RuleFn, *, timeout_sec: int) -> RuleRunOutcome:
+    # 에러 격리: 룰 하나가 실패해도 예외를 밖으로 던지지 않고 outcome으로 돌려준다.
+    started = time.perf_counter()
+    started_at = datetime.now(timezone.utc)
+    status = "ok"
+    error: Optional[str] = None
+
+    db = SessionLocal()
+    try:
+        _apply_statement_timeout(db, timeout_sec)
+        with profile_rule_run(rule_code) as stats:
+            try:
+                fn(db)
+            except Exception as e:
+                db.rollback()
+                status = "error"
+                error = f"{type(e).__name__}: {e}"
+
+        # 측정 구간 밖에서 저장 (저장 쿼리는 룰 비용에 포함하지 않음)
+        save_rule_run(db, stats, status=status, started_at=started_at, error=error)
+        RULE_RUN_DURATION.labels(rule_code, status).observe(stats.wall_ms / 1000)
+        logger.log(
+            logging.INFO if status == "ok" else logging.WARNING,
+            "rule run finished",
+            extra={
+                "rule_code": rule_code,
+                "status": status,
+                "duration_ms": stats.wall_ms,
+                "db_ms": stats.db_ms,
+                "statement_count": stats.statement_count,
+                "anomalies_created": stats.anomalies_created,
+                "error": error,
+            },
+        )
+        return RuleRunOutcome(
+            rule_code=rule_code,
+            status=status,
+            duration_ms=_elapsed_ms(started),
+            error=error,
+            stats=stats,
+        )
+    finally:
+        db.close()
+
+
+def run_all_rules_parallel(
+    *,
+    max_workers: Optional[int] = None,
+    timeout_sec: Optional[int] = None,
+) -> list[RuleRunOutcome]:
+    """
+    독립적인 룰들을 bounded thread pool에서 동시에 실행한다.
+    - 룰마다 SessionLocal()에서 자기 세션을 받는다 (Session은 thread-safe가 아님)
+    - per-rule timeout: DB에서는 statement_timeout으로 끊고,
+      runner는 (라운드 수 × timeout) 이상 기다리지 않는다
+    - 결과는 RULE_RUNNERS 순서대로 반환
+    """
+    timeout = timeout_sec or settings.rules_timeout_sec
+    workers = max(1, min(max_workers or settings.rules_max_workers, len(RULE_RUNNERS)))
+
+    # pool 대기 시간까지 고려한 cycle deadline
+    rounds = -(-len(RULE_RUNNERS) // workers)
+    started = time.perf_counter()
+    deadline = time.monotonic() + rounds * timeout
+
+    outcomes: dict[str, RuleRunOutcome] = {}
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rule")
+    try:
+        futures = [
+            pool.submit(_run_rule_isolated, code, fn, timeout_sec=timeout)
+            for code, fn in RULE_RUNNERS
+        ]
+        for fut in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+            outcome = fut.result()
+            outcomes[outcome.rule_code] = outcome
+    except TimeoutError:
+        pass
+    finally:
+        # 멈춘 룰 때문에 cycle 전체가 막히지 않게 기다리지 않고 종료
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results: list[RuleRunOutcome] = []
+    for code, _ in RULE_RUNNERS:
+        outcome = outcomes.get(code)
+        if outcome is None:
+            outcome = RuleRunOutcome(
+                rule_code=code,
+                status="timeout",
+                duration_ms=_elapsed_ms(started),
+                error=f"rule did not finish within {timeout}s",
+            )
+            RULE_RUN_DURATION.labels(code, "timeout").observe(outcome.duration_ms / 1000)
+            logger.warning(
+                "rule run timed out",
+                extra={"rule_code": code, "status": "timeout", "duration_ms": outcome.duration_ms},
+            )
+        results.append(outcome)
+    return results